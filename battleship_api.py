@@ -205,9 +205,19 @@ def run_bot(bot_class):
         print("ERROR: Usage: python3 bot.py <state.json>", file=sys.stderr)
         sys.exit(1)
     
+    # state.json by default; harnesses may instead send the binary wire format
+    # (battleship_wire.py), detected by its b"BSW" prefix (battleship_wire.MAGIC_PREFIX,
+    # spelled out so JSON runs never import that module) and answered in kind;
+    # battleship_wire checks the version byte that follows
+    wire = None
     try:
-        with open(sys.argv[1], 'r', encoding='utf-8') as f:
-            game_state = json.load(f)
+        with open(sys.argv[1], 'rb') as f:
+            data = f.read()
+        if data[:3] == b"BSW":
+            import battleship_wire as wire
+            game_state = wire.decode_state(data)
+        else:
+            game_state = json.loads(data.decode('utf-8'))
     except Exception as e:
         print(f"ERROR: Failed to load game state: {e}", file=sys.stderr)
         sys.exit(1)
@@ -230,7 +240,11 @@ def run_bot(bot_class):
             # Combat phase
             move = bot.combat_strategy(game_state)
         
-        print(json.dumps(move))
+        if wire is not None:
+            sys.stdout.buffer.write(wire.encode_move(move))
+            sys.stdout.buffer.flush()
+        else:
+            print(json.dumps(move))
         
     except Exception as e:
         print(f"ERROR: Bot strategy failed: {e}", file=sys.stderr)
@@ -17,10 +17,210 @@ Have fun!
 """
 
 import random
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Set, Tuple
-from battleship_api import BattleshipBotAPI, run_bot, ABILITY_CODES, BOARD_SIZE
+from battleship_api import BattleshipBotAPI, run_bot, ABILITY_CODES, BOARD_SIZE, SHIP_TYPES
+
+# !---------------- OPENING BOOK ----------------
+# The book itself is the generated OPENING_BOOK_ENTRIES block at the bottom of this file,
+# so it ships inside the single submitted .py (rewrite it with opening_book_builder.py).
+OPENING_BOOK_MAX_SIZE = 4096
+
+def _symmetry_maps() -> List[List[int]]:
+    """For each of the 8 board symmetries, map flat cell index -> transformed flat index."""
+    last = BOARD_SIZE - 1
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (last - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - c, last - r),
+    ]
+    maps = []
+    for transform in transforms:
+        mapping = [0] * (BOARD_SIZE * BOARD_SIZE)
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                new_r, new_c = transform(r, c)
+                mapping[r * BOARD_SIZE + c] = new_r * BOARD_SIZE + new_c
+        maps.append(mapping)
+    return maps
+
+_SYMMETRY_MAPS = _symmetry_maps()
+_SYMMETRY_INVERSES = []
+for _mapping in _SYMMETRY_MAPS:
+    _inverse = [0] * len(_mapping)
+    for _src, _dst in enumerate(_mapping):
+        _inverse[_dst] = _src
+    _SYMMETRY_INVERSES.append(_inverse)
+# transformed_grid[j] = grid[inverse[j]], so one itemgetter per symmetry builds each variant
+_SYMMETRY_GATHERS = [itemgetter(*inverse) for inverse in _SYMMETRY_INVERSES]
+
+class OpeningBook:
+    """
+    Bounded cache from opponent_grid positions to a precomputed best shot.
+
+    Positions are stored under their canonical form (the smallest of the 8
+    rotations/reflections), so every symmetric variant of a position shares one
+    entry. Moves are kept in the canonical frame and mapped back on lookup.
+    Eviction is least-recently-stored: at move time the book is read-only, so
+    recency only changes while opening_book_builder.py is storing new positions.
+    """
+
+    def __init__(self, max_size: int = OPENING_BOOK_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, opponent_grid: List[List[str]]) -> bool:
+        return self.canonicalize(opponent_grid)[0] in self._entries
+
+    @staticmethod
+    def canonicalize(opponent_grid: List[List[str]]) -> Tuple[str, int]:
+        """Return (canonical key, index of the symmetry that produces it)."""
+        flat = "".join("".join(row) for row in opponent_grid)
+        best_key, best_symmetry = "", 0
+        for symmetry, gather in enumerate(_SYMMETRY_GATHERS):
+            key = "".join(gather(flat))
+            if symmetry == 0 or key < best_key:
+                best_key, best_symmetry = key, symmetry
+        return best_key, best_symmetry
+
+    def lookup(self, opponent_grid: List[List[str]]) -> Optional[List[int]]:
+        """Return the book move for this position in its own frame, or None."""
+        key, symmetry = self.canonicalize(opponent_grid)
+        canonical_cell = self._entries.get(key)
+        if canonical_cell is None:
+            return None
+        cell = _SYMMETRY_INVERSES[symmetry][canonical_cell]
+        return [cell // BOARD_SIZE, cell % BOARD_SIZE]
+
+    def store(self, opponent_grid: List[List[str]], cell: List[int]) -> None:
+        """Record the best move for a position, evicting the least recently stored entry if full."""
+        key, symmetry = self.canonicalize(opponent_grid)
+        self._entries[key] = _SYMMETRY_MAPS[symmetry][cell[0] * BOARD_SIZE + cell[1]]
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def entries(self) -> List[List[Any]]:
+        """[canonical key, canonical cell] pairs, oldest first, as kept in OPENING_BOOK_ENTRIES."""
+        return [[key, cell] for key, cell in self._entries.items()]
+
+    @classmethod
+    def from_entries(cls, entries: Any, max_size: int = OPENING_BOOK_MAX_SIZE) -> "OpeningBook":
+        """Build a book from saved entries; anything malformed gives an empty book."""
+        book = cls(max_size)
+        cell_count = BOARD_SIZE * BOARD_SIZE
+        try:
+            for key, cell in entries:
+                if not (isinstance(key, str) and len(key) == cell_count and isinstance(cell, int) and 0 <= cell < cell_count):
+                    return cls(max_size)
+                book._entries[key] = cell
+        except (TypeError, ValueError):
+            return cls(max_size)
+        while len(book._entries) > book.max_size:
+            book._entries.popitem(last=False)
+        return book
+
+# !---------------- FLEET TABLE ----------------
+# The table itself is the generated FLEET_TABLE block at the bottom of this file,
+# so it ships inside the single submitted .py (rewrite it with fleet_layout_evaluator.py).
+
+class FleetTable:
+    """
+    Weighted table of full fleet layouts, sampled one placement at a time in constant time.
+
+    Each layout is a list of [ship_name, row, col, direction] in SHIP_TYPES order.
+    Since each placement call is a separate process, every call samples again
+    among the layouts that match the ships already on the board. prefixes maps
+    the key of those placed ships to [layout indices, alias_prob, alias_index],
+    an alias table (Vose's method) precomputed offline for that group.
+    """
+
+    def __init__(self, layouts: Optional[List[List[list]]] = None, prefixes: Optional[Dict[str, list]] = None):
+        self.layouts = layouts or []
+        self.prefixes = prefixes or {}
+
+    def __len__(self) -> int:
+        return len(self.layouts)
+
+    @staticmethod
+    def prefix_key(placed_ships: list) -> str:
+        """Order-independent key for the ships already placed, by name and cells."""
+        ships = sorted(placed_ships, key=lambda ship: str(ship.get("name", "")))
+        return "|".join(
+            ship.get("name", "") + ":" + ",".join(sorted(f"{r}{c}" for r, c in ship.get("coordinates", [])))
+            for ship in ships
+        )
+
+    @staticmethod
+    def build_alias(weights: List[float]) -> Tuple[List[float], List[int]]:
+        """Vose's alias method: O(n) setup for O(1) weighted sampling."""
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        alias_prob = [0.0] * n
+        alias_index = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            alias_prob[s] = scaled[s]
+            alias_index[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            alias_prob[i] = 1.0
+            alias_index[i] = i
+        return alias_prob, alias_index
+
+    def layout_for(self, placed_ships: list) -> Optional[List[list]]:
+        """Sample a layout consistent with the ships already placed, or None if there is none."""
+        group = self.prefixes.get(self.prefix_key(placed_ships))
+        if not group:
+            return None
+        indices, alias_prob, alias_index = group
+        i = random.randrange(len(indices))
+        if random.random() >= alias_prob[i]:
+            i = alias_index[i]
+        return self.layouts[indices[i]]
+
+    @classmethod
+    def from_data(cls, data: Any) -> "FleetTable":
+        """Build a table from FLEET_TABLE; anything malformed gives an empty table."""
+        try:
+            layouts = data["layouts"]
+            prefixes = data["prefixes"]
+            for layout in layouts:
+                for name, row, col, direction in layout:
+                    if not (name in SHIP_TYPES and isinstance(row, int) and isinstance(col, int) and direction in ('H', 'V')):
+                        return cls()
+            for key, (indices, alias_prob, alias_index) in prefixes.items():
+                if not (isinstance(key, str) and indices and len(indices) == len(alias_prob) == len(alias_index)):
+                    return cls()
+                if not all(isinstance(i, int) and 0 <= i < len(layouts) for i in indices):
+                    return cls()
+                if not all(isinstance(i, int) and 0 <= i < len(indices) for i in alias_index):
+                    return cls()
+                if not all(isinstance(p, (int, float)) for p in alias_prob):
+                    return cls()
+        except (TypeError, ValueError, KeyError, AttributeError):
+            return cls()
+        return cls(layouts, prefixes)
 
 class MyBattleshipBot(BattleshipBotAPI):
+    def __init__(self):
+        super().__init__()
+        self._opening_book = OpeningBook.from_entries(OPENING_BOOK_ENTRIES)
+        self._fleet_table = FleetTable.from_data(FLEET_TABLE)
+
     def ability_selection(self) -> list:
         """Choose 2 abilities for the entire game."""
         return ["SP", "RF"]  # Sonar Pulse and Hailstorm
@@ -28,6 +228,10 @@ class MyBattleshipBot(BattleshipBotAPI):
     def place_ship_strategy(self, ship_name: str, game_state: dict) -> dict:
         """Place a ship on your board."""
         placed_coords = self._get_placed_coordinates(game_state)
+        placement = self._get_table_placement(ship_name, placed_coords, game_state)
+        if placement:
+            return placement
+
         if ship_name in ('ship_1x2', 'ship_1x3'):
             placement = self._get_random_placement_small(ship_name, placed_coords, game_state)
         else: placement = self._get_random_placement(ship_name, placed_coords, game_state)
@@ -43,6 +247,26 @@ class MyBattleshipBot(BattleshipBotAPI):
             }
         }
     
+    def _get_table_placement(self, ship_name: str, placed_coords: Set[Tuple[int, int]], game_state: dict) -> Optional[Dict[str, Any]]:
+        """Place the ship where the evaluated fleet table says, if there is a matching layout."""
+        layout = self._fleet_table.layout_for(game_state.get("player_ships", []))
+        if not layout:
+            return None
+
+        for name, start_row, start_col, orientation in layout:
+            if name != ship_name:
+                continue
+            cells = self._get_ship_cells(ship_name, start_row, start_col, orientation)
+            if cells and self._is_valid_placement(cells, placed_coords):
+                return {
+                    "placement": {
+                        "name": ship_name,
+                        "cell": [start_row, start_col],
+                        "direction": orientation
+                    }
+                }
+        return None
+
     def _get_random_placement(self, ship_name: str, placed_coords: Set[Tuple[int, int]], game_state: dict) -> Optional[Dict[str, Any]]:
         """Generate random valid ship placement."""
         for _ in range(100):
@@ -148,9 +372,22 @@ class MyBattleshipBot(BattleshipBotAPI):
         
         # 1 random target if not using RF, 2 if using RF
         target = self._get_target_cell(opponent_grid) 
+
+        # nothing to chase: play the precomputed shot if this position is in the book
+        if not target:
+            book_cell = self._opening_book.lookup(opponent_grid)
+            if book_cell and opponent_grid[book_cell[0]][book_cell[1]] == 'N':
+                return {
+                    "combat": {
+                        "cell": book_cell,
+                        "ability": ability
+                    }
+                }
         
-        if "RF" in available_abilities:
-            RF_targets = self._get_target_cell(opponent_grid, RFability=True) 
+        RF_targets = self._get_target_cell(opponent_grid, RFability=True) if "RF" in available_abilities else []
+        if RF_targets:
+            # "cell" must still be a single [r, c]; RF fires at both of its targets
+            target = RF_targets[0]
             ability = {"RF": RF_targets}
         elif target:
             target = target[0]
@@ -238,5 +475,2011 @@ class MyBattleshipBot(BattleshipBotAPI):
         # RFability False: return one neighbour to preserve existing callers
         return targets[:1]
         
+# !---------------- GENERATED DATA ----------------
+# >>> BEGIN GENERATED: opening book (python3 opening_book_builder.py) - do not edit by hand
+OPENING_BOOK_ENTRIES: List[List[Any]] = [['NNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 34],
+ ['NNNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 37],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNNMNNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['HHHHMNNNHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNNMMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNN', 54],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMHHMNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMMMMNNNMHHHHMNNNMMMHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNN', 49],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNN', 32],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 33],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNN', 38],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNNNNNNNNN', 41],
+ ['NNMHMNNNNNMHMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMHMNNNNNMHHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNMHHHMNNNMHMMNNNNMHMNNNNNMHMNNNNNMHMNNNN', 14],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNHHHMNNNNHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMMMMNNNMHHHHMNNMHMMMNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMMMNNNNMHHHMNNNNMMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNN', 58],
+ ['NNMNNNNNNMHMMMNNNMHHHHMNNMHHHHMNNMHHHHMNNNMMMMNNNNNNNNNNNNNNNNNN', 54],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 38],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 37],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['MHHHHMNNHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNNMNNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNNNNNNNNN', 49],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 41],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNMHHHHMNNNMMMMNNNNNNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 37],
+ ['MHHMNNNNMHHMMMMNMHHHHHHMMHHMMMMNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 44],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 33],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNMMHMNNNNHHHMNNNNMMHMNNNNNNMNNNNNNNNNNNNN', 37],
+ ['NMHHHMNNNMHHHMNNNMHMMNNNNMHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNN', 46],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNN', 54],
+ ['NNNNNNNNNNNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNN', 54],
+ ['MHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 44],
+ ['NNMMMNNNNMHHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNN', 46],
+ ['NNMNNNNNNMHMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 37],
+ ['NNNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 42],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 50],
+ ['NNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 50],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNNNNNNNNNN', 53],
+ ['NNMNNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 50],
+ ['NMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNN', 53],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 22],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 21],
+ ['HHHHMNNNHHHHMNNNMMMHMNNNNNMHMMNNNNNMMHMNNNNNMHMNNNNNMHMNNNNNNMNN', 41],
+ ['NNMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNMNMHMNNNNNMHMNNNNNNMNNNNNNNNNN', 41],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 42],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 21],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNNMMMMNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 38],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNN', 24],
+ ['NMHHMMNNNMHHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNNNNNNNNNNNNNNNNNNNNNNN', 59],
+ ['NMHHMNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 22],
+ ['NMMMMNNNMHHHHMNNNMMMHMNNNNMHHMNNNNMHHMNNNNNMMNNNNHNNNNNNNNNNNNNN', 48],
+ ['NNNNNNNNNNNMNNNNNNMHMNNNNNMHMNNNNNMHMMNNNNNMNNNNNNNNNNNNNNNNNNNN', 54],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNMNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNN', 59],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNHNNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 41],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 38],
+ ['NNMNNNNNNMHMMNNNNMHMHMNNNMHMHMNNNMHHHHMNNNMMMMNNNNNNNNNNNNNNNNNN', 53],
+ ['NMMNNNNNMHHMNNNNNMHMNNNNNMHMMMNNNMHMHHMNNMHMHHMNNNMMHHMNNNNNMMNN', 5],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHMNNMNNMHMNNNNNNMNNNNNNNNNNNNN', 60],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNMNNNNNNMHMMMNNNMHHHHMNNMHHHHMNNMHMMMNNNNMMNNNNNNNNNNNNNNNNNNNN', 54],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMHHHHMNNNMMMHMNNHNNMHMNNNNNNMNNNNNNNNNN', 42],
+ ['NNMHMNNNNNMHMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNNNNNNNNNN', 59],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNNNNN', 46],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 44],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNN', 22],
+ ['NNMMMMNNNMHHHHMNNMMMMMNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMMNNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNHNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NMHMNNNNNMHHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNN', 22],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 38],
+ ['NMHHMNNNNMHHMNMNNMHHMNNNNMHHHMNNNMHMMNNNNMHMNNNNNMHMNNNNNMHMNNNN', 46],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNHHHMNNNNHHHMNNNNMMMNNNNNNNNNMNNNNNNNNNNN', 45],
+ ['MHHHMNNNMHHHMNNNMHHHMNNNMHMHMNNNNMMHMMNNNNMHMNNNNNNMNNNNNNNNNNNN', 22],
+ ['NNMMMMNNNMHHHHMNNMHMMMNNNMHMNNNNNMHMMMNNNNMHHHMNNNMHHHMNNNNMMMNN', 30],
+ ['MHHMMHMNNMHHHHMNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 60],
+ ['NMMMNNNNMHHHMNNNNMMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNMNNNNN', 40],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 42],
+ ['NNNMMNNNNNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNMNNNNNNMHMMMNNNMHHHHMNNMHHHHMNNMHHHHMNNNMMMMNNNNNNNNMNNNNNNNNN', 49],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNNHNNNNNNNNNNNNNNNNNN', 53],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNN', 30],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 42],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 44],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNMNNNNNNNNNNN', 45],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNN', 22],
+ ['MHHHHMNNHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNNNNNNNNNNNNN', 51],
+ ['NMHHHMNNMHHHHMNNMHMMMNNNMHHHHMNNNMMMMNNNNNNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNNMNNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNMNNNMNNNNNNNNNNNNN', 22],
+ ['NNNNNNNNNMNNMMNNNNNMHHMNNNNMHHMNNNMMHHMNNMHHHMNNNNMMMNNNNNNNNNNN', 24],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNHNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NMHMNNNNNMHMNNNNMHHMNNNNMHHMMMNNMHMMHHMNNMNMHHMNNNNMHHMNNNNNMMNN', 22],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNN', 49],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNMHHHHMNNNMMMMNNNNNNNNNNNNNMNNNNNNNNNNNN', 47],
+ ['NNMHHMNNNNMHHMNNMMMHHMNNHHHHMNNNMMMMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMHHHMNNNMHMMNNNNMHHMNNNNMHHMNNNNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNN', 30],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMHMNNNNNMHMNNNNNMHMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNN', 33],
+ ['NNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 50],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 44],
+ ['NMHMNNNNNMHMNNNNNMHMMMMMMHHHHHHHNMMMMHHHNNNNNMMMNNNNNNNNNNNNNNNN', 52],
+ ['MHHMNNNNMHHMMMMNMHHHHHHMMHHMMMMNNMMNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 51],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNN', 49],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNMNMNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 49],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNMMHMNNNNHHHMNMNNMMHMNNNNNNMNNNNNNNNNNNNN', 30],
+ ['NMHHHMNNNMHHHMNNNMHMMNNNNMHMNNNNMHHMNNNNMHHMNNMNNMMNNNNNNNNNNNNN', 53],
+ ['NNMHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 50],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNNMHMNNNNNMHMNNNNNMHMNMNNNNMNNNN', 38],
+ ['MHMNNNNNMHMNNNNNMHMMMMNNMHMHHHMNNMMHHHMNNNNMMMNNNNNNNNNNNNNNNNNN', 50],
+ ['NNMHMNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NMMMMNNNMHHHHMNNMHHHMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNNN', 46],
+ ['MHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 59],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHMMNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NMMMMNNNMHHHHMNNNMMMMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNMHHHMNNNNMMMNN', 33],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMHHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNN', 41],
+ ['NMHMMHMNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNNNMNNNN', 31],
+ ['NNMNNNNNNMHMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNNNN', 22],
+ ['MHHHHMNNMHHMMNNNMHHMMMNNNMHHHHMNNNMMMMNNNNNNMNNNNNNNNNNNNNNNNNNN', 47],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNN', 44],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHHMNNNMMMMNNNNNNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNNNNNNNNNNNN', 13],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNNNNNNNNNMNNNNMNNNNNNNNNNNNN', 30],
+ ['NNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNNNNNNNNNNNN', 53],
+ ['NMMHMNNNMHHHMNNNMHHHMNNNMHHHMMNNNMMMNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNNNNNNNNNN', 53],
+ ['NNNNNNNNNNNNNNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 33],
+ ['MHHMMHMNMHHMMHMNMHHHHHMNNMMMMHMNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNN', 50],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNNNNNN', 60],
+ ['NNMNNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNMNNNNNNNNNNNNMNNNNNNNNNNNNN', 53],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNN', 61],
+ ['NNMNNNNNNMHMNNNNNMHMNNMNNMHMNNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 51],
+ ['NNMNNNNNNMHMNNNNNMHMNHNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 22],
+ ['HHHHMNNNHHHHMNNNMMMHMNNNNNMHMMNNNNNMMHMNNMNNMHMNNNNNMHMNNNNNNMNN', 50],
+ ['MHMNNNNNMHHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNNNMMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNMNMHMNNHNNMHMNNNNNNMNNNNNNNNNN', 49],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNMNNNNNNNNNNNNNNNNNNNNN', 51],
+ ['NMHMNNNNNMHMNNNNNMHMNHNNNMHMNNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 22],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNNMMMMNNMNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNN', 31],
+ ['NMHHMMNNNMHHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNNNNNNNNNNNNNNNNNNHNNNN', 58],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMMNNNNMMNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 38],
+ ['NMHHMNNNNMHMNNNNNMHMNNHNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 21],
+ ['NNNNNNNNNMNNNNNNNNNMNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNN', 13],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNMNNNMHMNNNNNMHMNNNNNNMNNNNNMNNNN', 49],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNHNNNNNNNHNNNNNNNNNNNNNNNNNNNNNN', 25],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNHNNNNNNNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMNNNNNNMHMMNNNNMHMHMNNNMHMHMNNNMHHHHMNNNMMMMNNNNNNNMNNNNNNNNNN', 15],
+ ['NMMNNMNNMHHMNNNNNMHMNNNNNMHMMMNNNMHMHHMNNMHMHHMNNNMMHHMNNNNNMMNN', 22],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHMNNMNNMHMNNNNNNMNNNNNNNNNMNNN', 53],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 51],
+ ['MHMNNNNNMHMNNNNNNMNNMMNNNNMMMHMNNMHHHHMNNMHHHHMNNNMMMHMNNNNNNMNN', 13],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMHHHHMNNNMMMHMNNHHNMHMNNNNNNMNNNNNNNNNN', 43],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMMMNMMMMHHHMNNNNMMMNNNNNNNNNNNNNNNNN', 14],
+ ['NNMHMNNNNNMHMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNNNNNNNMNNNN', 39],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNMNNNNNNNNNN', 60],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNHNNNNNNNNNNNNNNNNNNN', 43],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNMNNNNNNNNNNNNNNHNNNNNNNNNNN', 51],
+ ['NMHMNNNNNMHMNNNNNMHMNNMNNMHMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNN', 29],
+ ['NNMMMMNNNMHHHHMNNMMMMMNNMHHHMNNNMHHHMNNNMHHMNNMNNMMNNNNNNNNNNNNN', 53],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMMNNNNNNNNMNNNNNNNNNNNNNNNNN', 52],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNHMNNNNNNNNNNNNNNNNN', 44],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNMNNNNNNNNNNNNNNNNN', 52],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNNMMMMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 38],
+ ['MHHMNNNNMHHMNMNNMHHMNNNNNMMMMNNNMHHHHMNNHHMMMNNNMMNNNNNNNNNNNNNN', 22],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NMHHMNNNNMHHMNMNNMHHMNNNNMHHHMNNNMHMMNNNNMHMNNMNNMHMNNNNNMHMNNNN', 53],
+ ['MHHHMNNNMHHHMNNNMHHHMNMNMHMHMNNNNMMHMMNNNNMHMNNNNNNMNNNNNNNNNNNN', 46],
+ ['NNMMMMNNNMHHHHMNNMHMMMNNNMHMNNMNNMHMMMNNNNMHHHMNNNMHHHMNNNNMMMNN', 49],
+ ['MHHMMHMNNMHHHHMNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNHNNN', 61],
+ ['NMMMNNNNMHHHMNNNNMMHMMNNNNMHHHMNNNMHHHMNMNNMHHMNNNNNMMNNNNMNNNNN', 49],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNMNNNNMNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMMNNMMMMNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 38],
+ ['NNNMMNNNNNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMMNNNNNNNNMNNNNNNNNNN', 60],
+ ['MHMNNNNNMHMNNNNNHHHMNNNNHHHMNMNNHHHMNNNNMMMMNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMNNNNNNMHMMMNNNMHHHHMNNMHHHHMNNMHHHHMNNNMMMMNNNMNNNNMNNNNNNNNN', 58],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNNHNNNNNNNHNNNNNNNNNN', 52],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNNN', 60],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMNNNNNNMHMMNNNNMHHHMNNNMHMMMNNNNMNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNMNNNNMNNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNN', 51],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNMNNNNNNNNNNN', 38],
+ ['MHHMMNNNHHHMHMNNHHHMHMNNMMMMHMNNNNNMHMNNNMNNMNNNNNNNNNNNNNNNNNNN', 50],
+ ['MHHHHMNNHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNMNNNNNNNNNNNN', 38],
+ ['NMHHHMNNMHHHHMNNMHMMMNNNMHHHHMNNNMMMMNNNNNNNMNNNNNNNNHNNNNNNNNNN', 52],
+ ['NMMNNNNNMHHMNNNNNMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNNNNNNNNNNNNNNN', 5],
+ ['NNNMNNNNNNMHMNNNNMHHMNMNNMHHMNNNNMHMNNNNNMHMNNMNNNMNNNNNNNNNNNNN', 53],
+ ['HHHHMNNNMMMMNMNNNNNNMHMNNNMMMHMNNMHHHHMNNMHHHMNNNNMMMNNNNNNNNNNN', 54],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNHNNNNNNNHNNNNNNNNNNNNNNNNN', 45],
+ ['NMHMNNNNNMHMNNNNMHHMNNMNMHHMMMNNMHMMHHMNNMNMHHMNNNNMHHMNNNNNMMNN', 13],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNN', 30],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMMHMNNNNNMHMNNNNNMHMNNMNNMHMNNNNNNMNN', 42],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 36],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNNNMNNNHNNNNNNNNNNNNNNNNNN', 53],
+ ['NNMNNNNNNNNNMMNNNNNMHHMNNNNMHHMNNMNMHHMNNNNMHHMNNNNNMMNNNNNNNNNN', 58],
+ ['NNMHHMNNNNMHHMNNMMMHHMNNHHHHMNNNMMMMNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NMHHHMNNNMHMMNNNNMHHMNNNNMHHMNHNNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNN', 22],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNMNNNNNNNNNNN', 38],
+ ['NNMHMNNNNNMHMNNNNNMHMMNNNNNMHHMNNHNMHHMNNNNMHHMNNNNNMMNNNNNNNNNN', 25],
+ ['NNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNNNNNNNNNNNN', 53],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNNNMMNNNNNNNNNNNNNNNNNNNN', 46],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNN', 30],
+ ['NMHMNNNNNMHMNNNNNMHMMMMMMHHHHHHHNMMMMHHHNNNNNMMMNNNNMNNNNNNNNNNN', 49],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['MHHMNNNNMHHMMMMNMHHHHHHMMHHMMMMNNMMNNNNNNNNNMNNNNNNHNNNNNNNNNNNN', 43],
+ ['MHHMNNNNMHHMNNNNHHHMNNNNHMHHMMNNHMMMNNNNHMNMNNNNMNNNNNNNNNNNNNNN', 52],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNHNNNNNNNNNNNNNN', 41],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNMNMNNNNNNNNNNNNNMNNNNNNNNNNNNNN', 45],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNMMHMNNHNHHHMNMNNMMHMNNNNNNMNNNNNNNNNNNNN', 38],
+ ['NMHHHMNNNMHHHMNNNMHMMNNNNMHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNNNNN', 23],
+ ['NNMHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNHNNNNNNNNNNNNN', 49],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNNMHMNMNNNMHMNNNNNMHMNMNNNNMNNNN', 57],
+ ['MHMNNNNNMHMNNNNNMHMMMMNNMHMHHHMNNMMHHHMNNNNMMMNNNNMNNNNNNNNNNNNN', 14],
+ ['NNMHMNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNNNN', 53],
+ ['NMMMMNNNMHHHHMNNMHHHMNNNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNNNNNNNNNN', 22],
+ ['MHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNMNNNNNNNNNNNNNNMNNNN', 34],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHMMNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 51],
+ ['NMMMMNNNMHHHHMNNNMMMMMNNNNNMHHMNNMNMHHMNNNNMHHMNNNMHHHMNNNNMMMNN', 41],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMHHMNNNNMHHMNNMNMHHMNNNNNMHMNNNNNNMNN', 50],
+ ['NMHMMHMNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNNNNNMNNNNNNNNNN', 58],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNMNNMHMNNNNNMHMNNNMNMHMNNNNNMHMNNNNNNMNNN', 34],
+ ['NNMNNNNNNMHMNNNNNMHHMNHNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNNNN', 14],
+ ['MHHHHMNNMHHMMNNNMHHMMMNNNMHHHHMNNNMMMMNNNNNNMNNMNNNNNNNNNNNNNNNN', 50],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNN', 30],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNN', 51],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNMNNNNNNNNNNNNNNNNNNNNNNNNN', 45],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHHMNNNMMMMNNNNNNNNNNNNNNMNNNNNNNNNNN', 41],
+ ['NMHMNNNNNMHMNMNNNMHMNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNNNNNNNNNNNN', 49],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNNNNNNMNNNNNNNNMNNNNNNNNNNN', 38],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNMNNNNMNNNNNNNNNNNNN', 41],
+ ['NNMHMNNNNNMHMNNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNMNNNNNNNNNN', 22],
+ ['NMMHMNNNMHHHMNNNMHHHMNNNMHHHMMMNNMMMNMHMNNNMNMHMNNNNNMHMNNNNNNMN', 49],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNMNNNNNNNNNN', 49],
+ ['NNNNNNNNNNNMNNNNNNNNNMNNNNMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 50],
+ ['MHHHHMNNNMMMMMNNNNNNNNMNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNN', 31],
+ ['NNMNNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNMNNNNNNNNNNNNMNNHNNNNNNNNNN', 54],
+ ['NMHMNNNNNMHMNNMNNMHMNMHMNNMNNMHMNNNNNMHMNNNMNMHMNNNNNNMNNNNNNNNN', 41],
+ ['NMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNMHMNNNNNMHMNNNNNNMNMNNNNNNNHNN', 62],
+ ['NNMNNNNNNMHMNNNNNMHMNNMNNMHMNNNNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 49],
+ ['NNMNNNNNNMHMNNNNNMHMNHHNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 30],
+ ['HHHHMNNNHHHHMNNNMMMHMNNNNNMHMMNNNNNMMHMNNMNNMHMNNNMNMHMNNNNNNMNN', 14],
+ ['MHMNNNNNMHHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNNNMMNNMNNNNNNNNNNNNNNNNN', 14],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNNNNMHMNNNNNMHMNNMNNNMNNNNNNNNNNNNN', 60],
+ ['NNMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNMNMHMNNHNNMHMNNMNNNMNNNNNNNNNN', 42],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNMNNNNNNNNMNNNNNNNNNNNN', 46],
+ ['NMHMNNNNNMHMNNNNNMHMNHHNNMHMNNNNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 30],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNNMMMMNNMNNNNNNMNNNNNNMNNNNNNNNNNN', 59],
+ ['NNNHNNNNNNNNNNMNNNNMMNNNNMMHHMNNMHHHHMNNNMMHHMNNNNNMMNNNNNNMNNNN', 2],
+ ['NMHHMMNNNMHHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNNNNNNNNNNNNNNNNNMHNNNN', 60],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMMNNNNMMNNNNNNNMNNNNNNNNMNNNNNNNNNNN', 38],
+ ['NMHHHHMNNNMHMMNNNNMHMMNNNNMMNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 50],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNMNNNNMNNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNMMMMMNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNN', 22],
+ ['NMHHMNNNNMHMNNNNNMHMNHHNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 29],
+ ['NNNMMNNNNNMHHMNNNNMHHMNNNMMHHMNNMHHHHMNNNMMMMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 30],
+ ['NNNNNNNNNMNNNMNNNNNMNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNNNN', 49],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNNNMNNMNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNMNNNMHMNNNNNMHMNNHNNNMNNNNNMNNNN', 51],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNMNMMNNNNHNNNNNNNHNNNNNNNNNNNNNNNNNNNNNN', 34],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNHNNNNNNNMNNNNNNNNNNNNNNNNN', 37],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNMNNMMMNNNNMHHHNNNNNMMMNNNNNNNN', 59],
+ ['NMMNNMNNMHHMNNNNNMHMNNMNNMHMMMNNNMHMHHMNNMHMHHMNNNMMHHMNNNNNMMNN', 40],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHMNNMNNMHMNNNNNNMNNMNNNNNNMNNN', 47],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNMNNNNNHNNNNNNNNNNNN', 52],
+ ['NMMMMNNNMHHHHMNNNMMHHMNNNNMHHMMMNNNMHHHHNNNNMMMMNNNNNNNNNNNNNNNN', 41],
+ ['MHMNNNNNMHMNNMNNNMNNMMNNNNMMMHMNNMHHHHMNNMHHHHMNNNMMMHMNNNNNNMNN', 58],
+ ['NMHHMNNNNMHHMNMNMMHHMNNNHHHHMMMNMMMMHHHMNNNNMMMNNNNNNNNNNNNNNNNN', 50],
+ ['MHHHMNNNNMMMNNNNNNNNMMNNNNNMHHMMMNNMHHHHNNNMHHMMNNNNMMNNNNNNNNNN', 58],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNMNNNNNNMNNN', 39],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNMHNNNNNNNNNNNNNNNNNNN', 52],
+ ['NMHHHMNNNMHHHMNNMHHHMMNNNMMMNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 38],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNMNNNNNNNNNNNNNMHNNNNNNNNNNN', 44],
+ ['NMHMNNNNNMHMNNNNNMHMNNMNNMHMNHNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNN', 37],
+ ['NNMMMMNNNMHHHHMNNMMMMMNNMHHHMNNNMHHHMNNNMHHMNNMNNMMNNMNNNNNNNNNN', 31],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMMNNNNNNNNMNNNNNMNNNNNNNNNNN', 40],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNHHMNNNNNNNNNNNNNNNNN', 53],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNMNNNNNHNNNNNNNNNNN', 51],
+ ['NNNNNNNNNNMMMNNNNMHHHMNNNNMMMMNNNNNNNNNNNNNMNNNNNNNNNMNNNNNNNNNN', 49],
+ ['NNMHMNNNNNMHMNNNNNMHMMMNNNNMMHHMNNMNMHHMNNNNMHHMNNNNNMMNNNNNNNNN', 59],
+ ['MHHMNNNNMHHMNMNNMHHMNNMNNMMMMNNNMHHHHMNNHHMMMNNNMMNNNNNNNNNNNNNN', 53],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNMNNNNNNNNHNNNNNNNNNN', 52],
+ ['HHHMNNNNHHHMNNNNMMMNMNNNNNNNNMNNNNMNMHMNNNNNMHMNNNNNMHMNNNNNMHMN', 41],
+ ['NMHHMNNNNMHHMNMNNMHHMNNNNMHHHMNNNMHMMNNNNMHMNNMNNMHMNHNNNMHMNNNN', 54],
+ ['MHHHMNNNMHHHMNNNMHHHMNMNMHMHMNNNNMMHMMNNNNMHMNMNNNNMNNNNNNNNNNNN', 49],
+ ['NNMMMMNNNMHHHHMNNMHMMMNNNMHMNNMNNMHMMMNNNNMHHHMNNMMHHHMNNNNMMMNN', 39],
+ ['MHHMMHMNNMHHHHMNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNHHNN', 62],
+ ['NMMMNNNNMHHHMNNNNMMHMMNNNNMHHHMNNNMHHHMNMNNMHHMNNMNNMMNNNNMNNNNN', 6],
+ ['NNNMNNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 22],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMMNNMMMMNNMNNNNMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NNNHNNNNNNMNNNNNNNNMMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNMHHMNNNNNMMNNN', 4],
+ ['MHMNNNNNMHMNNNNNHHHMNNNNHHHMNMNNHHHMNNNNMMMMNNNNNNNNMNNNNNNNNNNN', 39],
+ ['NNMNNNNNNMHMMMNNNMHHHHMNNMHHHHMNNMHHHHMNNNMMMMNNNMNNNNMNNNMNNNNN', 47],
+ ['NNMNNNNNNMHMNNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNMNNMNNNNNNNNNNNNNNNNN', 14],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNNHNNNNNNHHNNNNNNNNNN', 44],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNNNNNMNNN', 32],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNNHNNNNNNNNNNN', 51],
+ ['NNMNNNNNNMHMMNNNNMHHHMNNNMHMMMNNNNMNNNNNNNNMNNNNNNNNNMNNNNNNNNNN', 49],
+ ['NMHHHHMNMHHHMMNNMHHHMMNNNMMHMNNNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNN', 30],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNMNNNNMNNNNNNNNNHNNNNNNNNNNN', 51],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 33],
+ ['NNMNNNNNNMHMNNNNNMHMNHMNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 13],
+ ['NMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 36],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNNHNNNNNNNNNNNN', 50],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNMHMNNMNNNMNNMNNNNNNMNNNNNNNNNNN', 31],
+ ['MHHMMNNNHHHMHMNNHHHMHMNNMMMMHMNNNNNMHMNNNMNNMNNNNNMNNNNNNNNNNNNN', 53],
+ ['MHHHHMNNHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNMNNNNNNMNNNNNMNNNNNNNNNNNN', 49],
+ ['NMHHHMNNMHHHHMNNMHMMMNNNMHHHHMNNNMMMMNNNNNNNMNNNNNNNHHNNNNNNNNNN', 51],
+ ['NMMNNMNNMHHMNNNNNMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNNNNNNNNNNNNNNN', 61],
+ ['HHHHHHMNMMMHHHMNNNMMMMNNNNNNNMNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 53],
+ ['NMHHMNNNNMHHMMNNNMHHMHMNNNMMMHMNNNNMHHMNNMNMHHMNNNNMHMNNNNNNMNNN', 57],
+ ['HHHHMNNNMMMMNMNNNNNNMHMNNNMMMHMNNMHHHHMNNMHHHMNNNNMMMNMNNNNNNNNN', 15],
+ ['NMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNNNNNNNNNNNNNNNNNN', 50],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNHNNNNNNMHNNNNNNNNNNNNNNNNN', 54],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 41],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 38],
+ ['NMHMNNNNNMHMNHNNMHHMNNMNMHHMMMNNMHMMHHMNNMNMHHMNNNNMHHMNNNNNMMNN', 21],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNMHMNNMNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNN', 21],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMMHMNNNNNMHMNNNHNMHMNNMNNMHMNNNNNNMNN', 50],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNMNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNNN', 50],
+ ['NNNNNNNNNNHNNNNNNNHNNNMNNNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNN', 11],
+ ['NNMNNNNNNNNNMMNNNNNMHHMNNMNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNMNNNNN', 32],
+ ['NNMHHMNNNNMHHMNNMMMHHMNNHHHHMNNNMMMMNNNNNNNNNMNNNNNNMNNNNNNNNNNN', 38],
+ ['NMHHHMNNNMHMMNNNNMHHMNHNNMHHMNHNNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNN', 31],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNMNNNNNNMNNNNNNNNNNN', 31],
+ ['NNMHMNNNNNMHMNNNNNMHMMNNNHNMHHMNNHNMHHMNNNNMHHMNNNNNMMNNNNNNNNNN', 41],
+ ['NNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNHNNNNNNNNNN', 54],
+ ['MHMNNNNNMHMNNNNNMHMNMMNNMHHMMHMNNMMNMHMNNNNNMHMNNNNNMHMNNNNNNMNN', 49],
+ ['MHHHMNNNMHHHMNNNNMHHMNMNNNMMNMHMNNNNNMHMNNNNMMHMNNNNNMHMNNNNNNMN', 41],
+ ['MHHHMNNNMHHHMNNNNMMMNMNNNNMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 35],
+ ['NMHMNNNNNMHMNNNNNMHMMMMMMHHHHHHHNMMMMHHHNNNNNMMMNMNNMNNNNNNNNNNN', 5],
+ ['MHHHMNNNMHHHMMMNMHMMMHHMMHMNNMMNMHMNNNNNMHMNMNNNNMNNNNNNNNNNNNNN', 53],
+ ['MHHMNNNNMHHMMMMNMHHHHHHMMHHMMMMNNMMNNNNNNNNMMNNNNNNHNNNNNNNNNNNN', 50],
+ ['MHHMNNNNMHHMNNNNHHHMNNNNHMHHMMNNHMMMNNNNHMNMNNNNMNNNMNNNNNNNNNNN', 22],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNHNNNNNNNNNNNNNN', 50],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNMNMNNNNNNNNNMNNNMNNNNNNNNNNNNNN', 52],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNMMHMNNHNHHHMNMHNMMHMNNNNNNMNNNNNNNNNNNNN', 46],
+ ['NMHHHMNNNMHHHMNNNMHMMNNMNMHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNNNNN', 37],
+ ['NNMMNNNNNMHHMNNNNNMMNMNNNNMNNNNNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 41],
+ ['HHHHMNNNHHHMNNNNHHHMMNNNMMMNNNNNNNMMMMNNNNMHHHMNNNNMMMNNNNNNNNNN', 13],
+ ['NNMHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNMHNNNNNNNNNNNNN', 42],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNNMHMNMNNNMHMNNNNNMHMNMNNMNMNNNN', 33],
+ ['MHMNNNNNMHMNNNHNMHMMMMNNMHMHHHMNNMMHHHMNNNNMMMNNNNMNNNNNNNNNNNNN', 13],
+ ['MHHMNNNNMHHMNNNNMHHMMNNNNMMNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNN', 13],
+ ['NMHHHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNMNNNNNNNNNNNNNNNNNNNN', 50],
+ ['NNMHMNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNMNNNNNNNNNN', 39],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNMNNMNNNNNNNNNNNNNNNNN', 14],
+ ['NMMMMNNNMHHHHMNNMHHHMNMNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNNNNNNNNNN', 53],
+ ['MHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNNNNMNNNNNNNNNMNNNNNNNNNNNNNNMNNNN', 39],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHMMNNNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 49],
+ ['NMMMMNNNMHHHHMNNNMMMMMNNNNNMHHMNNMNMHHMNNMNMHHMNNNMHHHMNNNNMMMNN', 24],
+ ['MHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNNNMMNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 13],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMHHMNNNNMHHMNNMNMHHMNNNMNMHMNNNNNNMNN', 48],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNHNNNNNNNHNNNNNNNNNNNNNNNNN', 45],
+ ['NMHMMHMNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNNNNNMNNNNMNNNNN', 40],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNMNNMHMNNNNMMHMNNNMNMHMNNNNNMHMNNNNNNMNNN', 22],
+ ['NNMNNNNNNMHMNNMNNMHHMNHNNMHHMNNNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNNNN', 30],
+ ['MHHHHMNNMHHMMNNNMHHMMMNNNMHHHHMNNNMMMMNNNNNNMNNMNNMNNNNNNNNNNNNN', 61],
+ ['NMHHMNNNNMHHMNMNNMHHMMHMNNMMNMHMNNNNNMHMNNNNMHHMNNNNNMMNNNNNNNNN', 32],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNMNNNNNNMNNNNNNNNNNNN', 32],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNMNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHHMNNNMMMMNNNMNNNNNNNNNNMNNNNNNNNNNN', 32],
+ ['NMHMNNNNNMHMNMNNNMHMNNNNNMHMMMMNNMHHHHHMNNMMMMMNNMNNNNNNNNNNNNNN', 53],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNMNNNNMNNNNNNNNMNNNNNNNNNNN', 32],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNMNNNNNNNNNNMNNNMNNNNMNNNNNNNNNNNNN', 14],
+ ['NNMHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNMNNNNNNNNNN', 33],
+ ['NMMHMNNNMHHHMNNNMHHHMNNNMHHHMMMNNMMMNMHMNNNMNMHMNMNNNMHMNNNNNNMN', 14],
+ ['MHMNNNNNMHMMMMNNMHMHHHMNNMMHHHMNNNMHHHMNNMNMMHMNNNMNNMNNNNNNNNNN', 57],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNMHHHMNMNNMMMNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNNNNNNNNNMNNNNNNNNNMNNNNNNNNNNNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 30],
+ ['MHHHMMMNMHHHHHHMNMMMMMMNNNNNNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 46],
+ ['MHHHHMNNNMMMMMNNNNNNNNMNNNMMMNNMNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNN', 54],
+ ['NNMNNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNMNNNNNNNNNNNNMNNHMNNNNNNNNN', 52],
+ ['NMHMNNNNNMHMNNMNNMHMNMHMNNMNNMHMNNNNNMHMNHNMNMHMNNNNNNMNNNNNNNNN', 49],
+ ['NMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNMHMNNNNNMHMNNNNNNMNMNNNNNNNHMN', 60],
+ ['HHHMNNNNHHHMNNNNMMMNNMNNNNMNNNNNNMHMNNNNNMHMNNMNNMHMNNNNNNMNNNNN', 28],
+ ['NNMNNNNNNMHMNNNNNMHMNHHNNMHMNNHNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 29],
+ ['HHHHMNNNHHHHMNMNMMMHMNNNNNMHMMNNNNNMMHMNNMNNMHMNNNMNMHMNNNNNNMNN', 22],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNNNNMHMNNNNNMHMNNMNNNMNNNNNNNNNMNNN', 31],
+ ['NNMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNMNMHMNNHHNMHMNNMNNNMNNNNNNNNNN', 33],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNMNNNHNNNNMNNNNNNNNNNNN', 45],
+ ['NMHMNNNNNMHMNNNNNMHMNHHNNMHMNNMNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 14],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNNMMMMNNMNNNNNNMNNNNNNMNNNNNNMNNNN', 31],
+ ['NNHHNNNNNNNNNNMNNNNMMNNNNMMHHMNNMHHHHMNNNMMHHMNNNNNMMNNNNNNMNNNN', 4],
+ ['NNMHMNNNNNMHMNNNNNMHMNHNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNMNNNNNNNNNN', 14],
+ ['NMHHMMNNNMHHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNNNNNNNNNNNNNNNNNMHMNNN', 35],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMMNNNNMMNNMNNNNMNNNNNNNNMNNNNNNNNNNN', 61],
+ ['NMHHHHMNNNMHMMNNNNMHMMNNNNMMNNNNNNNNNNNNNMMMMNNNMHHHMNNNNMMMNNNN', 38],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNMNNNNMNNNNNNNNMNNNNNNNNNNN', 61],
+ ['NMHHMNNNNMHHMNNNNMHHMNMNNMMMMMNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNN', 15],
+ ['NMHHMNNNNMHMNNNNNMHMNHHNNMHMNHNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 30],
+ ['NNNMMNNNNNMHHMNNNNMHHMNNNMMHHMNNMHHHHMNNNMMMMNNNNNNNNMNNNNNNNNNN', 46],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNHNNNNNNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 38],
+ ['NNNNNNNNNMNNNMNNNNNMNNNNNNNMMMNNNNMHHHMNNNNMMMNNNMNNNNNNNNNNNNNN', 24],
+ ['NNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNNNMNMNNMNNNNNNNNNNNNNNNNN', 53],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNMNNNMHMNNNNNMHMNNHNMNMNNNNNMNNNN', 33],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNMNMMNNNNHMNNNNNNHNNNNNNNNNNNNNNNNNNNNNN', 32],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNHHNNNNNNNMNNNNNNNNNNNNNNNNN', 30],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNMNNMMMNNNNMHHHNNNNNMMMNNNMNNNN', 49],
+ ['NMMNNMNNMHHMNNNNNMHMNNMNNMHMMMNNNMHMHHMNMMHMHHMNNNMMHHMNNNNNMMNN', 31],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNMMHMMMMNNNMMHHHMNMHHHHHMNNMMMMMNNNNNNNNN', 58],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNMNNNNNHHNNNNNNNNNNN', 50],
+ ['NMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 30],
+ ['NMMMMNNNMHHHHMNNNMMHHMNNNNMHHMMMNNNMHHHHNMNNMMMMNNNNNNNNNNNNNNNN', 50],
+ ['MHMNNNNNMHMNNMNNNMNNMMNNNNMMMHMNNMHHHHMNNMHHHHMNNNMMMHMNNNHNNMNN', 59],
+ ['NMHHMNNNNMHHMNMNMMHHMNNNHHHHMMMNMMMMHHHMNNNNMMMNNNMNNNNNNNNNNNNN', 48],
+ ['MHHHMNNNNMMMNNNNNNNNMMNNNNNMHHMMMNNMHHHHNNNMHHMMNNNNMMNNNNHNNNNN', 59],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNMNNN', 24],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNMHNNNNNNNMNNNNNNNNNNN', 45],
+ ['NMHHHMNNNMHHHMNNMHHHMMNNNMMMNNNNNNNNNNMNNNNNMNNNNNNNNNNNNNNNNNNN', 51],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNMNNNNNNHNNNNNNMHNNNNNNNNNNN', 54],
+ ['NMHMNNNNNMHMNNNNNMHMNNMNNMHMNHNNNMHHMHNNNMHHMNNNNMHHMNNNNNMMNNNN', 45],
+ ['NNMMMMNNNMHHHHMNNMMMMMNNMHHHMNNMMHHHMNNNMHHMNNMNNMMNNMNNNNNNNNNN', 60],
+ ['NNHNNNNNNNNNMMNNNNNMHHMNNNNMHHMNNMNMHHMNNNNMMMNNNNMNNNNNNNNNNNNN', 3],
+ ['NNNNNNNNNNHNNNNNNMHHNNNNNNNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNN', 11],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNMNNNNHHNNNNNNNNNNN', 50],
+ ['NNNNNNNNNMNNNMNNNNNMNNNNNNNNNNNNNNMMMMNNNMHHHMNNNNMMMNNNNNNNNNNN', 30],
+ ['NNMHMNNNNNMHMNNNNNMHMMMNNNNMMHHMNNMNMHHMNNNNMHHMNNNNNMMNNNNMNNNN', 25],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 38],
+ ['MHHMNNNNMHHMNMNNMHHMNNMNNMMMMNNNMHHHHMNNHHMMMNNNMMNNNMNNNNNNNNNN', 46],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNMNNNNNNNHHNNNNNNNNNN', 51],
+ ['NNMHMNNNNMMHMNNNMHHHMNNNNMMHMNMNNNMMNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 50],
+ ['HHHMNNNNHHHMNNNNMMMNMNNNNNNNNMNNNNMNMHMNNMNNMHMNNNNNMHMNNNNNMHMN', 14],
+ ['NMHHMNNNNMHHMNMNNMHHMNNNNMHHHMNNNMHMMNNNNMHMNNMNNMHMNHMNNMHMNNNN', 45],
+ ['MHHHMNNNMHHHMNNNMHHHMNMNMHMHMNNNNMMHMMNNNNMHMNMNNMNMNNNNNNNNNNNN', 53],
+ ['NNMMMMNNNMHHHHMNNMHMMMNNNMHMNNMNNMHMMMNMNNMHHHMNNMMHHHMNNNNMMMNN', 40],
+ ['MHHMMHMNNMHHHHMNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNNNNNNNNNNNNNNNHHHN', 63],
+ ['NMMMNNMNMHHHMNNNNMMHMMNNNNMHHHMNNNMHHHMNMNNMHHMNNMNNMMNNNNMNNNNN', 61],
+ ['NNNMNNNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 46],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMMNNMMMMNNMNNNNMNNNNNNNNNMNNNNNNNNNN', 50],
+ ['NNNHHNNNNNMNNNNNNNNMMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNMHHMNNNNNMMNNN', 5],
+ ['MHMNNNNNMHMNNNNNHHHMNNNNHHHMNMNNHHHMNNNMMMMMNNNNNNNNMNNNNNNNNNNN', 20],
+ ['NNMNNNNNNMHMMMNNNMHHHHMNNMHHHHMNNMHHHHMNNNMMMMNMNMNNNNMNNNMNNNNN', 6],
+ ['HHHMNNNNHHHMNMNNMMMMNNNNNNNNNNNNNMMMNMNNMHHHMNNNNMMMNNNNNNNNNNNN', 28],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNHHNNNNNNHHNNNNNNNNNN', 60],
+ ['MHMMNNNNMHHHMNNNMHMMMNNNMHMNNNMNNMMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 50],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMHHMMNMNMHHMNNNNMHHMNNNNNMMNNNNNNNMNNN', 39],
+ ['MHHMNNNNMHHMNNNNMHHMMNNNNMMNNNMNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNMHNNNNNNNNNNN', 44],
+ ['NMMMNNNNMHHHMNNNNMMMMNNNNNNNNNNNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 30],
+ ['MHMNNNNNMHMNMMMNMHMMHHHMMHMNMHMNNMNNMHMNNMNNMMNNNNNNNNNNNNNNNNNN', 50],
+ ['NMHHHHMNMHHHMMNNMHHHMMNNNMMHMNMNNNMHMNNNNNMHMNNNNNNMNNNNNNNNNNNN', 53],
+ ['NNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNMNNNNMNNNNNNNNHHNNNNNNNNNNN', 53],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNHNNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 34],
+ ['NNMNNNNNNMHMNHNNNMHMNHMNNMHMNNNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 29],
+ ['NMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNMNNNNNNMNNNNNNNNNNNNNNNNNNNN', 50],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNNMNNNNNMHNNNNNNNNNNNN', 43],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNNMHMNNNHNMHMNNMNNNMNNMNNNNNNMNNNNNNNNNNN', 23],
+ ['MHHMMNNNHHHMHMNNHHHMHMNNMMMMHMNNNNNMHMNNNMNNMNNNNNMNNMNNNNNNNNNN', 59],
+ ['MHHHHMNNHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNMNNNNNNMNNNMNMNNNNNNNNNNNN', 54],
+ ['NMMNNMNNMHHMNNNNNMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNNNNNNNNNNNNMNN', 53],
+ ['HHHHHHMNMMMHHHMNNNMMMMNNNNNNNMNNNNNNNNNNNNNMNNNNNNNNNMNNNNNNNNNN', 33],
+ ['NMHHMNNNNMHHMMNNNMHHMHMNNNMMMHMNNNNMHHMNNMNMHHMNNNNMHMNNNMNNMNNN', 6],
+ ['HHHHMNNNMMMMNMNMNNNNMHMNNNMMMHMNNMHHHHMNNMHHHMNNNNMMMNMNNNNNNNNN', 57],
+ ['NMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNNNNMNNNNNNNNNNNNN', 54],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNHNNNNNNMHNNNNNNNHNNNNNNNNN', 30],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNNNNMNNMNNNNNNNNNNNNNNNNNNN', 38],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NMHMNNNNNMHMNHNNMHHMNMMNMHHMMMNNMHMMHHMNNMNMHHMNNNNMHHMNNNNNMMNN', 12],
+ ['NMHMNNNNNMHMNNNNNMHMNHNNNMHMNNMNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNN', 13],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMMHMNNNNNMHMNNNHNMHMNNMHNMHMNNNNNNMNN', 41],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNMNNNNNNMNNNNNNMNNNNNNMNNNNNNNNNNNNN', 32],
+ ['MHHMNNNNMHHMNNNNMHHMMNNNMHHHHMNNNMMMMNNNNNNNNMNNNNNMNNNNNNNNNNNN', 54],
+ ['NNNNNNNNNNHMNNNNNNHNNNMNNNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNN', 9],
+ ['NNMNNNNNNNNNMMNNNNNMHHMNMNNMHHMNNMNMHHMNNNNMHHMNNNNNMMNNNNMNNNNN', 39],
+ ['NNMHHMNNNNMHHMNNMMMHHMNNHHHHMNNNMMMMNNMNNNNNNMNNNNNNMNNNNNNNNNNN', 58],
+ ['NMHHHMNNNMHMMNNNNMHHMNHNNMHHMNHHNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNN', 23],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNMNNNNNNNNNNN', 59],
+ ['NNMHMNNNNNMHMNNNNNMHMMNNNHNMHHMNNHNMHHMNNHNMHHMNNNNNMMNNNNNNNNNN', 17],
+ ['NNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNHMNNNNNNNNN', 52],
+ ['MHMNNNNNMHMNNNNNMHMNMMNNMHHMMHMNNMMNMHMNNNNNMHMNNHNNMHMNNNNNNMNN', 50],
+ ['MHHHMNNNMHHHMNNNNMHHMNMNNNMMNMHMNNNNNMHMNMNNMMHMNNNNNMHMNNNNNNMN', 50],
+ ['MHHHMNNNMHHHMNNNNMMMNMNNNNMNNNNNNNNHNNNNNNNNMNNNNNNNNNNNNNNNNNNN', 36],
+ ['NMHMNMNNNMHMNNNNNMHMMMMMMHHHHHHHNMMMMHHHNNNNNMMMNMNNMNNNNNNNNNNN', 61],
+ ['MHHHMNNNMHHHMMMNMHMMMHHMMHMNNMMNMHMNNNNNMHMNMNNNNMNNNMNNNNNNNNNN', 47],
+ ['HHHMNNNNHHHMNNNNMMMNMNNNNNNNNNNNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 30],
+ ['MHHMNNNNMHHMMMMNMHHHHHHMMHHMMMMNNMMNNNNNNNNMMNNNNNHHNNNNNNNNNNNN', 49],
+ ['MHHMNNNNMHHMNNNNHHHMNNMNHMHHMMNNHMMMNNNNHMNMNNNNMNNNMNNNNNNNNNNN', 46],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNHHNNNNNNNNNNNNN', 51],
+ ['MHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 38],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNMNMNNNNNNNNNMNNNMNNMNNNNNNNNNNN', 54],
+ ['MHHMNNNNMHHMNNNNMHHMNNNNMMHMNNHNHHHMNMHNMMHMNNHNNNMNNNNNNNNNNNNN', 22],
+ ['NMHHHMNNNMHHHMNNNMHMMNNMNMHMNNNNMHHMNMNNMHHMNNMNNMMNNMNNNNNNNNNN', 60],
+ ['HHHHMNNNMMHHHMMNNNMMMMHMNNNNNMHMNNMNNNMNNNNNNMNNNNNNNNNNNNNNNNNN', 50],
+ ['HHHHMNNNHHHMNMNNHHHMMNNNMMMNNNNNNNMMMMNNNNMHHHMNNNNMMMNNNNNNNNNN', 22],
+ ['NNMHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNMNNNNHNNNNNNMHNNNNNNNNNNNNN', 51],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNMMHMNMNNNMHMNNNNNMHMNMNNMNMNNNN', 47],
+ ['MHMNNNNNMHMNNMHNMHMMMMNNMHMHHHMNNMMHHHMNNNNMMMNNNNMNNNNNNNNNNNNN', 6],
+ ['NNNNNNNNNHNNNNMNNNNMNNNNNNMHMMNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNNNNN', 17],
+ ['MHHMNNNNMHHMNMNNMHHMMNNNNMMNNNNNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNN', 30],
+ ['NMHHHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNMNNNNNNMNNNNNNNNNNNNN', 46],
+ ['MHHHMNNNMHHHMNNNMHHMMNNNNMMNNNMNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 52],
+ ['NNMHMNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNNNNN', 60],
+ ['HHHMNNNNHHHHMNNNMMMHMNNNNNMHMNNNNNMHMNNNNNNMNMNNNNNMNNNNNNNNNNNN', 54],
+ ['NMHMNNNNNMHMNNMNNMHMNNNNNNMNNMNNNNNNNNNNNNNMNNMNNNNNNNNNNNNNNNNN', 49],
+ ['NMMMMNNNMHHHHMNNMHHHMNMNNMHHHMNNNMHHHMNNNNMMMNMNNNNNNMNNNNNNNNNN', 49],
+ ['MHHHHMNNNMMMMMMNNNNNMHHMNNMNMHHMMNNNMHHHNNNMNMMHNNNNNNMHNNNNNNNM', 52],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHMMNNNNNMNNNNNNNNNNMNNNMNMNNNNNNNNNNNN', 54],
+ ['NMMMMNNNMHHHHMNNNMMMMMNNMNNMHHMNNMNMHHMNNMNMHHMNNNMHHHMNNNNMMMNN', 48],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNNNN', 53],
+ ['MHMNNNNNMHMNNMNNMHMNMNNNMHMNNNNNNMMNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 23],
+ ['NMNNNNNNNNMNNMMNNMNNMHHMNNMMMHHMNMHHHHHMMHHHHMMNNMMMMNNNNNNNNNNN', 24],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNHNNNNNNMHNNNNNNNNNNNNNNNNN', 54],
+ ['NMHMMHMNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNMNNNMNNNNNNNNMNNNNMNNNNN', 49],
+ ['NNMHHMNNNNMHHMNNNMMHHMNNNNMHMNNMNNMHMMNNNNMHMNMNNNMHMNNNNNNMNNNN', 55],
+ ['NNMNNNNNNMHMNNMNNMHHMNHNNMHHMNHNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNNNN', 29],
+ ['MHHHHMNNMHHMMNNNMHHMMMNNNMHHHHMNNNMMMMNNNNNNMNNMNNMNNNNNNNNNNMNN', 54],
+ ['HHHMNNNNHHHMNMNNMMMMNNNNNNNNNNNNMMMNNMNNHHHMNNNNMMMNNNNNNNNNNNNN', 28],
+ ['NMHHMNNNNMHHMNMNNMHHMMHMNNMMNMHMMNNNNMHMNNNNMHHMNNNNNMMNNNNNNNNN', 59],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNHNNNNMNNNNNNMNNNNNNMNNNNNNNNNNNN', 40],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNMNNNNNNMNNNNNNHNNNNNNNNNNN', 51],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHHMNMNMMMMNNNMNNNNNNNNNNMNNNNNNNNNNN', 59],
+ ['NMHMNNNNNMHMNMNNNMHMNNNNNMHMMMMNNMHHHHHMNNMMMMMNNMNNNHNNNNNNNNNN', 61],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNMNNNNNMNNNNMNNNNNNNNMNNNNNNNNNNN', 47],
+ ['NNNNNNNNNMNMNNNNNNNNNMNNNNMNNNNNNMHMNNNNNMHMNNMNNNMNNMNNNNNNNNNN', 14],
+ ['NNMHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNMNMNMNNNNNNNNNNNNMNNMNNNNNNNNNN', 46],
+ ['NMMHMNNNMHHHMNMNMHHHMNNNMHHHMMMNNMMMNMHMNNNMNMHMNMNNNMHMNNNNNNMN', 59],
+ ['MHMNNNNNMHMMMMNNMHMHHHMNNMMHHHMNNNMHHHMNNMNMMHMNNNMNNMNNNMNNNNNN', 59],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNMHHHMNMNNMMMNNNNNNNNNMNNNNNNMNNNNNNNNNNN', 39],
+ ['HHHHHHMMHHHMHHHHMMMNMMMMNNNNNMNNNMNNNNNNNNNMNNMNNNNNNNNNNNNNNNNN', 52],
+ ['MHHHMMMNMHHHHHHMNMMMMMMNNNNNNNNNNNNNNMNNNNMNNNMNNNNNMNNNNNNNNNNN', 33],
+ ['MHHHHMNNNMMMMMNNNNNNNNMNNNMMMNNMNMHHHMNNNMHHHMNNNNMMMNMNNNNNNNNN', 61],
+ ['NNMNNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNMNNNNNNNNNNNNMNHHMNNNNNNNNN', 51],
+ ['MHHMNNNNMHHMNMMMMHHMMHHHNMMNNMMMNNNNNNNNNNMMMMNNNMHHHHMNNNMMMMNN', 38],
+ ['NMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNMHMNNNNNMHMNNNNNNMNMNNNNNNHHMN', 59],
+ ['NNNNNNNNNNMNNNNNNNNNMNNNNNNNNNMNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 41],
+ ['MHHHMNNNMHHHHMNNNMMMHMNNMHHHHMNNNMMMHMNNNNNMMNMNNNNNNNNNNNNNNNNN', 50],
+ ['HHHMNNNNHHHMNNNNMMMNNMNNNNMNHNNNNMHMNNNNNMHMNNMNNMHMNNNNNNMNNNNN', 36],
+ ['NNMNNNNNNMHMNNNNNMHMNHHNNMHMNHHNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 14],
+ ['HHHHMNNNHHHHMNMNMMMHMNMNNNMHMMNNNNNMMHMNNMNNMHMNNNMNMHMNNNNNNMNN', 33],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNNMNMHMNNNNNMHMNNMNNNMNNNNNNNNNMNNN', 53],
+ ['NNMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNMMNMHMNNHHNMHMNNMNNNMNNNNNNNNNN', 40],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNMNNHHNNNNMNNNNNNNNNNNN', 44],
+ ['NMHMNNNNNMHMNNHNNMHMNHHNNMHMNNMNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 13],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNMMMMMNNMNNNNNNMNNNNNNMNNNNNNMNNNN', 42],
+ ['NNHHHNNNNNNNNNMNNNNMMNNNNMMHHMNNMHHHHMNNNMMHHMNNNNNMMNNNNNNMNNNN', 5],
+ ['NNMHMNNNNNMHMNHNNNMHMNHNNNMHMNNNNNNMNMNNNNNNNNNNNNMNNMNNNNNNNNNN', 30],
+ ['NMHHMMNNNMHHHHMNNNMHHHMNNNNMHHMNNNMHMMNNNNNNNNNNNNNNNNNNNNMHMNNN', 43],
+ ['NMHHHHMNNNMMMMNNNNNMNNNNNNMMNNMNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNN', 23],
+ ['NMHHHHMNNNMHMMNNNNMHMMNNNNMMNNNNNNNNNNMNNMMMMNNNMHHHMNNNNMMMNNNN', 54],
+ ['NMHMNNNNNMHMNNNNNMHMMNNNNMHMNNNNNNMNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 13],
+ ['NMHHMNNNNMHHMNNMNMHHMNMNNMMMMMNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNN', 46],
+ ['NMHHMNNNNMHMNNNNNMHMNHHNNMHMNHHNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 13],
+ ['NNNMMNNNNNMHHMNNNNMHHMNNNMMHHMNNMHHHHMNNNMMMMNHNNNNNNMNNNNNNNNNN', 38],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNHNNNNNNNMNNNNNMNNNNNNNNNNNNNNNNNNN', 29],
+ ['NNNMNNNNNMNNNNMNNNNNMNNNNNMMHMNNNNNMHMNNNMNMHMNNNNNNMNNNNNNNNNNN', 39],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNMHNNMHMNNNNNMHMNNHNMNMNNNNNMNNNN', 41],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNMNMMNNNMHMNNNNNNHNNNNNNNNNNNNNNNNNNNNNN', 49],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNMNNNMNNHHNNNNNNNMNNNNNNNNNNNNNNNNN', 39],
+ ['NMMNNMNNMHHMNNNNNMHMNNMNNMHMMMNMNMHMHHMNMMHMHHMNNNMMHHMNNNNNMMNN', 55],
+ ['NMMMMNNNMHHHHMNNNMMMMMNNNNMNNNNNNNNNNNMNNMNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['NMHMNNNNNMHMNNNNNMHMNNNNMMHMMMMNNNMMHHHMNMHHHHHMNNMMMMMNNNHNNNNN', 57],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNMNNNNHHHNNNNNNNNNNN', 49],
+ ['NMHMNNNNNMHMNNNNNNMNMNNNNNNNNNMNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 41],
+ ['NMMMMNNNMHHHHMNNNMMHHMNNNNMHHMMMNNNMHHHHNMNNMMMMNNMNNNNNNNNNNNNN', 59],
+ ['MHMNNNNNMHMNNMNNNMNNMMNNNNMMMHMNNMHHHHMNNMHHHHMNNNMMMHMNNNHMNMNN', 56],
+ ['MHHHMNNNMHHHMNNNNMMMNMNNNNMNNNNNNNNNNNMNNMNNMNNNNNNNNNNNNNNNNNNN', 51],
+ ['NMHHMNNNNMHHMNMNMMHHMNNNHHHHMMMNMMMMHHHMNNNNMMMNMNMNNNNNNNNNNNNN', 60],
+ ['MHHHMNNNNMMMNNNNNNNNMMNNNNNMHHMMMNNMHHHHNNNMHHMMNNNNMMNNNNHHNNNN', 57],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNMMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNMNNN', 29],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNMHHNNNNNNMNNNNNNNNNNN', 46],
+ ['NMHHHMNNNMHHHMNNMHHHMMNNNMMMNNNNNNNNNNMNNNNNMNNNNNNMNNNNNNNNNNNN', 31],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNMNNNNNNHNNNNNNMHNMNNNNNNNNN', 60],
+ ['NMHMNNNNNMHMNNNNNMHMNNMNNMHMNHNNNMHHMHNNNMHHMMNNNMHHMNNNNNMMNNNN', 38],
+ ['NNMMMMNNNMHHHHMNNMMMMMNNMHHHMNNMMHHHMNNNMHHMNNMNNMMNNMNNNNNNMNNN', 39],
+ ['NNHHNNNNNNNNMMNNNNNMHHMNNNNMHHMNNMNMHHMNNNNMMMNNNNMNNNNNNNNNNNNN', 4],
+ ['NNNNNNNNNNHHNNNNNMHHNNNNNNNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNN', 20],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNMNNNHHHNNNNNNNNNNN', 49],
+ ['NMMHMNNNMHMHMNNNMHMHMMMNMHMMMHHMMHMNMHHMNMNNMHHMNNNNNMMNNNNMNNNN', 50],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNHNNNNNNMNNNNNMNNNNNNNNNNNN', 30],
+ ['NMHHMNNNNMHHMNNNNMHHMMNNNNMMNNNNNNNNNNMNNMNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['MHHMNNNNMHHMNMNNMHHMNNMNNMMMMNNNMHHHHMNNHHMMMNMNMMNNNMNNNNNNNNNN', 31],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNMNNNNNNMHHNNNNNNNNNN', 60],
+ ['NNMHMNNNNMMHMNNNMHHHMNNNNMMHMNMNNNMMNNNNNNNNNMNNNNHNNNNNNNNNNNNN', 49],
+ ['MHHMMNNNHHHHHMNNMMMHHMNNNNMHHMNNNMNMMNNNNNNMNNMNNNNNNNNNNNNNNNNN', 31],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMNNNNNNNNNNMNNMNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['HHHMNNNNHHHMNNMNMMMNMNNNNNNNNMNNNNMNMHMNNMNNMHMNNNNNMHMNNNNNMHMN', 27],
+ ['NMHHMNNNNMHHMNMNNMHHMNNNNMHHHMNNNMHMMNNNNMHMNMMNNMHMNHMNNMHMNNNN', 52],
+ ['MHHHMNNNMHHHMNNNMHHHMNMNMHMHMNNNNMMHMMNNNNMHMNMNNMNMNMNNNNNNNNNN', 58],
+ ['NNMMMMNNNMHHHHMNNMHMMMNNNMHMNNMNNMHMMMNMMNMHHHMNNMMHHHMNNNNMMMNN', 23],
+ ['NMMMNNMNMHHHMNNNNMMHMMNNNNMHHHMNNNMHHHMNMNNMHHMNNMNNMMNNNNMNNMNN', 23],
+ ['NNNMNNNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNNMNNNNMNNNHNNNNNMNNNNNNNNNNN', 54],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMMNNMMMMNNMNNNNMNNNNNNMNNMNNNNNNNNNN', 60],
+ ['NMHHHHMNNNMMMMNNNNMMMNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMHHMNNNNNMMNNN', 31],
+ ['NHNNNMNNNNMMMHMNNMHHHHMNNMHHHHMNNMHHHHMNMNMMMMNNNMNNNNMNNNNNNMNN', 9],
+ ['HHHMNNNNHHHMNMNNMMMMNNNNNNNNMNNNNMMMNMNNMHHHMNNNNMMMNNNNNNNNNNNN', 22],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNHHNNNNNNHHNNNNNNHNNN', 61],
+ ['MHMMNNNNMHHHMNNNMHMMMNNNMHMNNNMNNMMNNNNNNNNNNMNNNNHNNNNNNNNNNNNN', 51],
+ ['NNNHNNNNNNNNMNNNNNMMMMMNMMHHHHHMNMHHHHHMNNMMMHMNNNNNNMNNNNNMNNNN', 4],
+ ['MHHMNNNNMHHMNNNNMHHMMNNNNMMNNNMNNNMNNNNNNNNNNMNNNNNNMNNNNNNNNNNN', 59],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNHMNNNNNMHNNNNNNNNNNN', 60],
+ ['NMMMNNNNMHHHMNNNNMMMMNNNNNNNNNHNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 22],
+ ['MHMNNNNNMHMNMMMNMHMMHHHMMHMNMHMNNMNNMHMNNMNNMMNNNNHNNNNNNNNNNNNN', 58],
+ ['NMHHHHMNMHHHMMNNMHHHMMNNNMMHMNMNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNN', 46],
+ ['NNNNNNNNNNHHHNNNNNNNNMNNNNMNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNN', 9],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNHMNNNNNNNNMNNNNNNNNNNNNNNNNNNNN', 41],
+ ['NNMNNNNNNMHMNHNNNMHMNHMNNMHMNMNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 20],
+ ['NMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNMNNNNNNMNNNNNNHNNNNNNNNNNNNN', 51],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNMMNNNNNMHNNNNNNNNNNNN', 52],
+ ['MHHMNNNNMHHMNNNNMHHMNNNHNMHMNNNHNMHMNNMNNNMNNMNNNNNNMNNNNNNNNNNN', 39],
+ ['MHHMMNNNHHHMHMNNHHHMHMNNMMMMHMNNNNNMHMNNNMNNMNNNNNMNNMNNNNNHNNNN', 60],
+ ['MHHHHMNNHHHMMNNNMMHHHMNNNMHHHMNNNNMMMNMNNNNNNMNNNMNMNNMNNNNNNNNN', 14],
+ ['NMMNNMNNMHHMNNNNNMHHMNNNNMHHMMMMNMHHHHHHNNMMMMMMNNNNNMNNNNNNNMNN', 48],
+ ['HHHHHHMNMMMHHHMNNNMMMMNNNNNNNMNNNMNNNNNNNNNMNNNNNNNNNMNNNNNNNNNN', 38],
+ ['NMHHMNMNNMHHMMNNNMHHMHMNNNMMMHMNNNNMHHMNNMNMHHMNNNNMHMNNNMNNMNNN', 50],
+ ['NMMMMNNNMHHHHMNNNMMHHMNNNNMHHMNNNNNMHMMNNMNNMNNNNNNNNNNNNNNNNNNN', 53],
+ ['HHHHMNNNMMMMNMNMNNNNMHMNNNMMMHMNNMHHHHMNNMHHHMNNNNMMMNMNNMNNNNNN', 17],
+ ['NMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNNNNNMHMNNNNNNMNNNNNMNNNMNNNNNNNNN', 31],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNHNNNNNNNHNNNNNNMHNNNNNNNHNNNNNNNNN', 22],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNHNNMNNMNNNNNNNNNNNNNNNNNNN', 46],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNMNNNNNNNNMNNNNNNNNNN', 59],
+ ['NMHMNNNNNMHMMHNNMHHMNMMNMHHMMMNNMHMMHHMNNMNMHHMNNNNMHHMNNNNNMMNN', 5],
+ ['NMHMNNNNNMHMNHNNNMHMNHNNNMHMNNMNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNN', 14],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMMHMNNNNNMHMNNMHNMHMNNMHNMHMNNNNNNMNN', 58],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNMNNMNNNMNNNNNNMNNNNNNMNNNNNNNNNNNNN', 46],
+ ['MHHMNNNNMHHMNNNNMHHMMNNNMHHHHMNNNMMMMNNNNNNNNMNNNNNMNNMNNNNNNNNN', 14],
+ ['NNMNNNNNNNNNMMNNNNNMHHMNMNNMHHMNNMNMHHMMNNNMHHMNNNNNMMNNNNMNNNNN', 34],
+ ['NNMHHMNNNNMHHMNNMMMHHMNNHHHHMNNNMMMMNNMNNNNNNMNNNNNNMNNNNNMNNNNN', 31],
+ ['NMHHHMNNNMHMMNNNNMHHMNHHNMHHMNHHNMHMNNNNNNMNMNNNNNNNNNNNNNNNNNNN', 38],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNMNNNNNNHNNNN', 60],
+ ['NNMHMNNNNNMHMNNNNHMHMMNNNHNMHHMNNHNMHHMNNHNMHHMNNNNNMMNNNNNNNNNN', 9],
+ ['NNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMNHHMNNNNNNNNN', 51],
+ ['MHMNNNNNMHMNNNNNMHMNMMNNMHHMMHMNNMMNMHMNNNNNMHMNNHHNMHMNNNNNNMNN', 41],
+ ['MHHHMNNNMHHHMNNNNMHHMNMNNNMMNMHMNNNNNMHMNMNNMMHMNNMNNMHMNNNNNNMN', 32],
+ ['MHHHMNNNMHHHMNNNNMMMNMNNNNMNNNNNNNNHHNNNNNNNMNNNNNNNNNNNNNNNNNNN', 37],
+ ['NMHMNMNNNMHMNNNNNMHMMMMMMHHHHHHHNMMMMHHHNNNNNMMMNMNNMNNNNNNNNMNN', 58],
+ ['MHHHMNNNMHHHMMMNMHMMMHHMMHMNNMMNMHMNNNNNMHMNMNNMNMNNNMNNNNNNNNNN', 59],
+ ['HHHMNNNNHHHMNNNNMMMNMNNNNNNNNNMNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 39],
+ ['MHHMNNNNMHHMNNNNHHHMNNMNHMHHMMNNHMMMNNNNHMNMNNMNMNNNMNNNNNNNNNNN', 61],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNHHMNNNNNNNNNNNN', 58],
+ ['MHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNMNNNNNNMNNNNNMNNNNNNNNNNNN', 60],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNMNMNNNNNNNNNMNNNMNNMNMNNNNNNNNN', 38],
+ ['NMMMMNNNMHHHHMNNMHHHHMNNMHMMMNNNMHMNNNMNNMNNMNNNNNNNNNNNNNNNNNNN', 51],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNMNNMNNMNNNNNNNNNNNNNNNNNNN', 50],
+ ['NMHHHMNNNMHHHMNNNMHMMNNMNMHMNNNNMHHMNMNNMHHMNNMNNMMNNMNNNNNNMNNN', 30],
+ ['HHHHMNNNMMHHHMMNNNMMMMHMNNNNNMHMNNMNNNMNNNNNNMNNNNHNNNNNNNNNNNNN', 42],
+ ['HHHHMNNNHHHMNMNNHHHMMNMNMMMNNNNNNNMMMMNNNNMHHHMNNNNMMMNNNNNNNNNN', 49],
+ ['NNMHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNMNNNNHNNNNNNMHHNNNNNNNNNNNN', 52],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNMMHMNMNNNMHMNNMNNMHMNMNNMNMNNNN', 45],
+ ['NNNNNNNNNHHNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNMNNNNNMNNNMNNNNNNNNNN', 17],
+ ['MHHMNNNNMHHMNMNNMHHMMNNNNMMNNNHNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNN', 22],
+ ['NMHHHHMNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNMNNMNNNNNNNNMNNNNNNNNNN', 50],
+ ['MHHHMNNNMHHHMNNNMHHMMNNNNMMNNNMNNNMNNNNNNNNNNMNNNNNNMNNNNNNNNNNN', 59],
+ ['NNMHMNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNHNNN', 59],
+ ['HHHMNNNNHHHHMNNNMMMHMNNNNNMHMNNNNNMHMNNNNNNMNMNNNNNMNNMNNNNNNNNN', 22],
+ ['HHHHMNNNHHMMNMMMHHMNMHHHMMMNNMMMNNNNNNNNNNNNMNNNNNMNNNMNNNNNNNNN', 35],
+ ['NMHHHMNNNMHHHMNNNNMMHMNNNNNMHMNNNMNMHHMNNNNMHHMNNNNNMHMNNNNNNMNN', 49],
+ ['NMMMMNNNMHHHHMNNMHHHMNMNNMHHHMNNNMHHHMNNNNMMMNMNNMNNNMNNNNNNNNNN', 15],
+ ['MHHHHMNNNMMMMMMNNNNNMHHMNNMNMHHMMNNNMHHHNNNMNMMHNNNNMNMHNNNNNNNM', 49],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHMMNNNNNMNNNNNNNNNNMNNNMNMNNMNNNNNNNNN', 31],
+ ['NMMMMNNNMHHHHMNNNMMMMMNNMNNMHHMNNMNMHHMNNMNMHHMNMNMHHHMNNNNMMMNN', 15],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNHNNNNNNNNNN', 54],
+ ['MHMNNNNNMHMNNMNNMHMNMNNMMHMNNNNNNMMNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 29],
+ ['NMNNNNNNNNMNNMMNNMNNMHHMMNMMMHHMNMHHHHHMMHHHHMMNNMMMMNNNNNNNNNNN', 61],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNHNNNNNNMHNNNNNNNMNNNNNNNNN', 30],
+ ['NMHMMHMNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNMNNNMNNNNMNNNMNNNNMNNNNN', 46],
+ ['NMNNMNNNNNMNNNNNNNNMNMMMNMMMMHHHMHHHHHHHNMMMMMMMNNNNNMNNNNNNNNNN', 16],
+ ['NMHHHMNNNNMHMNNNNNMHMMNNNNMHMNNNNNMHMNMNNMNMMNNNNNNNNNNNNNNNNNNN', 54],
+ ['NNMNNNNNNMHMNNMNNMHHMNHNNMHHMHHNNMHHMNNNNNMMNNMNNNNNNNNNNNNNNNNN', 38],
+ ['MHHHHMNNMHHMMNNNMHHMMMNNNMHHHHMNNNMMMMNNNNNNMNNMNNMNNNMNNNNNNMNN', 41],
+ ['HHHMNNNNHHHMNMNNMMMMNNNNNNNNHNNNMMMNNMNNHHHMNNNNMMMNNNNNNNNNNNNN', 27],
+ ['NMHHMNNNNMHHMNMNNMHHMMHMNNMMNMHMMNNNNMHMNNNNMHHMNNNNNMMNNNNMNNNN', 49],
+ ['NNMHNNNNNNNNNMMNNNNNMHHMNMNNMHHMNNMNMHHMNNNMNMMNNNNNNNNNNNNNNNNN', 11],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNMNNNNNNMNNNNNHHNNNNNNNNNNN', 50],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHHMNMNMMMMNNNMNNNNNNNNNNMNNNNNNHNNNN', 60],
+ ['NMHMNNNNNMHMNMNNNMHMNNNNNMHMMMMNNMHHHHHMNNMMMMMNNMNNNHNNNNNNNHNN', 52],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNMNNNNNMNNNNMNNNMNNNNMNNNNNNNNNNN', 61],
+ ['NNNNNNNNNMNMNNMNNNNNNMNNNNMNNNNNNMHMNNNNNMHMNNMNNNMNNMNNNNNNNNNN', 29],
+ ['NNMHMNNNNNMHMNNNNNMHMNMNNNMHMNNNNMNMNMNNNNNNNNHNNNMNNMNNNNNNNNNN', 47],
+ ['NMMHMNNNMHHHMNMNMHHHMNNNMHHHMMMNNMMMNMHMNNNMNMHMNMNNNMHMNNNMNNMN', 40],
+ ['MHMNNNNNMHMMMMNNMHMHHHMNNMMHHHMNNNMHHHMNNMNMMHMNNNMNNMNNNMNMNNNN', 48],
+ ['NMMMNNNNMHHHMNNNMHHHMNNNMHHHMNMNNMMMNNNMNNNNNMNNNNNNMNNNNNNNNNNN', 59],
+ ['HHHHHHMMHHHMHHHHMMMNMMMMNNNNNMNNNMNNNNNNNNNMNNMNNNNNMNNNNNNNNNNN', 50],
+ ['MHHHMMMNMHHHHHHMNMMMMMMNNNNNNNNNNHNNNMNNNNMNNNMNNNNNMNNNNNNNNNNN', 32],
+ ['MHHHHMNNNMMMMMNNNNNNNNMNNNMMMNNMNMHHHMNNNMHHHMNNNNMMMNMNNNNNNHNN', 60],
+ ['NNMNNNNNNMHMMMMNNMHHHHHMNNMMMMMNNNNNNMNNNNNNNNNNNNMHHHMNNNNNNNNN', 43],
+ ['MHHMNNNNMHHMNMMMMHHMMHHHNMMNNMMMNNNNNNMNNNMMMMNNNMHHHHMNNNMMMMNN', 35],
+ ['MHHHMNNNMHHHHMNNNMMMHMNNMHHHHMNNNMMMHMNNNNNMMNMNNNMNNNNNNNNNNNNN', 53],
+ ['HHHMNNNNHHHMNNNNMMMNNMNNNNMNHNNNNMHMMNNNNMHMNNMNNMHMNNNNNNMNNNNN', 29],
+ ['NNMNNNNNNMHMNNMNNMHMNHHNNMHMNHHNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 38],
+ ['HHHHMNNNHHHHMNMNMMMHMNMNNNMHMMNNNMNMMHMNNMNNMHMNNNMNMHMNNNNNNMNN', 48],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNNNMNMHMNNNNNMHMNNMNNNMNNHNNNNNNMNNN', 52],
+ ['NNHNNNNNNMHMNMMNNNHMMHHMNNNNMHHMNNMMMHHMNMHHHHMNNNMMMMNNNNNNNNNN', 3],
+ ['NNNNNNNNNNMNNNNNNNNMNNMNNMNNNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 46],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNNNNNMNNNNMNHHHNNNNMNNNNNNNNNNNN', 47],
+ ['NMHMNNNNNMHMNHHNNMHMNHHNNMHMNNMNNNMNNNNNNNNNNMNNNNNNNNNNNNNNNNNN', 6],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMNNMMMMMNNMNNNMNNMNNNNNNMNNNNNNMNNNN', 21],
+ ['NNHHHMNNNNNNNNMNNNNMMNNNNMMHHMNNMHHHHMNNNMMHHMNNNNNMMNNNNNNMNNNN', 1],
+ ['NNMHMNNNNNMHMNHNNNMHMNHNNNMHMNMNNNNMNMNNNNNNNNNNNNMNNMNNNNNNNNNN', 23],
+ ['NMHHMMNNNMHHHHMNNNMHHHMNNNNMHHMNNNMHMMNNNNNHNNNNNNNNNNNNNNMHMNNN', 51],
+ ['NMHHHHMNNNMMMMNNMNNNMNNNNMNNMMNNNNMMHHMNNNNMHHMNNNNMHHMNNNNNMMNN', 40],
+ ['NMHHHHMNNNMHMMNNNNMHMMNNNNMMNNNNNNNNNNMNNMMMMNNNMHHHMNHNNMMMNNNN', 62],
+ ['NMHMNNNNNMHMNHNNNMHMMNNNNMHMNNNNNNMNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 14],
+ ['NMHHMNNNNMHHMNNMNMHHMNMNNMMMMMNNMHHHHMNNNMMMHMMNNNNMHMNNNNNNMNNN', 39],
+ ['NMHHMNNNNMHMNHNNNMHMNHHNNMHMNHHNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 14],
+ ['NNNMMNNNNNMHHMNNNNMHHMNNNMMHHMNNMHHHHMHNNMMMMNHNNNNNNMNNNNNNNNNN', 30],
+ ['NMHHHMNNNMHHHMNNNNMMMMNNNNMNNHHNNNNNNNMNNNNNMNNNNNNNNNNNNNNNNNNN', 28],
+ ['NNNHNNNNNNNNNNMNNNMMMNNNNMHHHMNNNNMMMNNMNNNNMNNNNNMNNNMNNNNNNNNN', 2],
+ ['NNMMMNNNNMHHHMMNNMHHHHHMNNMMMHMNMHNNMHMNNHNNMHMNNHNMNMNNNNNMNNNN', 25],
+ ['NNMHHMNNNNMHHMNNNNMHHMNNNMNMMNNNMHMNNNNNNHNNNNNNNMNNNNNNNNNNNNNN', 38],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNMNNNMNNHHHNNNNNNMNNNNNNNNNNNNNNNNN', 36],
+ ['NMMNNMNNMHHMNNNNNMHMNNMNNMHMMMNMNMHMHHMNMMHMHHMNNNMMHHMMNNNNMMNN', 57],
+ ['NMHHHMNNNMHHHMNNNNMMMNMNNMNNNNNNNNNNNMNNNNMMMMMNNNMHHHHMNNNMMMMN', 32],
+ ['NHHNNNNNNNMMMMMNNMHHHHHMNNMMHHHMMMHMMMMNNMHMNNNNNMHMNNNNNMHMNNNN', 3],
+ ['NNNMMNNNNNMHHMNNNMHHHMNNNNMMMNNNNNMNNNNNNNNNNMNNNMHHHNNNNNNNNNNN', 59],
+ ['NMHHHMMNMMMHHHHMHHMMMMMNMMNNNNMNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 49],
+ ['MHHHMNNNMHHHMNNNNMMMNMNNNNMNNNNNNNNMNNMNNMMHMNNNNMHHMNNNNMHHMNNN', 31],
+ ['MHMNNNNNMHMMNNNNMHMNNMNNMHMNNNNNNMNNNNMNNNNNMNNNNNMNNNNNNNNNNNNN', 53],
+ ['NMHHMNNNNMHHMNMNMMHHMNNNHHHHMMMNMMMMHHHMNNNNMMMNMNMNNNNNNNNNMNNN', 54],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNMMHHMMNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNMNNN', 50],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNNNNNNNNMNNNNNMHHHNNNNNMNNNNNNNNNNN', 36],
+ ['NMHHHMNNNMHHHMNNMHHHMMNNNMMMNNNHNNNNNNMNNNNNMNNNNNNMNNNNNNNNNNNN', 39],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNMHHMNNNNNMMNMNNNNNNHNNNNNNMHNMNNNNNHNNN', 36],
+ ['NMHMNNNNNMHMNNNNNMHMNNMNNMHMNHNNNMHHMHMNNMHHMMNNNMHHMNNNNNMMNNNN', 21],
+ ['NNMMMMNNNMHHHHMNNMMMMMNNMHHHMNNMMHHHMNNMMHHMNNMNNMMNNMNNNNNNMNNN', 57],
+ ['NNHHHNNNNNNNMMNNNNNMHHMNNNNMHHMNNMNMHHMNNNNMMMNNNNMNNNNNNNNNNNNN', 5],
+ ['NNNNNNNNNNHHNNNNNMHHHNNNNNNNNNNNNNNMMMNNNNMHHHMNNNNMMMNNNNNNNNNN', 12],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNMNNNNNNNNMNNHHHHNNNNNNNNNNN', 53],
+ ['NMMHMNNNMHMHMNNNMHMHMMMNMHMMMHHMMHMNMHHMNMNNMHHMNNMNNMMNNNNMNNNN', 14],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNHNNNMMNNHNNNNNNMNNNNNMNNNNNNNNNNNN', 22],
+ ['NMHHMNNNNMHHMNNNNMHHMMNNNNMMNNNNNNNNNNMNNMNNMNNNNNNNNMNNNNNNNNNN', 31],
+ ['MHHMNNNNMHHMNMNNMHHMNNMNNMMMMNNHMHHHHMNNHHMMMNMNMMNNNMNNNNNNNNNN', 39],
+ ['NNMMNNNNNMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNNNMNNNNNNMHHNNNNNNMNNN', 54],
+ ['NNMHMNNNNMMHMNNNMHHHMNNNNMMHMNMNNNMMNNNNNNNNNMNNNMHNNNNNNNNNNNNN', 51],
+ ['MHMNNMMNMHMNMHHMMHMNMHHMMHMNMHHMMHMNNMMNMHMNNMNNMHMMNNNNNMNNNNNN', 54],
+ ['HHHMNNNNHHHMNNMNMMMNMNNNNNNHNMNNNNMNMHMNNMNNMHMNNNNNMHMNNNNNMHMN', 35],
+ ['MHHHMNNNMHHHMNNNMHHHMNMNMHMHMNNNNMMHMMNNNNMHMNMNNMNMNMNNNNMNNNNN', 60],
+ ['NNMMMMNNNMHHHHMNMNMMMHMNNMNNMHMNMNMMMHMNNMHHHMNMNMHHHMMNNNMMMNNN', 31],
+ ['NMHMNNNNNMHMNNNNNMHMNNMNNMMNNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 46],
+ ['NMMMNNMNMHHHMNNNNMMHMMNHNNMHHHMNNNMHHHMNMNNMHHMNNMNNMMNNNNMNNMNN', 15],
+ ['NNNMNNNNNNMHMNNNNNMHMNMNNNNMNNNNNNNNNMNNNNMNNNHNNNNNMNMNNNNNNNNN', 45],
+ ['NNMNNNNNNMHMNNNNNMHMNNMNNMMNNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 46],
+ ['NMHHMNNNNMHHMNNNMMHHMNNNHHHHMMNNMMMMNNMNNNNMNNNNNNMNNMNNNNNNMNNN', 47],
+ ['NMHHHHMNNNMMMMNNNNMMMNNNNMHHMNNMNMHHMNNNNMHHMNNNNNMHHMNNNNNMMNNN', 46],
+ ['HHHMNNNNHHHMNMNNMMMMNNMNNNNNMNNNNMMMNMNNMHHHMNNNNMMMNNNNNNNNNNNN', 60],
+ ['MHMNNNNNMHMNNNNNMHMNNNNNMHHMNNNNNMHMNNNNNNMNHHNNNNNNHHNNNNNNHHNN', 59],
+ ['MHMMNNNNMHHHMNNNMHMMMNNNMHMNNNMNNMMNNNNNNNNNNMNNNNHMNNNNNNNNNNNN', 49],
+ ['NNNHHNNNNNNMNNNNNMMMMMNNMHHHHHMMMHHHHHMNNMHMMMNNNNMNNNNNNNNNMNNN', 2],
+ ['MHHMNNNNMHHMNNNNMHHMMNNNNMMNNNMNNNMNNNNNNNNNNMNNNNNNMNNNNNNMNNNN', 39],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNHMNNNNNMHNNNNNNNHNNN', 59],
+ ['NMMMNNNNMHHHMNNNNMMMMNHNNNNNNNHNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 14],
+ ['MHMNNNNNMHMNMMMNMHMMHHHMMHMNMHMNNMNNMHMNNMNNMMNNNNHNNNNNNNHNNNNN', 59],
+ ['NMHHHHMNMHHHMMNNMHHHMMNNNMMHMNMNNNMHMNNNNNMHMNMNNNNMNMNNNNNNNNNN', 49],
+ ['NNNNNNNNNMHHHNNNNNNNNMNNNNMNNNNNNNNNMMNNNNNMHHMNNNNNMMNNNNNNNNNN', 2],
+ ['MHHHHMNNNMMHHHMNNNMHHHMNNNNMMMNNNHMNNNNNNMNMNNNNNNNNNNNNNNNNNNNN', 25],
+ ['NNMNNNNNNMHMNHNNNMHMHHMNNMHMNMNNNMHMNNNNNNMNNMNNNNNNNNNNNNNNNNNN', 12],
+ ['NMHHHMNNNMHHHMNNNNMMMNNNNNNNNMNNNNNNMNNNNNNMNNNNNNHHNNNNNNNNNNNN', 52],
+ ['NMMMMNNNMHHHHMNNNMMMMNNNNNMNNNNNNNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 41],
+ ['MHHMNNNNMHHMNNNNMHHMNNNHNMHMNNNHNMHMNNMHNNMNNMNNNNNNMNNNNNNNNNNN', 47],
+ ['MHHMMNNNHHHMHMNNHHHMHMNNMMMMHMNNNNNMHMNNNMNNMNNNNNMNNMNNNNNHMNNN', 57],
+ ['MHHHHMNNHHHMMNMNMMHHHMNNNMHHHMNNNNMMMNMNNNNNNMNNNMNMNNMNNNNNNNNN', 31],
+ ['NHNNNNMNNNNMMMHMNNMHHHHMNNMHHHMNNNMHMMNNMMMHMNNMNNMHMNNNNNMHMNNN', 2],
+ ['HHHHHHMNMMMHHHMNNNMMMMMNNNNNNMHMNMNNNMHMNNNMNMHMNNNNNMHMNNNNNNMN', 50],
+ ['NMHHMNMNNMHHMMNNNMHHMHMNNNMMMHMNNNNMHHMNNMNMHHMNNNMMHMNNNMNNMNNN', 32],
+ ['NMMMMNNNMHHHHMNNNMMHHMNNNNMHHMNNNNNMHMMNNMNNMNNNNNNNNMNNNNNNNNNN', 58],
+ ['HHHHMNNNMMMMNMNMNMNNMHMNNNMMMHMNNMHHHHMNNMHHHMNNNNMMMNMNNMNNNNNN', 48],
+ ['NMMMNNNNMHHHMNNNMHHHHMNNNMMMHMNHNNNMHMNNNNNNMNNNNNMNNNMNNNNNNNNN', 30],
+ ['NNMMMNNNNMHHHMNNNMHHHMMNNNMMMNHNNNNNNNHNNNNNNMHNNNNNNNHNNNNNNNNN', 31],
+ ['MHHHHMNNHHMHHHMNMMNMMMNNNNNNNNMNNNMNNNNNNNNNNMNNNNNMNNNNNNNNNNNN', 49],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNNMNNNNNNNNNNNHNNMNNMNMNNNNNNNNNNNNNNNNN', 37],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNNNNNMNNNNNMNNNNNNNNMNNNNNHNNNN', 58],
+ ['NMHMNMNNNMHMMHNNMHHMNMMNMHHMMMNNMHMMHHMNNMNMHHMNNNNMHHMNNNNNMMNN', 14],
+ ['NMHMNNNNNMHMNHMNNMHMNHNNNMHMNNMNNMHHMMNNNMHHMNNNNMHHMNNNNNMMNNNN', 22],
+ ['NMMMNNNNMHHHMNNNMHHHMMNNNMMMMHMNNNNNMHMNNMHNMHMNNMHNMHMNNNMNNMNN', 34],
+ ['MHHHMNNNMHHHMNNNNMHHMNNNNNMMNMNNMNNNMNNNNNNMNNMNNNMNNNNNNNNNNNNN', 39],
+ ['MHHMNNNNMHHMNNMNMHHMMNNNMHHHHMNNNMMMMNNNNNNNNMNNNNNMNNMNNNNNNNNN', 60],
+ ['NNMNNNNNNNNNMMNNNNNMHHMNMNNMHHMNNMMMHHMMNNNMHHMNNNNNMMNNNNMNNNNN', 9],
+ ['NNMHHMNNNNMHHMNNMMMHHMNNHHHHMNNMMMMMNNMNNNNNNMNNNNNNMNNNNNMNNNNN', 49],
+ ['NMHHHMNNNMHMMNNNNMHHMNHHNMHHMNHHNMHMNNMNNNMNMNNNNNNNNNNNNNNNNNNN', 29],
+ ['NNMHHMNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNNMNNNNNNHHNNN', 61],
+ ['NNMHMNNNNMMHMNNNNHMHMMNNNHNMHHMNNHNMHHMNNHNMHHMNNNNNMMNNNNNNNNNN', 49],
+ ['NNMHHMNNNNMHHMNNNNMHMNNNNNMHMNNNNNNMNMNNNNNNNNNNNNMHHHMNNNNNNNNN', 44],
+ ['MHMNNNNNMHMNNNNNMHMNMMNNMHHMMHMNNMMNMHMNNMNNMHMNNHHNMHMNNNNNNMNN', 57],
+ ['MHHHMNNNMHHHMNNNNMHHMNMNNNMMNMHMHNNNNMHMNMNNMMHMNNMNNMHMNNNNNNMN', 24],
+ ['MHHHMNNNMHHHMNNNNMMMNMNNNNMNNNNNNNNHHHNNNNNNMNNNNNNNNNNNNNNNNNNN', 34],
+ ['NMHMNMNNNMHMNNNNNMHMMMMMMHHHHHHHNMMMMHHHNNNNNMMMNMNNMNNNNNMNNMNN', 40],
+ ['MHHHMNNNMHHHMMMNMHMMMHHMMHMNNMMNMHMNNNNNMHMNMNNMNMNNNMNNNNNMNNNN', 35],
+ ['HHHMNNNNHHHMNNNNMMMMNNMNNMNNNNNNNNNNNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 28],
+ ['HHHMNNNNHHHMNNNNMMMNMNNNNNNNNNMNNNMNNNNHNNNNNMNNNNNMNNNNNNNNNNNN', 47],
+ ['MHHMNNNNMHHMNNNNHHHMNNMNHMHHMMNNHMMMNNNNHMNMNNMNMNNNMNNNNNNNNMNN', 39],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNMNMMNNNNHHMNNNNNNMNNNNN', 48],
+ ['MHMMNNNNMHHHMNNNMHHHMNNNNMHHMNNNNNMMNNMNNNNNNMNNNNNMNNNNNNNNMNNN', 31],
+ ['NMHHHHMNNMHHHHMNNMHHHHMNNNMHMMNNNMNMNNMNNNNNNMNNNMNNMNMNNNNNNNNN', 42],
+ ['NMMMMNNNMHHHHMNNMHHHHMNNMHMMMNNNMHMNNNMNNMNNMNNNNNNMNNNNNNNNNNNN', 53],
+ ['NMHHMNNNNMHHMNNNNMHHMNNNNNMMNNMNNNMNNNNNNNMMMMNNNMHHHHMNNNMMMMNN', 23],
+ ['NMHHHMNNNMHHHMNNNMHMMNNMNMHMNNHNMHHMNMNNMHHMNNMNNMMNNMNNNNNNMNNN', 22],
+ ['HHHHMNNNMMHHHMMNNNMMMMHMNNNNNMHMNNMNNNMNNNMNNMNNNNHNNNNNNNNNNNNN', 58],
+ ['HHHHMNNNHHHMNMNNHHHMMNMNMMMNNNNNNNMMMMNNNNMHHHMNNHNMMMNNNNNNNNNN', 48],
+ ['NNMHMNNNNMHHMNNNNMHHMNNNNNMHMNNNNNNMNMNNNNHNNNNNNMHHMNNNNNNNNNNN', 43],
+ ['MHHMNNNNMHHMNNNNMHHMNMNNNMMNNNNNNNNNNNMNNNNNMNNNNNMNNNNNNNNNNNNN', 31],
+ ['NMHHMMMNNMHHHHHMNMHHMMMNNNMHMNNNNMMHMNMNNNMHMHNMNNMHMNMNNMNMNNNN', 53],
+ ['NNNNNNNNNHHNNNNNNMNMMMNNNNMHHHMNNNNMMMNNNNNMNNNNNMNNNMNNNNNNNNNN', 11],
+ ['MHHMNNNNMHHMNMNNMHHMMNHNNMMNNNHNNNMMMMNNNMHHHHMNNNMMMMNNNNNNNNNN', 29],
+ ['NMHHHHMNNNMHHMNNNNMHHMNNNNMHHMNNNMHMMNNNNMHMMNNNNMHMNMNNNNMNNNNN', 38],
+ ['MHHHMNNNMHHHMNNNMHHMMNNNNMMNNNMNNNMNNNNNNNNNNMNNNNNNMNNNNNNMNNNN', 39],
+ ['NNMHMNNNNNMHMNNNNMHHMNNNNMHHMNNNNMHHMNNMNNMMNNMNNNNNNMNNNNNMHNNN', 61],
+ ['HHHMNNNNHHHHMNNNMMMHMNMNNNMHMNNNNNMHMNNNNNNMNMNNNNNMNNMNNNNNNNNN', 41],
+ ['HHHHMNNNHHMMNMMMHHMNMHHHMMMNNMMMNNNHNNNNNNNNMNNNNNMNNNMNNNNNNNNN', 43],
+ ['NMHHHMNNNMHHHMNNNNMMHMNNNNNMHMNNNMNMHHMNNNNMHHMNNMNNMHMNNNNNNMNN', 50],
+ ['NMMMMNNNMHHHHMNMMHHHMNMNNMHHHMNNNMHHHMNNNNMMMNMNNMNNNMNNNNNNNNNN', 60],
+ ['MHHHHMNNNMMMMMMNNNNNMHHMNNMNMHHMMNNNMHHHNNNMNMMHNMNNMNMHNNNNNNNM', 17],
+ ['NMHMNNNNNMHMMNNNNMHHHMNNNMHMMNNHNNMNNNNNNNNNNMNNNMNMNNMNNNNNNNNN', 39],
+ ['NMMMMNNNMHHHHMNMNMMMMMNNMNNMHHMNNMNMHHMNNMNMHHMNMNMHHHMNNNNMMMNN', 6],
+ ['NNMMMMNNNMHHHHMNNNMMMMNNNMMMNNNNMHHHMNNNMHHHMNNNNMMMNHMNNNNNNNNN', 45],
+ ['MHMNNNNNMHMNNMNNMHMNMNNMMHMNNHNNNMMNMMMNNNNMHHHMNNNMHHHMNNNNMMMN', 30],
+ ['NMNNNNNNNNMNNMMNNMNNMHHMMNMMMHHMNMHHHHHMMHHHHMMNNMMMMNNNNNNNNMNN', 4],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNHNNNMNNNHNNNNNNMHNNNNNNNMNNNNNNNNN', 22],
+ ['NMHMMHMNNMHHHHMNNMHHHMNNNMHHHMNNNNMMMNNNMNNNMNMNNMNNNMNNNNMNNNNN', 39],
+ ['NMNNMNNNNNMNNNNNMNNMNMMMNMMMMHHHMHHHHHHHNMMMMMMMNNNNNMNNNNNNNNNN', 60],
+ ['NNMNNNNNNMHMNNMNNMHHMNHNNMHHMHHNNMHHMNMNNNMMNNMNNNNNNNNNNNNNNNNN', 21],
+ ['MHHHHMNNMHHMMNNNMHHMMMNNNMHHHHMNNNMMMMNNNMNNMNNMNNMNNNMNNNNNNMNN', 23],
+ ['HHHMNNNNHHHMNMNNMMMMNNNNNNNMHNNNMMMNNMNNHHHMNNNNMMMNNNNNNNNNNNNN', 20],
+ ['NMHHMNNNNMHHMNMNNMHHMMHMNNMMNMHMMNNNNMHMNNNNMHHMNHNNNMMNNNNMNNNN', 33],
+ ['NNMNNNNNNMHMNNNNNMHMNNMNNMHMNNNNNMHMNMNNNNMNNNNNNNNNMNNNNNNNNNNN', 46],
+ ['NNMHNNNNNNNMNMMNNNNNMHHMNMNNMHHMNNMNMHHMNNNMNMMNNNNNNNNNNNNNNNNN', 4],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMMMNNNNNMNNNMNNNNNNMNNNNHHHNNNNNNNNNNN', 49],
+ ['NNMMMNNNNMHHHMNNNMHHHMNNNNMHHHMNMNMMMMNNNMNNNNNNNNNNMNNNNNNHHNNN', 61],
+ ['NMHMNNNNNMHMNMNNNMHMNNNNNMHMMMMNNMHHHHHMNNMMMMMNNMNNHHNNNNNNNHNN', 60]]
+# <<< END GENERATED: opening book
+
+# >>> BEGIN GENERATED: fleet table (python3 fleet_layout_evaluator.py) - do not edit by hand
+FLEET_TABLE: Dict[str, Any] = {'expected_shots': [53.03, 52.74, 53.07, 53.15, 52.74, 52.75, 52.64, 53.22, 52.84, 53.25, 52.64,
+                    53.58, 53.22, 53.03, 53.01, 53.03, 52.72, 52.87, 52.94, 52.92, 52.81, 52.61,
+                    52.98, 52.43, 52.82, 52.48, 52.41, 51.96, 52.67, 52.29, 52.58, 51.96, 51.73,
+                    52.55, 52.41, 52.42, 52.98, 53.08, 52.54, 52.37, 52.68, 52.44, 52.42, 52.03,
+                    52.21, 51.85, 52.6, 51.93, 52.17, 52.13, 52.56, 52.58, 52.05, 51.7, 52.21,
+                    51.97, 52.07, 52.23, 51.84, 52.82, 51.79, 51.79, 52.07, 51.77, 52.17, 52.72,
+                    52.17, 52.03, 51.52, 52.43, 52.2, 51.63, 52.01, 51.74, 52.57, 52.24, 52.34,
+                    52.4, 51.76, 52.02, 51.78, 52.36, 52.16, 52.01, 51.38, 51.81, 51.98, 51.86,
+                    52.02, 51.74, 52.12, 51.85, 52.02, 52.41, 52.41, 51.72, 52.08, 51.89, 52.03,
+                    51.99, 51.54, 51.92, 51.67, 52.12, 51.39, 51.9, 51.76, 52.3, 51.91, 52.1, 51.65,
+                    52.14, 51.74, 51.61, 51.49, 51.32, 51.48, 51.68, 51.18, 51.65, 51.75, 51.62,
+                    51.41, 51.7, 51.81, 51.7, 51.38, 51.78, 51.31, 51.95, 51.81, 51.24, 51.83,
+                    51.76, 51.78, 51.55, 51.62, 51.75, 51.99, 51.89, 52.0, 52.09, 52.15, 51.31,
+                    52.45, 51.76, 51.7, 51.95, 51.52, 52.21, 51.69, 51.83, 51.66, 51.34, 51.41,
+                    52.14, 51.61, 51.22, 51.98, 51.36, 52.06, 51.55, 51.81, 51.71, 51.33, 51.36,
+                    51.69, 52.14, 51.71, 51.37, 51.99, 51.66, 51.87, 51.86, 51.05, 51.92, 51.5,
+                    50.92, 51.3, 51.93, 51.52, 51.55, 51.95, 50.68, 51.29, 51.32, 50.97, 51.4,
+                    51.19, 51.23, 51.47, 51.51, 51.29, 51.34, 51.66, 51.88, 51.67, 51.48, 52.09,
+                    51.02],
+ 'layouts': [[['ship_1x4', 1, 5, 'V'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 2, 1, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 3, 1, 'V'], ['ship_1x3', 1, 2, 'H'], ['ship_2x3', 3, 4, 'V'],
+              ['ship_1x2', 1, 6, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 2, 2, 'H'], ['ship_2x3', 5, 2, 'V'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 4, 6, 'V'], ['ship_1x3', 1, 2, 'H'], ['ship_2x3', 4, 2, 'V'],
+              ['ship_1x2', 2, 1, 'V']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 0, 2, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 5, 2, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 5, 6, 'V'], ['ship_2x3', 1, 4, 'V'],
+              ['ship_1x2', 6, 1, 'V']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 5, 2, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 1, 5, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 4, 1, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 4, 3, 'V'],
+              ['ship_1x2', 2, 2, 'V']],
+             [['ship_1x4', 4, 2, 'V'], ['ship_1x3', 1, 2, 'H'], ['ship_2x3', 4, 5, 'V'],
+              ['ship_1x2', 1, 6, 'V']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 1, 1, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 2, 2, 'H'], ['ship_2x3', 5, 0, 'H'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 5, 5, 'V'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 1, 0, 'H'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 3, 4, 'H'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 5, 1, 'H'], ['ship_1x3', 2, 6, 'V'], ['ship_2x3', 1, 1, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 0, 4, 'V'], ['ship_1x3', 3, 2, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 3, 7, 'V']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 5, 1, 'H'], ['ship_2x3', 5, 5, 'H'],
+              ['ship_1x2', 7, 3, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 1, 5, 'H'], ['ship_2x3', 5, 2, 'H'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 4, 0, 'H'], ['ship_1x3', 2, 4, 'H'], ['ship_2x3', 5, 5, 'H'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 1, 2, 'H'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 4, 4, 'V'],
+              ['ship_1x2', 2, 6, 'V']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 3, 3, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 4, 5, 'V'], ['ship_1x3', 2, 2, 'H'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 2, 6, 'V']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 5, 0, 'H'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 2, 3, 'H'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 5, 5, 'V']],
+             [['ship_1x4', 6, 1, 'H'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 2, 5, 'V'],
+              ['ship_1x2', 6, 7, 'V']],
+             [['ship_1x4', 4, 6, 'V'], ['ship_1x3', 1, 2, 'H'], ['ship_2x3', 4, 0, 'H'],
+              ['ship_1x2', 1, 6, 'V']],
+             [['ship_1x4', 1, 3, 'H'], ['ship_1x3', 5, 1, 'V'], ['ship_2x3', 5, 3, 'H'],
+              ['ship_1x2', 3, 6, 'V']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 5, 2, 'H'], ['ship_2x3', 1, 0, 'H'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 6, 3, 'H'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 1, 0, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 1, 4, 'H'], ['ship_1x3', 4, 2, 'V'], ['ship_2x3', 4, 4, 'H'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 1, 0, 'H'], ['ship_2x3', 4, 3, 'V'],
+              ['ship_1x2', 4, 0, 'H']],
+             [['ship_1x4', 2, 3, 'H'], ['ship_1x3', 3, 1, 'V'], ['ship_2x3', 4, 3, 'V'],
+              ['ship_1x2', 0, 6, 'H']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 6, 1, 'H']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 6, 0, 'H'], ['ship_2x3', 1, 1, 'V'],
+              ['ship_1x2', 5, 7, 'V']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 3, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 1, 5, 'V'], ['ship_1x3', 4, 3, 'V'], ['ship_2x3', 0, 1, 'V'],
+              ['ship_1x2', 6, 0, 'V']],
+             [['ship_1x4', 6, 3, 'H'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 0, 4, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 3, 'V'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 7, 1, 'H'], ['ship_1x3', 2, 6, 'V'], ['ship_2x3', 2, 2, 'V'],
+              ['ship_1x2', 0, 2, 'H']],
+             [['ship_1x4', 1, 0, 'H'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 1, 5, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 1, 3, 'H'], ['ship_1x3', 4, 2, 'V'], ['ship_2x3', 3, 4, 'H'],
+              ['ship_1x2', 7, 3, 'H']],
+             [['ship_1x4', 1, 1, 'H'], ['ship_1x3', 6, 5, 'H'], ['ship_2x3', 4, 1, 'V'],
+              ['ship_1x2', 0, 5, 'H']],
+             [['ship_1x4', 4, 5, 'V'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 2, 1, 'H'],
+              ['ship_1x2', 1, 5, 'V']],
+             [['ship_1x4', 4, 5, 'V'], ['ship_1x3', 5, 1, 'H'], ['ship_2x3', 1, 2, 'H'],
+              ['ship_1x2', 7, 2, 'H']],
+             [['ship_1x4', 3, 3, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 1, 5, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 3, 3, 'H'], ['ship_1x3', 1, 0, 'H'], ['ship_2x3', 5, 2, 'V'],
+              ['ship_1x2', 6, 0, 'V']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 6, 0, 'H'], ['ship_2x3', 3, 3, 'H'],
+              ['ship_1x2', 0, 4, 'V']],
+             [['ship_1x4', 3, 2, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 5, 'H'],
+              ['ship_1x2', 1, 1, 'V']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 5, 4, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 6, 3, 'H'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 1, 0, 'H'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 3, 5, 'V'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 1, 0, 'H'], ['ship_1x3', 3, 3, 'H'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 4, 6, 'V']],
+             [['ship_1x4', 6, 3, 'H'], ['ship_1x3', 3, 5, 'H'], ['ship_2x3', 0, 2, 'V'],
+              ['ship_1x2', 6, 0, 'H']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 6, 3, 'H'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 6, 0, 'H'], ['ship_1x3', 4, 5, 'V'], ['ship_2x3', 1, 1, 'H'],
+              ['ship_1x2', 3, 6, 'H']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 5, 5, 'V'],
+              ['ship_1x2', 2, 6, 'V']],
+             [['ship_1x4', 0, 5, 'V'], ['ship_1x3', 5, 6, 'V'], ['ship_2x3', 4, 2, 'V'],
+              ['ship_1x2', 1, 2, 'V']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 4, 7, 'V'], ['ship_2x3', 4, 3, 'V'],
+              ['ship_1x2', 1, 6, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 5, 2, 'H'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 3, 2, 'V'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 4, 6, 'V'],
+              ['ship_1x2', 1, 6, 'V']],
+             [['ship_1x4', 7, 0, 'H'], ['ship_1x3', 1, 0, 'H'], ['ship_2x3', 3, 2, 'H'],
+              ['ship_1x2', 0, 4, 'V']],
+             [['ship_1x4', 0, 2, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 6, 1, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 2, 2, 'H'], ['ship_2x3', 4, 2, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 1, 5, 'H'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 7, 4, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 1, 3, 'V'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 1, 0, 'H']],
+             [['ship_1x4', 1, 3, 'H'], ['ship_1x3', 5, 2, 'H'], ['ship_2x3', 4, 6, 'V'],
+              ['ship_1x2', 4, 0, 'H']],
+             [['ship_1x4', 1, 7, 'V'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 4, 3, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 2, 2, 'V'],
+              ['ship_1x2', 1, 5, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 2, 0, 'H'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 1, 7, 'V']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 4, 1, 'H'], ['ship_2x3', 6, 3, 'H'],
+              ['ship_1x2', 6, 1, 'V']],
+             [['ship_1x4', 7, 2, 'H'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 2, 1, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 2, 6, 'V'], ['ship_2x3', 5, 3, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 4, 1, 'V'], ['ship_1x3', 2, 2, 'H'], ['ship_2x3', 5, 4, 'V'],
+              ['ship_1x2', 2, 6, 'V']],
+             [['ship_1x4', 1, 5, 'V'], ['ship_1x3', 1, 2, 'V'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 4, 'V'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 3, 5, 'V'], ['ship_1x3', 6, 0, 'H'], ['ship_2x3', 1, 2, 'H'],
+              ['ship_1x2', 1, 6, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 2, 1, 'H'], ['ship_2x3', 5, 0, 'H'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 2, 3, 'V'], ['ship_2x3', 6, 4, 'H'],
+              ['ship_1x2', 1, 1, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 6, 2, 'H'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 4, 0, 'H'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 3, 5, 'V'],
+              ['ship_1x2', 0, 6, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 1, 2, 'V'], ['ship_2x3', 5, 2, 'V'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 3, 0, 'V'], ['ship_2x3', 2, 3, 'V'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 2, 6, 'V'], ['ship_1x3', 0, 2, 'V'], ['ship_2x3', 5, 3, 'V'],
+              ['ship_1x2', 0, 6, 'H']],
+             [['ship_1x4', 2, 0, 'H'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 1, 6, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 5, 3, 'H'], ['ship_1x3', 1, 4, 'V'], ['ship_2x3', 1, 1, 'V'],
+              ['ship_1x2', 0, 5, 'H']],
+             [['ship_1x4', 2, 0, 'V'], ['ship_1x3', 4, 6, 'V'], ['ship_2x3', 1, 3, 'V'],
+              ['ship_1x2', 7, 4, 'H']],
+             [['ship_1x4', 2, 0, 'H'], ['ship_1x3', 4, 6, 'V'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 0, 4, 'H']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 4, 4, 'H'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 0, 5, 'V'],
+              ['ship_1x2', 6, 7, 'V']],
+             [['ship_1x4', 6, 3, 'H'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 3, 1, 'V'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 7, 3, 'H'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 6, 6, 'H']],
+             [['ship_1x4', 1, 4, 'H'], ['ship_1x3', 0, 1, 'V'], ['ship_2x3', 6, 2, 'H'],
+              ['ship_1x2', 6, 7, 'V']],
+             [['ship_1x4', 0, 4, 'V'], ['ship_1x3', 1, 2, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 2, 6, 'V']],
+             [['ship_1x4', 1, 1, 'H'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 6, 1, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 6, 1, 'H'], ['ship_1x3', 2, 5, 'V'], ['ship_2x3', 2, 1, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 2, 1, 'H'],
+              ['ship_1x2', 1, 5, 'V']],
+             [['ship_1x4', 0, 5, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 4, 2, 'V'],
+              ['ship_1x2', 5, 5, 'V']],
+             [['ship_1x4', 6, 0, 'H'], ['ship_1x3', 5, 5, 'H'], ['ship_2x3', 1, 4, 'V'],
+              ['ship_1x2', 2, 7, 'V']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 2, 1, 'H'], ['ship_2x3', 4, 3, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 2, 0, 'V'], ['ship_1x3', 6, 5, 'H'], ['ship_2x3', 2, 3, 'V'],
+              ['ship_1x2', 7, 3, 'H']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 5, 5, 'V'], ['ship_2x3', 0, 3, 'V'],
+              ['ship_1x2', 0, 6, 'V']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 3, 4, 'H'],
+              ['ship_1x2', 1, 7, 'V']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 6, 4, 'H'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 0, 5, 'V'],
+              ['ship_1x2', 6, 1, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 3, 0, 'H'], ['ship_2x3', 5, 2, 'H'],
+              ['ship_1x2', 0, 6, 'V']],
+             [['ship_1x4', 5, 1, 'H'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 0, 2, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 3, 3, 'H'], ['ship_1x3', 1, 3, 'H'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 3, 0, 'V']],
+             [['ship_1x4', 0, 4, 'V'], ['ship_1x3', 5, 6, 'V'], ['ship_2x3', 2, 1, 'V'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 4, 3, 'H'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 3, 2, 'V'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 1, 5, 'V'],
+              ['ship_1x2', 5, 5, 'H']],
+             [['ship_1x4', 2, 3, 'H'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 5, 4, 'V'],
+              ['ship_1x2', 6, 1, 'H']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 4, 3, 'V'], ['ship_2x3', 4, 6, 'V'],
+              ['ship_1x2', 2, 4, 'V']],
+             [['ship_1x4', 1, 0, 'H'], ['ship_1x3', 3, 1, 'V'], ['ship_2x3', 5, 5, 'H'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 0, 2, 'H'], ['ship_2x3', 3, 3, 'V'],
+              ['ship_1x2', 0, 0, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 1, 0, 'V'], ['ship_2x3', 1, 3, 'H'],
+              ['ship_1x2', 5, 0, 'V']],
+             [['ship_1x4', 6, 2, 'H'], ['ship_1x3', 1, 7, 'V'], ['ship_2x3', 1, 3, 'V'],
+              ['ship_1x2', 0, 1, 'V']],
+             [['ship_1x4', 3, 0, 'H'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 1, 1, 'H']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 4, 4, 'H'], ['ship_2x3', 1, 5, 'H'],
+              ['ship_1x2', 5, 7, 'V']],
+             [['ship_1x4', 2, 1, 'V'], ['ship_1x3', 7, 3, 'H'], ['ship_2x3', 2, 4, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 4, 4, 'V'],
+              ['ship_1x2', 5, 2, 'V']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 2, 1, 'H'], ['ship_2x3', 4, 2, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 4, 3, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 4, 1, 'V'], ['ship_1x3', 6, 5, 'H'], ['ship_2x3', 1, 6, 'V'],
+              ['ship_1x2', 1, 1, 'V']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 0, 6, 'V'], ['ship_2x3', 6, 1, 'H'],
+              ['ship_1x2', 0, 0, 'H']],
+             [['ship_1x4', 6, 0, 'H'], ['ship_1x3', 2, 1, 'H'], ['ship_2x3', 1, 6, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 3, 0, 'V'], ['ship_1x3', 0, 2, 'V'], ['ship_2x3', 2, 5, 'V'],
+              ['ship_1x2', 0, 7, 'V']],
+             [['ship_1x4', 2, 0, 'H'], ['ship_1x3', 3, 6, 'V'], ['ship_2x3', 5, 0, 'V'],
+              ['ship_1x2', 0, 0, 'H']],
+             [['ship_1x4', 1, 2, 'H'], ['ship_1x3', 5, 3, 'V'], ['ship_2x3', 4, 5, 'V'],
+              ['ship_1x2', 0, 0, 'V']],
+             [['ship_1x4', 3, 4, 'V'], ['ship_1x3', 2, 6, 'V'], ['ship_2x3', 4, 0, 'V'],
+              ['ship_1x2', 2, 2, 'H']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 3, 3, 'H']],
+             [['ship_1x4', 2, 7, 'V'], ['ship_1x3', 5, 2, 'H'], ['ship_2x3', 1, 1, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 4, 3, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 4, 6, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 3, 2, 'V'], ['ship_1x3', 2, 4, 'H'], ['ship_2x3', 4, 5, 'V'],
+              ['ship_1x2', 1, 1, 'H']],
+             [['ship_1x4', 5, 3, 'H'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 1, 6, 'V'],
+              ['ship_1x2', 6, 1, 'H']],
+             [['ship_1x4', 1, 3, 'H'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 3, 4, 'V'],
+              ['ship_1x2', 5, 2, 'V']],
+             [['ship_1x4', 6, 0, 'H'], ['ship_1x3', 2, 5, 'V'], ['ship_2x3', 1, 0, 'V'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 0, 4, 'V'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 5, 4, 'H'],
+              ['ship_1x2', 2, 6, 'V']],
+             [['ship_1x4', 3, 6, 'V'], ['ship_1x3', 6, 0, 'H'], ['ship_2x3', 0, 3, 'V'],
+              ['ship_1x2', 1, 7, 'V']],
+             [['ship_1x4', 0, 2, 'V'], ['ship_1x3', 5, 1, 'H'], ['ship_2x3', 1, 5, 'H'],
+              ['ship_1x2', 5, 5, 'V']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 5, 5, 'V'],
+              ['ship_1x2', 6, 2, 'H']],
+             [['ship_1x4', 2, 5, 'V'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 3, 0, 'V']],
+             [['ship_1x4', 6, 2, 'H'], ['ship_1x3', 1, 0, 'H'], ['ship_2x3', 3, 5, 'H'],
+              ['ship_1x2', 2, 3, 'H']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 5, 5, 'H'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 0, 0, 'H']],
+             [['ship_1x4', 6, 4, 'H'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 3, 1, 'V'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 3, 1, 'H'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 5, 0, 'H'],
+              ['ship_1x2', 1, 5, 'V']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 6, 4, 'H'], ['ship_2x3', 5, 0, 'V'],
+              ['ship_1x2', 0, 0, 'V']],
+             [['ship_1x4', 1, 6, 'V'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 6, 3, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 3, 4, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 5, 0, 'V'],
+              ['ship_1x2', 2, 5, 'H']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 1, 2, 'V'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 1, 3, 'H'], ['ship_1x3', 4, 6, 'V'], ['ship_2x3', 3, 0, 'V'],
+              ['ship_1x2', 3, 3, 'V']],
+             [['ship_1x4', 5, 3, 'H'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 1, 5, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 1, 2, 'H'], ['ship_1x3', 4, 6, 'V'], ['ship_2x3', 3, 2, 'V'],
+              ['ship_1x2', 0, 0, 'V']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 2, 6, 'V'], ['ship_2x3', 6, 1, 'H'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 7, 4, 'H'], ['ship_2x3', 1, 5, 'H'],
+              ['ship_1x2', 5, 0, 'H']],
+             [['ship_1x4', 1, 2, 'H'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 4, 4, 'V'],
+              ['ship_1x2', 5, 2, 'V']],
+             [['ship_1x4', 5, 1, 'H'], ['ship_1x3', 0, 1, 'V'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 2, 5, 'V'], ['ship_1x3', 5, 1, 'H'], ['ship_2x3', 1, 1, 'H'],
+              ['ship_1x2', 7, 5, 'H']],
+             [['ship_1x4', 4, 3, 'H'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 0, 4, 'H'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 5, 7, 'V'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 4, 5, 'V']],
+             [['ship_1x4', 5, 3, 'H'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 2, 4, 'H'],
+              ['ship_1x2', 6, 1, 'H']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 5, 3, 'H'], ['ship_2x3', 0, 4, 'V'],
+              ['ship_1x2', 7, 3, 'H']],
+             [['ship_1x4', 2, 4, 'H'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 5, 4, 'V'],
+              ['ship_1x2', 1, 0, 'H']],
+             [['ship_1x4', 5, 0, 'H'], ['ship_1x3', 4, 6, 'V'], ['ship_2x3', 1, 5, 'H'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 3, 1, 'V'], ['ship_1x3', 0, 4, 'V'], ['ship_2x3', 3, 5, 'V'],
+              ['ship_1x2', 1, 6, 'H']],
+             [['ship_1x4', 1, 3, 'V'], ['ship_1x3', 4, 5, 'V'], ['ship_2x3', 6, 1, 'H'],
+              ['ship_1x2', 0, 0, 'V']],
+             [['ship_1x4', 6, 1, 'H'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 1, 0, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 3, 0, 'V'], ['ship_1x3', 6, 4, 'H'], ['ship_2x3', 1, 4, 'V'],
+              ['ship_1x2', 0, 0, 'V']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 2, 4, 'V'], ['ship_2x3', 6, 3, 'H'],
+              ['ship_1x2', 6, 1, 'V']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 1, 2, 'V'],
+              ['ship_1x2', 5, 5, 'H']],
+             [['ship_1x4', 5, 1, 'H'], ['ship_1x3', 2, 5, 'V'], ['ship_2x3', 1, 0, 'H'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 2, 6, 'V'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 2, 3, 'V'],
+              ['ship_1x2', 5, 2, 'V']],
+             [['ship_1x4', 2, 6, 'V'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 3, 2, 'H'],
+              ['ship_1x2', 6, 2, 'H']],
+             [['ship_1x4', 0, 1, 'V'], ['ship_1x3', 2, 5, 'V'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 2, 4, 'V'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 3, 6, 'V'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 4, 1, 'V'], ['ship_1x3', 3, 3, 'V'], ['ship_2x3', 4, 6, 'V'],
+              ['ship_1x2', 2, 5, 'V']],
+             [['ship_1x4', 6, 0, 'H'], ['ship_1x3', 1, 1, 'H'], ['ship_2x3', 4, 5, 'H'],
+              ['ship_1x2', 1, 5, 'V']],
+             [['ship_1x4', 4, 5, 'V'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 1, 6, 'V'],
+              ['ship_1x2', 1, 2, 'H']],
+             [['ship_1x4', 4, 3, 'H'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 0, 1, 'V'],
+              ['ship_1x2', 5, 2, 'V']],
+             [['ship_1x4', 4, 1, 'H'], ['ship_1x3', 6, 5, 'H'], ['ship_2x3', 1, 0, 'H'],
+              ['ship_1x2', 7, 3, 'H']],
+             [['ship_1x4', 5, 0, 'H'], ['ship_1x3', 2, 2, 'H'], ['ship_2x3', 3, 6, 'V'],
+              ['ship_1x2', 1, 5, 'H']],
+             [['ship_1x4', 4, 7, 'V'], ['ship_1x3', 1, 5, 'V'], ['ship_2x3', 5, 1, 'H'],
+              ['ship_1x2', 2, 1, 'V']],
+             [['ship_1x4', 4, 6, 'V'], ['ship_1x3', 3, 3, 'V'], ['ship_2x3', 2, 0, 'V'],
+              ['ship_1x2', 7, 0, 'H']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 6, 4, 'H'], ['ship_2x3', 2, 0, 'V'],
+              ['ship_1x2', 2, 3, 'V']],
+             [['ship_1x4', 4, 3, 'V'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 4, 5, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 2, 1, 'H'], ['ship_1x3', 2, 6, 'V'], ['ship_2x3', 6, 1, 'H'],
+              ['ship_1x2', 6, 5, 'H']],
+             [['ship_1x4', 4, 3, 'H'], ['ship_1x3', 3, 1, 'V'], ['ship_2x3', 0, 6, 'V'],
+              ['ship_1x2', 0, 3, 'V']],
+             [['ship_1x4', 2, 0, 'H'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 1, 5, 'V'],
+              ['ship_1x2', 4, 0, 'V']],
+             [['ship_1x4', 1, 2, 'H'], ['ship_1x3', 3, 2, 'H'], ['ship_2x3', 5, 1, 'V'],
+              ['ship_1x2', 6, 6, 'H']],
+             [['ship_1x4', 6, 3, 'H'], ['ship_1x3', 1, 2, 'V'], ['ship_2x3', 0, 5, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 4, 6, 'V'], ['ship_1x3', 2, 2, 'V'], ['ship_2x3', 1, 4, 'H'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 1, 3, 'H'], ['ship_2x3', 5, 2, 'H'],
+              ['ship_1x2', 7, 6, 'H']],
+             [['ship_1x4', 4, 2, 'V'], ['ship_1x3', 0, 3, 'V'], ['ship_2x3', 4, 5, 'V'],
+              ['ship_1x2', 2, 5, 'H']],
+             [['ship_1x4', 1, 2, 'V'], ['ship_1x3', 6, 1, 'H'], ['ship_2x3', 1, 5, 'V'],
+              ['ship_1x2', 5, 5, 'H']],
+             [['ship_1x4', 7, 4, 'H'], ['ship_1x3', 1, 6, 'V'], ['ship_2x3', 3, 3, 'V'],
+              ['ship_1x2', 1, 2, 'V']],
+             [['ship_1x4', 0, 6, 'V'], ['ship_1x3', 1, 2, 'V'], ['ship_2x3', 6, 2, 'H'],
+              ['ship_1x2', 6, 7, 'V']],
+             [['ship_1x4', 1, 1, 'V'], ['ship_1x3', 6, 2, 'H'], ['ship_2x3', 0, 4, 'V'],
+              ['ship_1x2', 5, 6, 'V']],
+             [['ship_1x4', 6, 4, 'H'], ['ship_1x3', 1, 2, 'H'], ['ship_2x3', 2, 5, 'V'],
+              ['ship_1x2', 2, 1, 'V']],
+             [['ship_1x4', 2, 3, 'H'], ['ship_1x3', 1, 1, 'V'], ['ship_2x3', 5, 5, 'V'],
+              ['ship_1x2', 5, 1, 'V']],
+             [['ship_1x4', 2, 6, 'V'], ['ship_1x3', 2, 1, 'V'], ['ship_2x3', 6, 3, 'H'],
+              ['ship_1x2', 1, 2, 'H']]],
+ 'prefixes': {'': [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21,
+                    22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41,
+                    42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61,
+                    62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81,
+                    82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100,
+                    101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+                    117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132,
+                    133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148,
+                    149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+                    165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180,
+                    181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196,
+                    197, 198, 199],
+                   [1.0, 0.958523, 0.753547, 0.620914, 0.689496, 0.858222, 0.849755, 0.952051,
+                    0.978926, 0.758782, 0.978783, 0.91764, 0.86008, 0.8069, 0.422712, 0.56948,
+                    0.919286, 0.719114, 0.535445, 0.836441, 0.75748, 0.849727, 0.963982, 0.855277,
+                    0.528314, 0.671187, 0.651928, 0.830392, 0.712365, 0.710828, 0.944053, 0.830392,
+                    0.660325, 0.900518, 0.412453, 0.984313, 0.677922, 0.557785, 0.901197, 0.420862,
+                    0.944902, 0.827979, 0.494086, 0.883948, 0.750109, 0.740492, 0.689403, 0.804844,
+                    0.814702, 0.980993, 0.791971, 0.817639, 0.90727, 0.640009, 0.890158, 0.839088,
+                    0.921557, 0.829452, 0.732819, 0.74076, 0.699261, 0.695628, 0.921557, 0.681286,
+                    0.882464, 0.865046, 0.572838, 0.883948, 0.530586, 0.550107, 0.801224, 0.595002,
+                    0.865723, 0.663773, 0.751509, 0.78532, 0.685229, 0.866314, 0.674226, 0.879356,
+                    0.68842, 0.826829, 0.972862, 0.865723, 0.463388, 0.710272, 0.843469, 0.752153,
+                    0.879356, 0.663773, 0.975897, 0.744359, 0.879356, 0.960729, 0.661125, 0.650087,
+                    0.931207, 0.767987, 0.883948, 0.856752, 0.541756, 0.792366, 0.620318, 0.975897,
+                    0.465808, 0.776029, 0.674226, 0.904059, 0.784155, 0.950811, 0.604372, 0.991265,
+                    0.663773, 0.585778, 0.519646, 0.435313, 0.51159, 0.626813, 0.378206, 0.607528,
+                    0.670723, 0.591911, 0.475614, 0.640009, 0.710272, 0.640009, 0.460981, 0.68842,
+                    0.433052, 0.821787, 0.713981, 0.404701, 0.729012, 0.674226, 0.692014, 0.547428,
+                    0.588836, 0.670723, 0.852301, 0.771998, 0.861226, 0.945872, 0.996441, 0.433052,
+                    0.739102, 0.674226, 0.636684, 0.817518, 0.530586, 0.384203, 0.630086, 0.725225,
+                    0.61389, 0.444477, 0.478098, 0.991265, 0.582735, 0.394298, 0.847874, 0.453834,
+                    0.912008, 0.550287, 0.710272, 0.643351, 0.442168, 0.453834, 0.630086, 0.991265,
+                    0.64671, 0.458586, 0.856752, 0.61389, 0.756081, 0.752153, 0.332032, 0.796504,
+                    0.52236, 0.293017, 0.426338, 0.800663, 0.533357, 0.547428, 0.817518, 0.229394,
+                    0.42192, 0.437586, 0.30708, 0.470685, 0.384162, 0.398427, 0.508932, 0.525088,
+                    0.42192, 0.446798, 0.610701, 0.760029, 0.620318, 0.51159, 0.945872, 0.323497],
+                   [0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21,
+                    22, 23, 24, 25, 0, 26, 28, 29, 0, 0, 30, 33, 34, 35, 36, 37, 38, 39, 40, 41, 0,
+                    42, 0, 44, 0, 46, 0, 48, 50, 0, 1, 51, 1, 1, 54, 2, 57, 2, 2, 2, 2, 59, 64, 65,
+                    2, 3, 66, 69, 3, 3, 3, 70, 74, 75, 76, 3, 3, 4, 77, 81, 4, 4, 5, 5, 5, 5, 6, 6,
+                    6, 6, 82, 93, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8, 8, 9, 94, 9, 9, 9, 9, 9, 9, 9, 10,
+                    11, 11, 11, 11, 11, 11, 11, 12, 12, 12, 12, 12, 13, 13, 13, 14, 14, 14, 14, 15,
+                    15, 15, 15, 15, 15, 15, 15, 16, 107, 17, 17, 17, 18, 144, 18, 18, 18, 19, 19,
+                    19, 20, 20, 21, 21, 22, 22, 22, 22, 24, 24, 25, 25, 26, 28, 28, 29, 30, 30, 34,
+                    34, 36, 36, 37, 37, 37, 37, 37, 39, 40, 42, 46, 50, 51, 59, 59, 65, 69, 74, 76,
+                    77, 81, 94, 94, 149]],
+              'ship_1x3:01,11,21|ship_1x4:14,15,16,17': [[92], [1.0], [0]],
+              'ship_1x3:01,11,21|ship_1x4:14,15,16,17|ship_2x3:62,63,64,72,73,74': [[92], [1.0],
+                                                                                    [0]],
+              'ship_1x3:01,11,21|ship_1x4:51,52,53,54': [[156], [1.0], [0]],
+              'ship_1x3:01,11,21|ship_1x4:51,52,53,54|ship_2x3:14,15,16,24,25,26': [[156], [1.0],
+                                                                                    [0]],
+              'ship_1x3:02,03,04|ship_1x4:36,46,56,66': [[114], [1.0], [0]],
+              'ship_1x3:02,03,04|ship_1x4:36,46,56,66|ship_2x3:33,34,43,44,53,54': [[114], [1.0],
+                                                                                    [0]],
+              'ship_1x3:02,12,22|ship_1x4:26,36,46,56': [[83], [1.0], [0]],
+              'ship_1x3:02,12,22|ship_1x4:26,36,46,56|ship_2x3:53,54,63,64,73,74': [[83], [1.0],
+                                                                                    [0]],
+              'ship_1x3:02,12,22|ship_1x4:30,40,50,60': [[126], [1.0], [0]],
+              'ship_1x3:02,12,22|ship_1x4:30,40,50,60|ship_2x3:25,26,35,36,45,46': [[126], [1.0],
+                                                                                    [0]],
+              'ship_1x3:03,13,23|ship_1x4:42,52,62,72': [[192], [1.0], [0]],
+              'ship_1x3:03,13,23|ship_1x4:42,52,62,72|ship_2x3:45,46,55,56,65,66': [[192], [1.0],
+                                                                                    [0]],
+              'ship_1x3:04,14,24|ship_1x4:31,41,51,61': [[164], [1.0], [0]],
+              'ship_1x3:04,14,24|ship_1x4:31,41,51,61|ship_2x3:35,36,45,46,55,56': [[164], [1.0],
+                                                                                    [0]],
+              'ship_1x3:06,16,26|ship_1x4:12,22,32,42': [[124], [1.0], [0]],
+              'ship_1x3:06,16,26|ship_1x4:12,22,32,42|ship_2x3:61,62,63,71,72,73': [[124], [1.0],
+                                                                                    [0]],
+              'ship_1x3:10,11,12|ship_1x4:16,26,36,46': [[31], [1.0], [0]],
+              'ship_1x3:10,11,12|ship_1x4:16,26,36,46|ship_2x3:43,44,53,54,63,64': [[31], [1.0],
+                                                                                    [0]],
+              'ship_1x3:10,11,12|ship_1x4:33,34,35,36': [[46], [1.0], [0]],
+              'ship_1x3:10,11,12|ship_1x4:33,34,35,36|ship_2x3:52,53,62,63,72,73': [[46], [1.0],
+                                                                                    [0]],
+              'ship_1x3:10,11,12|ship_1x4:62,63,64,65': [[142], [1.0], [0]],
+              'ship_1x3:10,11,12|ship_1x4:62,63,64,65|ship_2x3:35,36,37,45,46,47': [[142], [1.0],
+                                                                                    [0]],
+              'ship_1x3:10,11,12|ship_1x4:70,71,72,73': [[61], [1.0], [0]],
+              'ship_1x3:10,11,12|ship_1x4:70,71,72,73|ship_2x3:32,33,34,42,43,44': [[61], [1.0],
+                                                                                    [0]],
+              'ship_1x3:10,20,30|ship_1x4:36,46,56,66': [[115], [1.0], [0]],
+              'ship_1x3:10,20,30|ship_1x4:36,46,56,66|ship_2x3:13,14,15,23,24,25': [[115], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:25,35,45,55': [[141], [1.0], [0]],
+              'ship_1x3:11,12,13|ship_1x4:25,35,45,55|ship_2x3:51,52,61,62,71,72': [[141], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:26,36,46,56': [[172], [1.0], [0]],
+              'ship_1x3:11,12,13|ship_1x4:26,36,46,56|ship_2x3:32,33,34,42,43,44': [[172], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:31,32,33,34': [[145], [1.0], [0]],
+              'ship_1x3:11,12,13|ship_1x4:31,32,33,34|ship_2x3:50,51,52,60,61,62': [[145], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:32,42,52,62': [[60, 110], [1.0, 0.927212], [0, 0]],
+              'ship_1x3:11,12,13|ship_1x4:32,42,52,62|ship_2x3:15,16,25,26,35,36': [[110], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:32,42,52,62|ship_2x3:46,47,56,57,66,67': [[60], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:40,41,42,43': [[80], [1.0], [0]],
+              'ship_1x3:11,12,13|ship_1x4:40,41,42,43|ship_2x3:35,36,45,46,55,56': [[80], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,12,13|ship_1x4:60,61,62,63': [[176], [1.0], [0]],
+              'ship_1x3:11,12,13|ship_1x4:60,61,62,63|ship_2x3:45,46,47,55,56,57': [[176], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:05,15,25,35': [[97], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:05,15,25,35|ship_2x3:42,43,52,53,62,63': [[97], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:16,26,36,46': [[23], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:16,26,36,46|ship_2x3:50,51,52,60,61,62': [[23], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:23,24,25,26': [[24, 198], [1.0, 0.650755], [0, 0]],
+              'ship_1x3:11,21,31|ship_1x4:23,24,25,26|ship_2x3:51,52,53,61,62,63': [[24], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:23,24,25,26|ship_2x3:55,56,65,66,75,76': [[198], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:33,43,53,63': [[45], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:33,43,53,63|ship_2x3:15,16,25,26,35,36': [[45], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:34,44,54,64': [[148], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:34,44,54,64|ship_2x3:50,51,60,61,70,71': [[148], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:36,46,56,66': [[59, 130], [1.0, 0.535837], [0, 0]],
+              'ship_1x3:11,21,31|ship_1x4:36,46,56,66|ship_2x3:51,52,53,61,62,63': [[130], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:36,46,56,66|ship_2x3:52,53,54,62,63,64': [[59], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:43,44,45,46': [[109], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:43,44,45,46|ship_2x3:14,15,16,24,25,26': [[109], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:43,53,63,73': [[132, 184], [1.0, 0.733179], [0, 0]],
+              'ship_1x3:11,21,31|ship_1x4:43,53,63,73|ship_2x3:45,46,55,56,65,66': [[184], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:43,53,63,73|ship_2x3:46,47,56,57,66,67': [[132], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:44,45,46,47': [[89], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:44,45,46,47|ship_2x3:05,06,15,16,25,26': [[89], [1.0],
+                                                                                    [0]],
+              'ship_1x3:11,21,31|ship_1x4:53,54,55,56': [[151], [1.0], [0]],
+              'ship_1x3:11,21,31|ship_1x4:53,54,55,56|ship_2x3:15,16,17,25,26,27': [[151], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,13,14|ship_1x4:31,41,51,61': [[1], [1.0], [0]],
+              'ship_1x3:12,13,14|ship_1x4:31,41,51,61|ship_2x3:34,35,44,45,54,55': [[1], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,13,14|ship_1x4:42,52,62,72': [[10], [1.0], [0]],
+              'ship_1x3:12,13,14|ship_1x4:42,52,62,72|ship_2x3:45,46,55,56,65,66': [[10], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,13,14|ship_1x4:46,56,66,76': [[3, 26], [1.0, 0.643914], [0, 0]],
+              'ship_1x3:12,13,14|ship_1x4:46,56,66,76|ship_2x3:40,41,42,50,51,52': [[26], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,13,14|ship_1x4:46,56,66,76|ship_2x3:42,43,52,53,62,63': [[3], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,13,14|ship_1x4:64,65,66,67': [[197], [1.0], [0]],
+              'ship_1x3:12,13,14|ship_1x4:64,65,66,67|ship_2x3:25,26,35,36,45,46': [[197], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,22,32|ship_1x4:04,14,24,34': [[93], [1.0], [0]],
+              'ship_1x3:12,22,32|ship_1x4:04,14,24,34|ship_2x3:54,55,56,64,65,66': [[93], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,22,32|ship_1x4:06,16,26,36': [[149, 195], [1.0, 0.83486], [0, 0]],
+              'ship_1x3:12,22,32|ship_1x4:06,16,26,36|ship_2x3:51,52,61,62,71,72': [[149], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,22,32|ship_1x4:06,16,26,36|ship_2x3:62,63,64,72,73,74': [[195], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,22,32|ship_1x4:15,25,35,45': [[74], [1.0], [0]],
+              'ship_1x3:12,22,32|ship_1x4:15,25,35,45|ship_2x3:51,52,53,61,62,63': [[74], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,22,32|ship_1x4:36,46,56,66': [[81], [1.0], [0]],
+              'ship_1x3:12,22,32|ship_1x4:36,46,56,66|ship_2x3:52,53,62,63,72,73': [[81], [1.0],
+                                                                                    [0]],
+              'ship_1x3:12,22,32|ship_1x4:63,64,65,66': [[189], [1.0], [0]],
+              'ship_1x3:12,22,32|ship_1x4:63,64,65,66|ship_2x3:05,06,15,16,25,26': [[189], [1.0],
+                                                                                    [0]],
+              'ship_1x3:13,14,15|ship_1x4:11,21,31,41': [[191], [1.0], [0]],
+              'ship_1x3:13,14,15|ship_1x4:11,21,31,41|ship_2x3:52,53,54,62,63,64': [[191], [1.0],
+                                                                                    [0]],
+              'ship_1x3:13,14,15|ship_1x4:33,34,35,36': [[107], [1.0], [0]],
+              'ship_1x3:13,14,15|ship_1x4:33,34,35,36|ship_2x3:51,52,61,62,71,72': [[107], [1.0],
+                                                                                    [0]],
+              'ship_1x3:13,23,33|ship_1x4:36,46,56,66': [[65], [1.0], [0]],
+              'ship_1x3:13,23,33|ship_1x4:36,46,56,66|ship_2x3:51,52,53,61,62,63': [[65], [1.0],
+                                                                                    [0]],
+              'ship_1x3:14,24,34|ship_1x4:53,54,55,56': [[85], [1.0], [0]],
+              'ship_1x3:14,24,34|ship_1x4:53,54,55,56|ship_2x3:11,12,21,22,31,32': [[85], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,16,17|ship_1x4:21,22,23,24': [[64], [1.0], [0]],
+              'ship_1x3:15,16,17|ship_1x4:21,22,23,24|ship_2x3:51,52,53,61,62,63': [[64], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,16,17|ship_1x4:36,46,56,66': [[18], [1.0], [0]],
+              'ship_1x3:15,16,17|ship_1x4:36,46,56,66|ship_2x3:52,53,54,62,63,64': [[18], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:01,11,21,31': [[35], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:01,11,21,31|ship_2x3:53,54,63,64,73,74': [[35], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:12,22,32,42': [[4], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:12,22,32,42|ship_2x3:54,55,56,64,65,66': [[4], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:21,31,41,51': [[38, 50, 75, 103],
+                                                         [1.0, 0.960125, 0.869643, 0.771465],
+                                                         [0, 0, 0, 1]],
+              'ship_1x3:15,25,35|ship_1x4:21,31,41,51|ship_2x3:53,54,63,64,73,74': [[38], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:21,31,41,51|ship_2x3:54,55,56,64,65,66': [[103], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:21,31,41,51|ship_2x3:54,55,64,65,74,75': [[75], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:21,31,41,51|ship_2x3:63,64,65,73,74,75': [[50], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:32,42,52,62': [[48], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:32,42,52,62|ship_2x3:55,56,57,65,66,67': [[48], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:43,44,45,46': [[178], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:43,44,45,46|ship_2x3:01,02,11,12,21,22': [[178], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:47,57,67,77': [[181], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:47,57,67,77|ship_2x3:51,52,53,61,62,63': [[181], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:61,62,63,64': [[166], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:61,62,63,64|ship_2x3:10,11,20,21,30,31': [[166], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:63,64,65,66': [[29], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:63,64,65,66|ship_2x3:10,11,20,21,30,31': [[29], [1.0],
+                                                                                    [0]],
+              'ship_1x3:15,25,35|ship_1x4:64,65,66,67': [[144], [1.0], [0]],
+              'ship_1x3:15,25,35|ship_1x4:64,65,66,67|ship_2x3:31,32,41,42,51,52': [[144], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:01,11,21,31': [[21, 122], [1.0, 0.46184], [0, 0]],
+              'ship_1x3:16,26,36|ship_1x4:01,11,21,31|ship_2x3:33,34,43,44,53,54': [[21], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:01,11,21,31|ship_2x3:43,44,45,53,54,55': [[122], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:02,12,22,32': [[5, 62], [1.0, 0.6715], [0, 0]],
+              'ship_1x3:16,26,36|ship_1x4:02,12,22,32|ship_2x3:52,53,54,62,63,64': [[5], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:02,12,22,32|ship_2x3:61,62,63,71,72,73': [[62], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:11,12,13,14': [[94], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:11,12,13,14|ship_2x3:61,62,63,71,72,73': [[94], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:11,21,31,41': [[7], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:11,21,31,41|ship_2x3:52,53,54,62,63,64': [[7], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:12,22,32,42': [[33, 140], [1.0, 0.733179], [0, 0]],
+              'ship_1x3:16,26,36|ship_1x4:12,22,32,42|ship_2x3:54,55,56,64,65,66': [[33], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:12,22,32,42|ship_2x3:55,56,65,66,75,76': [[140], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:21,22,23,24': [[120], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:21,22,23,24|ship_2x3:44,45,54,55,64,65': [[120], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:21,31,41,51': [[54, 88], [1.0, 0.906524], [0, 0]],
+              'ship_1x3:16,26,36|ship_1x4:21,31,41,51|ship_2x3:54,55,56,64,65,66': [[88], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:21,31,41,51|ship_2x3:63,64,65,73,74,75': [[54], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:41,51,61,71': [[9], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:41,51,61,71|ship_2x3:43,44,53,54,63,64': [[9], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:51,52,53,54': [[106], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:51,52,53,54|ship_2x3:02,03,12,13,22,23': [[106], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:63,64,65,66': [[90], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:63,64,65,66|ship_2x3:31,32,41,42,51,52': [[90], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:72,73,74,75': [[71], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:72,73,74,75|ship_2x3:21,22,23,31,32,33': [[71], [1.0],
+                                                                                    [0]],
+              'ship_1x3:16,26,36|ship_1x4:74,75,76,77': [[194], [1.0], [0]],
+              'ship_1x3:16,26,36|ship_1x4:74,75,76,77|ship_2x3:33,34,43,44,53,54': [[194], [1.0],
+                                                                                    [0]],
+              'ship_1x3:17,27,37|ship_1x4:62,63,64,65': [[116], [1.0], [0]],
+              'ship_1x3:17,27,37|ship_1x4:62,63,64,65|ship_2x3:13,14,23,24,33,34': [[116], [1.0],
+                                                                                    [0]],
+              'ship_1x3:20,21,22|ship_1x4:36,46,56,66': [[69], [1.0], [0]],
+              'ship_1x3:20,21,22|ship_1x4:36,46,56,66|ship_2x3:51,52,61,62,71,72': [[69], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,22,23|ship_1x4:06,16,26,36': [[99, 121], [1.0, 0.817183], [0, 0]],
+              'ship_1x3:21,22,23|ship_1x4:06,16,26,36|ship_2x3:42,43,44,52,53,54': [[121], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,22,23|ship_1x4:06,16,26,36|ship_2x3:43,44,53,54,63,64': [[99], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,22,23|ship_1x4:36,46,56,66': [[77], [1.0], [0]],
+              'ship_1x3:21,22,23|ship_1x4:36,46,56,66|ship_2x3:50,51,52,60,61,62': [[77], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,22,23|ship_1x4:60,61,62,63': [[125], [1.0], [0]],
+              'ship_1x3:21,22,23|ship_1x4:60,61,62,63|ship_2x3:16,17,26,27,36,37': [[125], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:12,13,14,15': [[20, 155], [1.0, 0.678487], [0, 0]],
+              'ship_1x3:21,31,41|ship_1x4:12,13,14,15|ship_2x3:44,45,54,55,64,65': [[20, 155],
+                                                                                    [1.0, 0.678487],
+                                                                                    [0, 0]],
+              'ship_1x3:21,31,41|ship_1x4:13,14,15,16': [[135], [1.0], [0]],
+              'ship_1x3:21,31,41|ship_1x4:13,14,15,16|ship_2x3:34,35,44,45,54,55': [[135], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:17,27,37,47': [[67], [1.0], [0]],
+              'ship_1x3:21,31,41|ship_1x4:17,27,37,47|ship_2x3:43,44,53,54,63,64': [[67], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:23,24,25,26': [[111], [1.0], [0]],
+              'ship_1x3:21,31,41|ship_1x4:23,24,25,26|ship_2x3:54,55,64,65,74,75': [[111], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:24,34,44,54': [[174], [1.0], [0]],
+              'ship_1x3:21,31,41|ship_1x4:24,34,44,54|ship_2x3:36,37,46,47,56,57': [[174], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:26,36,46,56': [[171, 199], [1.0, 0.690211], [0, 0]],
+              'ship_1x3:21,31,41|ship_1x4:26,36,46,56|ship_2x3:23,24,33,34,43,44': [[171], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:26,36,46,56|ship_2x3:63,64,65,73,74,75': [[199], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:36,46,56,66': [[79], [1.0], [0]],
+              'ship_1x3:21,31,41|ship_1x4:36,46,56,66|ship_2x3:62,63,64,72,73,74': [[79], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:45,55,65,75': [[177], [1.0], [0]],
+              'ship_1x3:21,31,41|ship_1x4:45,55,65,75|ship_2x3:16,17,26,27,36,37': [[177], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:53,54,55,56': [[134, 160], [0.862849, 1.0], [1, 1]],
+              'ship_1x3:21,31,41|ship_1x4:53,54,55,56|ship_2x3:16,17,26,27,36,37': [[134], [1.0],
+                                                                                    [0]],
+              'ship_1x3:21,31,41|ship_1x4:53,54,55,56|ship_2x3:24,25,26,34,35,36': [[160], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,23,24|ship_1x4:16,26,36,46': [[63], [1.0], [0]],
+              'ship_1x3:22,23,24|ship_1x4:16,26,36,46|ship_2x3:42,43,52,53,62,63': [[63], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,23,24|ship_1x4:36,46,56,66': [[2, 12], [0.927212, 1.0], [1, 1]],
+              'ship_1x3:22,23,24|ship_1x4:36,46,56,66|ship_2x3:50,51,52,60,61,62': [[12], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,23,24|ship_1x4:36,46,56,66|ship_2x3:52,53,62,63,72,73': [[2], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,23,24|ship_1x4:41,51,61,71': [[73], [1.0], [0]],
+              'ship_1x3:22,23,24|ship_1x4:41,51,61,71|ship_2x3:54,55,64,65,74,75': [[73], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,23,24|ship_1x4:45,55,65,75': [[22], [1.0], [0]],
+              'ship_1x3:22,23,24|ship_1x4:45,55,65,75|ship_2x3:51,52,53,61,62,63': [[22], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,23,24|ship_1x4:50,51,52,53': [[180], [1.0], [0]],
+              'ship_1x3:22,23,24|ship_1x4:50,51,52,53|ship_2x3:36,37,46,47,56,57': [[180], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:04,14,24,34': [[137], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:04,14,24,34|ship_2x3:54,55,56,64,65,66': [[137], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:06,16,26,36': [[49], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:06,16,26,36|ship_2x3:54,55,64,65,74,75': [[49], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:16,26,36,46': [[147], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:16,26,36,46|ship_2x3:63,64,65,73,74,75': [[147], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:24,25,26,27': [[162], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:24,25,26,27|ship_2x3:54,55,64,65,74,75': [[162], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:46,56,66,76': [[190], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:46,56,66,76|ship_2x3:14,15,16,24,25,26': [[190], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:61,62,63,64': [[25], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:61,62,63,64|ship_2x3:25,26,35,36,45,46': [[25], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:63,64,65,66': [[37], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:63,64,65,66|ship_2x3:04,05,06,14,15,16': [[37], [1.0],
+                                                                                    [0]],
+              'ship_1x3:22,32,42|ship_1x4:64,65,66,67': [[104], [1.0], [0]],
+              'ship_1x3:22,32,42|ship_1x4:64,65,66,67|ship_2x3:05,06,15,16,25,26': [[104], [1.0],
+                                                                                    [0]],
+              'ship_1x3:23,33,43|ship_1x4:16,26,36,46': [[78], [1.0], [0]],
+              'ship_1x3:23,33,43|ship_1x4:16,26,36,46|ship_2x3:64,65,66,74,75,76': [[78], [1.0],
+                                                                                    [0]],
+              'ship_1x3:24,25,26|ship_1x4:32,42,52,62': [[133], [1.0], [0]],
+              'ship_1x3:24,25,26|ship_1x4:32,42,52,62|ship_2x3:45,46,55,56,65,66': [[133], [1.0],
+                                                                                    [0]],
+              'ship_1x3:24,25,26|ship_1x4:40,41,42,43': [[19], [1.0], [0]],
+              'ship_1x3:24,25,26|ship_1x4:40,41,42,43|ship_2x3:55,56,57,65,66,67': [[19], [1.0],
+                                                                                    [0]],
+              'ship_1x3:24,34,44|ship_1x4:11,21,31,41': [[168], [1.0], [0]],
+              'ship_1x3:24,34,44|ship_1x4:11,21,31,41|ship_2x3:63,64,65,73,74,75': [[168], [1.0],
+                                                                                    [0]],
+              'ship_1x3:25,35,45|ship_1x4:01,11,21,31': [[173], [1.0], [0]],
+              'ship_1x3:25,35,45|ship_1x4:01,11,21,31|ship_2x3:51,52,61,62,71,72': [[173], [1.0],
+                                                                                    [0]],
+              'ship_1x3:25,35,45|ship_1x4:51,52,53,54': [[170], [1.0], [0]],
+              'ship_1x3:25,35,45|ship_1x4:51,52,53,54|ship_2x3:10,11,12,20,21,22': [[170], [1.0],
+                                                                                    [0]],
+              'ship_1x3:25,35,45|ship_1x4:60,61,62,63': [[136], [1.0], [0]],
+              'ship_1x3:25,35,45|ship_1x4:60,61,62,63|ship_2x3:10,11,20,21,30,31': [[136], [1.0],
+                                                                                    [0]],
+              'ship_1x3:25,35,45|ship_1x4:61,62,63,64': [[95], [1.0], [0]],
+              'ship_1x3:25,35,45|ship_1x4:61,62,63,64|ship_2x3:21,22,23,31,32,33': [[95], [1.0],
+                                                                                    [0]],
+              'ship_1x3:26,36,46|ship_1x4:12,22,32,42': [[72, 153], [1.0, 0.678487], [0, 0]],
+              'ship_1x3:26,36,46|ship_1x4:12,22,32,42|ship_2x3:53,54,55,63,64,65': [[72], [1.0],
+                                                                                    [0]],
+              'ship_1x3:26,36,46|ship_1x4:12,22,32,42|ship_2x3:61,62,63,71,72,73': [[153], [1.0],
+                                                                                    [0]],
+              'ship_1x3:26,36,46|ship_1x4:21,22,23,24': [[185], [1.0], [0]],
+              'ship_1x3:26,36,46|ship_1x4:21,22,23,24|ship_2x3:61,62,63,71,72,73': [[185], [1.0],
+                                                                                    [0]],
+              'ship_1x3:26,36,46|ship_1x4:34,44,54,64': [[129], [1.0], [0]],
+              'ship_1x3:26,36,46|ship_1x4:34,44,54,64|ship_2x3:40,41,50,51,60,61': [[129], [1.0],
+                                                                                    [0]],
+              'ship_1x3:26,36,46|ship_1x4:51,52,53,54': [[15], [1.0], [0]],
+              'ship_1x3:26,36,46|ship_1x4:51,52,53,54|ship_2x3:11,12,21,22,31,32': [[15], [1.0],
+                                                                                    [0]],
+              'ship_1x3:26,36,46|ship_1x4:71,72,73,74': [[39], [1.0], [0]],
+              'ship_1x3:26,36,46|ship_1x4:71,72,73,74|ship_2x3:22,23,32,33,42,43': [[39], [1.0],
+                                                                                    [0]],
+              'ship_1x3:30,31,32|ship_1x4:36,46,56,66': [[105], [1.0], [0]],
+              'ship_1x3:30,31,32|ship_1x4:36,46,56,66|ship_2x3:52,53,54,62,63,64': [[105], [1.0],
+                                                                                    [0]],
+              'ship_1x3:30,40,50|ship_1x4:36,46,56,66': [[82], [1.0], [0]],
+              'ship_1x3:30,40,50|ship_1x4:36,46,56,66|ship_2x3:23,24,33,34,43,44': [[82], [1.0],
+                                                                                    [0]],
+              'ship_1x3:31,41,51|ship_1x4:10,11,12,13': [[113], [1.0], [0]],
+              'ship_1x3:31,41,51|ship_1x4:10,11,12,13|ship_2x3:55,56,57,65,66,67': [[113], [1.0],
+                                                                                    [0]],
+              'ship_1x3:31,41,51|ship_1x4:23,24,25,26': [[32], [1.0], [0]],
+              'ship_1x3:31,41,51|ship_1x4:23,24,25,26|ship_2x3:43,44,53,54,63,64': [[32], [1.0],
+                                                                                    [0]],
+              'ship_1x3:31,41,51|ship_1x4:43,44,45,46': [[186], [1.0], [0]],
+              'ship_1x3:31,41,51|ship_1x4:43,44,45,46|ship_2x3:06,07,16,17,26,27': [[186], [1.0],
+                                                                                    [0]],
+              'ship_1x3:32,33,34|ship_1x4:12,13,14,15': [[188], [1.0], [0]],
+              'ship_1x3:32,33,34|ship_1x4:12,13,14,15|ship_2x3:51,52,61,62,71,72': [[188], [1.0],
+                                                                                    [0]],
+              'ship_1x3:32,42,52|ship_1x4:04,14,24,34': [[16], [1.0], [0]],
+              'ship_1x3:32,42,52|ship_1x4:04,14,24,34|ship_2x3:54,55,56,64,65,66': [[16], [1.0],
+                                                                                    [0]],
+              'ship_1x3:33,34,35|ship_1x4:10,11,12,13': [[52], [1.0], [0]],
+              'ship_1x3:33,34,35|ship_1x4:10,11,12,13|ship_2x3:51,52,53,61,62,63': [[52], [1.0],
+                                                                                    [0]],
+              'ship_1x3:33,43,53|ship_1x4:41,51,61,71': [[175], [1.0], [0]],
+              'ship_1x3:33,43,53|ship_1x4:41,51,61,71|ship_2x3:46,47,56,57,66,67': [[175], [1.0],
+                                                                                    [0]],
+              'ship_1x3:33,43,53|ship_1x4:46,56,66,76': [[182], [1.0], [0]],
+              'ship_1x3:33,43,53|ship_1x4:46,56,66,76|ship_2x3:20,21,30,31,40,41': [[182], [1.0],
+                                                                                    [0]],
+              'ship_1x3:35,36,37|ship_1x4:63,64,65,66': [[53], [1.0], [0]],
+              'ship_1x3:35,36,37|ship_1x4:63,64,65,66|ship_2x3:02,03,12,13,22,23': [[53], [1.0],
+                                                                                    [0]],
+              'ship_1x3:36,46,56|ship_1x4:20,21,22,23': [[127], [1.0], [0]],
+              'ship_1x3:36,46,56|ship_1x4:20,21,22,23|ship_2x3:50,51,60,61,70,71': [[127], [1.0],
+                                                                                    [0]],
+              'ship_1x3:41,42,43|ship_1x4:16,26,36,46': [[70], [1.0], [0]],
+              'ship_1x3:41,42,43|ship_1x4:16,26,36,46|ship_2x3:63,64,65,73,74,75': [[70], [1.0],
+                                                                                    [0]],
+              'ship_1x3:42,52,62|ship_1x4:13,14,15,16': [[41], [1.0], [0]],
+              'ship_1x3:42,52,62|ship_1x4:13,14,15,16|ship_2x3:34,35,36,44,45,46': [[41], [1.0],
+                                                                                    [0]],
+              'ship_1x3:42,52,62|ship_1x4:14,15,16,17': [[30], [1.0], [0]],
+              'ship_1x3:42,52,62|ship_1x4:14,15,16,17|ship_2x3:44,45,46,54,55,56': [[30], [1.0],
+                                                                                    [0]],
+              'ship_1x3:43,53,63|ship_1x4:11,21,31,41': [[112], [1.0], [0]],
+              'ship_1x3:43,53,63|ship_1x4:11,21,31,41|ship_2x3:46,47,56,57,66,67': [[112], [1.0],
+                                                                                    [0]],
+              'ship_1x3:43,53,63|ship_1x4:15,25,35,45': [[36], [1.0], [0]],
+              'ship_1x3:43,53,63|ship_1x4:15,25,35,45|ship_2x3:01,02,11,12,21,22': [[36], [1.0],
+                                                                                    [0]],
+              'ship_1x3:44,45,46|ship_1x4:12,22,32,42': [[118], [1.0], [0]],
+              'ship_1x3:44,45,46|ship_1x4:12,22,32,42|ship_2x3:15,16,17,25,26,27': [[118], [1.0],
+                                                                                    [0]],
+              'ship_1x3:45,55,65|ship_1x4:13,23,33,43': [[165], [1.0], [0]],
+              'ship_1x3:45,55,65|ship_1x4:13,23,33,43|ship_2x3:61,62,63,71,72,73': [[165], [1.0],
+                                                                                    [0]],
+              'ship_1x3:45,55,65|ship_1x4:60,61,62,63': [[55], [1.0], [0]],
+              'ship_1x3:45,55,65|ship_1x4:60,61,62,63|ship_2x3:11,12,13,21,22,23': [[55], [1.0],
+                                                                                    [0]],
+              'ship_1x3:46,56,66|ship_1x4:12,13,14,15': [[152], [1.0], [0]],
+              'ship_1x3:46,56,66|ship_1x4:12,13,14,15|ship_2x3:32,33,42,43,52,53': [[152], [1.0],
+                                                                                    [0]],
+              'ship_1x3:46,56,66|ship_1x4:13,14,15,16': [[150], [1.0], [0]],
+              'ship_1x3:46,56,66|ship_1x4:13,14,15,16|ship_2x3:30,31,40,41,50,51': [[150], [1.0],
+                                                                                    [0]],
+              'ship_1x3:46,56,66|ship_1x4:20,21,22,23': [[87], [1.0], [0]],
+              'ship_1x3:46,56,66|ship_1x4:20,21,22,23|ship_2x3:51,52,53,61,62,63': [[87], [1.0],
+                                                                                    [0]],
+              'ship_1x3:46,56,66|ship_1x4:20,30,40,50': [[86], [1.0], [0]],
+              'ship_1x3:46,56,66|ship_1x4:20,30,40,50|ship_2x3:13,14,23,24,33,34': [[86], [1.0],
+                                                                                    [0]],
+              'ship_1x3:46,56,66|ship_1x4:50,51,52,53': [[163], [1.0], [0]],
+              'ship_1x3:46,56,66|ship_1x4:50,51,52,53|ship_2x3:15,16,17,25,26,27': [[163], [1.0],
+                                                                                    [0]],
+              'ship_1x3:47,57,67|ship_1x4:01,11,21,31': [[58], [1.0], [0]],
+              'ship_1x3:47,57,67|ship_1x4:01,11,21,31|ship_2x3:43,44,53,54,63,64': [[58], [1.0],
+                                                                                    [0]],
+              'ship_1x3:51,52,53|ship_1x4:02,12,22,32': [[139], [1.0], [0]],
+              'ship_1x3:51,52,53|ship_1x4:02,12,22,32|ship_2x3:15,16,17,25,26,27': [[139], [1.0],
+                                                                                    [0]],
+              'ship_1x3:51,52,53|ship_1x4:21,22,23,24': [[17], [1.0], [0]],
+              'ship_1x3:51,52,53|ship_1x4:21,22,23,24|ship_2x3:55,56,57,65,66,67': [[17], [1.0],
+                                                                                    [0]],
+              'ship_1x3:51,52,53|ship_1x4:25,35,45,55': [[157], [1.0], [0]],
+              'ship_1x3:51,52,53|ship_1x4:25,35,45,55|ship_2x3:11,12,13,21,22,23': [[157], [1.0],
+                                                                                    [0]],
+              'ship_1x3:51,52,53|ship_1x4:45,55,65,75': [[44], [1.0], [0]],
+              'ship_1x3:51,52,53|ship_1x4:45,55,65,75|ship_2x3:12,13,14,22,23,24': [[44], [1.0],
+                                                                                    [0]],
+              'ship_1x3:51,61,71|ship_1x4:13,14,15,16': [[27], [1.0], [0]],
+              'ship_1x3:51,61,71|ship_1x4:13,14,15,16|ship_2x3:53,54,55,63,64,65': [[27], [1.0],
+                                                                                    [0]],
+              'ship_1x3:52,53,54|ship_1x4:06,16,26,36': [[28], [1.0], [0]],
+              'ship_1x3:52,53,54|ship_1x4:06,16,26,36|ship_2x3:10,11,12,20,21,22': [[28], [1.0],
+                                                                                    [0]],
+              'ship_1x3:52,53,54|ship_1x4:13,14,15,16': [[66], [1.0], [0]],
+              'ship_1x3:52,53,54|ship_1x4:13,14,15,16|ship_2x3:46,47,56,57,66,67': [[66], [1.0],
+                                                                                    [0]],
+              'ship_1x3:52,53,54|ship_1x4:27,37,47,57': [[131], [1.0], [0]],
+              'ship_1x3:52,53,54|ship_1x4:27,37,47,57|ship_2x3:11,12,21,22,31,32': [[131], [1.0],
+                                                                                    [0]],
+              'ship_1x3:53,54,55|ship_1x4:11,21,31,41': [[161], [1.0], [0]],
+              'ship_1x3:53,54,55|ship_1x4:11,21,31,41|ship_2x3:04,05,14,15,24,25': [[161], [1.0],
+                                                                                    [0]],
+              'ship_1x3:53,63,73|ship_1x4:12,13,14,15': [[128], [1.0], [0]],
+              'ship_1x3:53,63,73|ship_1x4:12,13,14,15|ship_2x3:45,46,55,56,65,66': [[128], [1.0],
+                                                                                    [0]],
+              'ship_1x3:55,56,57|ship_1x4:21,22,23,24': [[143], [1.0], [0]],
+              'ship_1x3:55,56,57|ship_1x4:21,22,23,24|ship_2x3:51,52,61,62,71,72': [[143], [1.0],
+                                                                                    [0]],
+              'ship_1x3:55,56,57|ship_1x4:60,61,62,63': [[98], [1.0], [0]],
+              'ship_1x3:55,56,57|ship_1x4:60,61,62,63|ship_2x3:14,15,24,25,34,35': [[98], [1.0],
+                                                                                    [0]],
+              'ship_1x3:55,65,75|ship_1x4:11,21,31,41': [[101], [1.0], [0]],
+              'ship_1x3:55,65,75|ship_1x4:11,21,31,41|ship_2x3:03,04,13,14,23,24': [[101], [1.0],
+                                                                                    [0]],
+              'ship_1x3:55,65,75|ship_1x4:21,31,41,51': [[13], [1.0], [0]],
+              'ship_1x3:55,65,75|ship_1x4:21,31,41,51|ship_2x3:14,15,16,24,25,26': [[13], [1.0],
+                                                                                    [0]],
+              'ship_1x3:56,66,76|ship_1x4:04,14,24,34': [[108], [1.0], [0]],
+              'ship_1x3:56,66,76|ship_1x4:04,14,24,34|ship_2x3:21,22,31,32,41,42': [[108], [1.0],
+                                                                                    [0]],
+              'ship_1x3:56,66,76|ship_1x4:05,15,25,35': [[57], [1.0], [0]],
+              'ship_1x3:56,66,76|ship_1x4:05,15,25,35|ship_2x3:42,43,52,53,62,63': [[57], [1.0],
+                                                                                    [0]],
+              'ship_1x3:56,66,76|ship_1x4:11,21,31,41': [[6], [1.0], [0]],
+              'ship_1x3:56,66,76|ship_1x4:11,21,31,41|ship_2x3:14,15,24,25,34,35': [[6], [1.0],
+                                                                                    [0]],
+              'ship_1x3:57,67,77|ship_1x4:11,21,31,41': [[159], [1.0], [0]],
+              'ship_1x3:57,67,77|ship_1x4:11,21,31,41|ship_2x3:14,15,16,24,25,26': [[159], [1.0],
+                                                                                    [0]],
+              'ship_1x3:60,61,62|ship_1x4:01,11,21,31': [[47], [1.0], [0]],
+              'ship_1x3:60,61,62|ship_1x4:01,11,21,31|ship_2x3:33,34,35,43,44,45': [[47], [1.0],
+                                                                                    [0]],
+              'ship_1x3:60,61,62|ship_1x4:16,26,36,46': [[34], [1.0], [0]],
+              'ship_1x3:60,61,62|ship_1x4:16,26,36,46|ship_2x3:11,12,21,22,31,32': [[34], [1.0],
+                                                                                    [0]],
+              'ship_1x3:60,61,62|ship_1x4:35,45,55,65': [[76], [1.0], [0]],
+              'ship_1x3:60,61,62|ship_1x4:35,45,55,65|ship_2x3:12,13,14,22,23,24': [[76], [1.0],
+                                                                                    [0]],
+              'ship_1x3:60,61,62|ship_1x4:36,46,56,66': [[138], [1.0], [0]],
+              'ship_1x3:60,61,62|ship_1x4:36,46,56,66|ship_2x3:03,04,13,14,23,24': [[138], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:10,11,12,13': [[40], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:10,11,12,13|ship_2x3:15,16,25,26,35,36': [[40], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:11,21,31,41': [[8], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:11,21,31,41|ship_2x3:15,16,25,26,35,36': [[8], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:12,22,32,42': [[193], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:12,22,32,42|ship_2x3:15,16,25,26,35,36': [[193], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:16,26,36,46': [[11], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:16,26,36,46|ship_2x3:11,12,21,22,31,32': [[11], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:21,22,23,24': [[56], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:21,22,23,24|ship_2x3:55,56,65,66,75,76': [[56], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:36,46,56,66': [[96], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:36,46,56,66|ship_2x3:21,22,23,31,32,33': [[96], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:43,44,45,46': [[158], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:43,44,45,46|ship_2x3:04,05,06,14,15,16': [[158], [1.0],
+                                                                                    [0]],
+              'ship_1x3:61,62,63|ship_1x4:45,55,65,75': [[43], [1.0], [0]],
+              'ship_1x3:61,62,63|ship_1x4:45,55,65,75|ship_2x3:21,22,23,31,32,33': [[43], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:01,11,21,31': [[102], [1.0], [0]],
+              'ship_1x3:62,63,64|ship_1x4:01,11,21,31|ship_2x3:34,35,36,44,45,46': [[102], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:06,16,26,36': [[169], [1.0], [0]],
+              'ship_1x3:62,63,64|ship_1x4:06,16,26,36|ship_2x3:12,13,22,23,32,33': [[169], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:10,11,12,13': [[14, 51], [1.0, 0.792136], [0, 0]],
+              'ship_1x3:62,63,64|ship_1x4:10,11,12,13|ship_2x3:34,35,36,44,45,46': [[14], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:10,11,12,13|ship_2x3:35,36,45,46,55,56': [[51], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:11,21,31,41': [[196], [1.0], [0]],
+              'ship_1x3:62,63,64|ship_1x4:11,21,31,41|ship_2x3:04,05,14,15,24,25': [[196], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:15,25,35,45': [[0], [1.0], [0]],
+              'ship_1x3:62,63,64|ship_1x4:15,25,35,45|ship_2x3:21,22,31,32,41,42': [[0], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:20,21,22,23': [[84, 187], [0.992188, 1.0], [1, 1]],
+              'ship_1x3:62,63,64|ship_1x4:20,21,22,23|ship_2x3:15,16,25,26,35,36': [[187], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:20,21,22,23|ship_2x3:16,17,26,27,36,37': [[84], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:30,31,32,33': [[117], [1.0], [0]],
+              'ship_1x3:62,63,64|ship_1x4:30,31,32,33|ship_2x3:14,15,16,24,25,26': [[117], [1.0],
+                                                                                    [0]],
+              'ship_1x3:62,63,64|ship_1x4:36,46,56,66': [[68], [1.0], [0]],
+              'ship_1x3:62,63,64|ship_1x4:36,46,56,66|ship_2x3:22,23,32,33,42,43': [[68], [1.0],
+                                                                                    [0]],
+              'ship_1x3:64,65,66|ship_1x4:06,16,26,36': [[183], [1.0], [0]],
+              'ship_1x3:64,65,66|ship_1x4:06,16,26,36|ship_2x3:20,21,30,31,40,41': [[183], [1.0],
+                                                                                    [0]],
+              'ship_1x3:64,65,66|ship_1x4:21,22,23,24': [[146], [1.0], [0]],
+              'ship_1x3:64,65,66|ship_1x4:21,22,23,24|ship_2x3:50,51,60,61,70,71': [[146], [1.0],
+                                                                                    [0]],
+              'ship_1x3:64,65,66|ship_1x4:30,40,50,60': [[167], [1.0], [0]],
+              'ship_1x3:64,65,66|ship_1x4:30,40,50,60|ship_2x3:14,15,24,25,34,35': [[167], [1.0],
+                                                                                    [0]],
+              'ship_1x3:65,66,67|ship_1x4:11,12,13,14': [[42], [1.0], [0]],
+              'ship_1x3:65,66,67|ship_1x4:11,12,13,14|ship_2x3:41,42,51,52,61,62': [[42], [1.0],
+                                                                                    [0]],
+              'ship_1x3:65,66,67|ship_1x4:20,30,40,50': [[100], [1.0], [0]],
+              'ship_1x3:65,66,67|ship_1x4:20,30,40,50|ship_2x3:23,24,33,34,43,44': [[100], [1.0],
+                                                                                    [0]],
+              'ship_1x3:65,66,67|ship_1x4:41,42,43,44': [[179], [1.0], [0]],
+              'ship_1x3:65,66,67|ship_1x4:41,42,43,44|ship_2x3:10,11,12,20,21,22': [[179], [1.0],
+                                                                                    [0]],
+              'ship_1x3:65,66,67|ship_1x4:41,51,61,71': [[123], [1.0], [0]],
+              'ship_1x3:65,66,67|ship_1x4:41,51,61,71|ship_2x3:16,17,26,27,36,37': [[123], [1.0],
+                                                                                    [0]],
+              'ship_1x3:73,74,75|ship_1x4:11,21,31,41': [[91], [1.0], [0]],
+              'ship_1x3:73,74,75|ship_1x4:11,21,31,41|ship_2x3:14,15,16,24,25,26': [[91], [1.0],
+                                                                                    [0]],
+              'ship_1x3:73,74,75|ship_1x4:21,31,41,51': [[119], [1.0], [0]],
+              'ship_1x3:73,74,75|ship_1x4:21,31,41,51|ship_2x3:24,25,34,35,44,45': [[119], [1.0],
+                                                                                    [0]],
+              'ship_1x3:74,75,76|ship_1x4:12,22,32,42': [[154], [1.0], [0]],
+              'ship_1x3:74,75,76|ship_1x4:12,22,32,42|ship_2x3:15,16,17,25,26,27': [[154], [1.0],
+                                                                                    [0]],
+              'ship_1x4:01,11,21,31': [[21, 35, 47, 58, 102, 122, 173],
+                                       [1.0, 0.82642, 0.897666, 0.817334, 0.691858, 0.530466,
+                                        0.838898],
+                                       [0, 0, 0, 0, 0, 1, 1]],
+              'ship_1x4:02,12,22,32': [[5, 62, 139], [1.0, 0.78614, 0.658557], [0, 0, 0]],
+              'ship_1x4:04,14,24,34': [[16, 93, 108, 137], [1.0, 0.743034, 0.693696, 0.59335],
+                                       [0, 0, 0, 1]],
+              'ship_1x4:05,15,25,35': [[57, 97], [1.0, 0.82727], [0, 0]],
+              'ship_1x4:06,16,26,36': [[28, 49, 99, 121, 149, 169, 183, 195],
+                                       [1.0, 0.695096, 0.510424, 0.714807, 0.475788, 0.553801,
+                                        0.277022, 0.917831],
+                                       [0, 0, 1, 0, 2, 0, 4, 4]],
+              'ship_1x4:10,11,12,13': [[14, 40, 51, 52, 113],
+                                       [1.0, 0.698863, 0.502612, 0.640307, 0.413413],
+                                       [0, 0, 1, 0, 2]],
+              'ship_1x4:11,12,13,14': [[42, 94], [1.0, 0.997396], [0, 0]],
+              'ship_1x4:11,21,31,41': [[6, 7, 8, 91, 101, 112, 159, 161, 168, 191, 196],
+                                       [1.0, 0.983136, 0.994764, 0.708167, 0.75384, 0.631499,
+                                        0.431768, 0.523531, 0.615266, 0.499557, 0.590157],
+                                       [0, 0, 1, 0, 0, 1, 1, 1, 1, 2, 2]],
+              'ship_1x4:12,13,14,15': [[20, 128, 152, 155, 188],
+                                       [1.0, 0.497407, 0.70512, 0.579829, 0.441253],
+                                       [0, 0, 0, 0, 3]],
+              'ship_1x4:12,22,32,42': [[4, 33, 72, 118, 124, 140, 153, 154, 193],
+                                       [1.0, 0.976777, 0.613162, 0.454659, 0.853851, 0.572436,
+                                        0.534326, 0.574743, 0.537117],
+                                       [0, 0, 1, 0, 0, 2, 0, 1, 5]],
+              'ship_1x4:13,14,15,16': [[27, 41, 66, 135, 150],
+                                       [0.951296, 1.0, 0.893465, 0.627133, 0.721826],
+                                       [1, 1, 1, 1, 2]],
+              'ship_1x4:13,23,33,43': [[165], [1.0], [0]],
+              'ship_1x4:14,15,16,17': [[30, 92], [1.0, 0.728349], [0, 0]],
+              'ship_1x4:15,25,35,45': [[0, 36, 74], [1.0, 0.842381, 0.732005], [0, 0, 1]],
+              'ship_1x4:16,26,36,46': [[11, 23, 31, 34, 63, 70, 78, 147],
+                                       [1.0, 0.976168, 0.61087, 0.956041, 0.501181, 0.772212,
+                                        0.495988, 0.6014],
+                                       [0, 0, 0, 0, 0, 0, 0, 0]],
+              'ship_1x4:17,27,37,47': [[67], [1.0], [0]],
+              'ship_1x4:20,21,22,23': [[84, 87, 127, 187], [0.780559, 1.0, 0.952468, 0.792851],
+                                       [1, 1, 1, 2]],
+              'ship_1x4:20,30,40,50': [[86, 100], [1.0, 0.782192], [0, 0]],
+              'ship_1x4:21,22,23,24': [[17, 56, 64, 120, 143, 146, 185],
+                                       [1.0, 0.695273, 0.650129, 0.760672, 0.491126, 0.722067,
+                                        0.496269],
+                                       [0, 0, 1, 0, 0, 0, 2]],
+              'ship_1x4:21,31,41,51': [[13, 38, 50, 54, 75, 88, 103, 119],
+                                       [1.0, 0.866635, 0.685076, 0.846624, 0.87806, 0.701876,
+                                        0.778932, 0.484911],
+                                       [0, 0, 1, 0, 0, 0, 0, 2]],
+              'ship_1x4:23,24,25,26': [[24, 32, 111, 198], [1.0, 0.579412, 0.8698, 0.829969],
+                                       [0, 0, 0, 0]],
+              'ship_1x4:24,25,26,27': [[162], [1.0], [0]],
+              'ship_1x4:24,34,44,54': [[174], [1.0], [0]],
+              'ship_1x4:25,35,45,55': [[141, 157], [1.0, 0.58843], [0, 0]],
+              'ship_1x4:26,36,46,56': [[83, 171, 172, 199], [1.0, 0.959506, 0.687374, 0.505624],
+                                       [0, 0, 0, 2]],
+              'ship_1x4:27,37,47,57': [[131], [1.0], [0]],
+              'ship_1x4:30,31,32,33': [[117], [1.0], [0]],
+              'ship_1x4:30,40,50,60': [[126, 167], [0.634853, 1.0], [1, 1]],
+              'ship_1x4:31,32,33,34': [[145], [1.0], [0]],
+              'ship_1x4:31,41,51,61': [[1, 164], [1.0, 0.393652], [0, 0]],
+              'ship_1x4:32,42,52,62': [[48, 60, 110, 133], [1.0, 0.932164, 0.805671, 0.898791],
+                                       [0, 0, 0, 0]],
+              'ship_1x4:33,34,35,36': [[46, 107], [1.0, 0.852643], [0, 0]],
+              'ship_1x4:33,43,53,63': [[45], [1.0], [0]],
+              'ship_1x4:34,44,54,64': [[129, 148], [1.0, 0.784674], [0, 0]],
+              'ship_1x4:35,45,55,65': [[76], [1.0], [0]],
+              'ship_1x4:36,46,56,66': [[2, 12, 18, 59, 65, 68, 69, 77, 79, 81, 82, 96, 105, 114,
+                                        115, 130, 138],
+                                       [1.0, 0.98615, 0.601502, 0.485124, 0.627655, 0.413011,
+                                        0.696351, 0.995935, 0.684496, 0.960279, 0.78785, 0.724857,
+                                        0.604065, 0.404496, 0.33885, 0.555767, 0.663436],
+                                       [0, 0, 1, 2, 3, 0, 4, 0, 0, 0, 1, 1, 1, 2, 3, 4, 6]],
+              'ship_1x4:40,41,42,43': [[19, 80], [1.0, 0.482502], [0, 0]],
+              'ship_1x4:41,42,43,44': [[179], [1.0], [0]],
+              'ship_1x4:41,51,61,71': [[9, 73, 123, 175], [1.0, 0.519968, 0.501352, 0.623943],
+                                       [0, 0, 0, 0]],
+              'ship_1x4:42,52,62,72': [[10, 192], [1.0, 0.412081], [0, 0]],
+              'ship_1x4:43,44,45,46': [[109, 158, 178, 186], [1.0, 0.824497, 0.673492, 0.485098],
+                                       [0, 0, 0, 1]],
+              'ship_1x4:43,53,63,73': [[132, 184], [1.0, 0.733179], [0, 0]],
+              'ship_1x4:44,45,46,47': [[89], [1.0], [0]],
+              'ship_1x4:45,55,65,75': [[22, 43, 44, 177], [1.0, 0.780449, 0.936511, 0.258709],
+                                       [0, 0, 0, 0]],
+              'ship_1x4:46,56,66,76': [[3, 26, 182, 190], [1.0, 0.968057, 0.612138, 0.381076],
+                                       [0, 0, 0, 0]],
+              'ship_1x4:47,57,67,77': [[181], [1.0], [0]],
+              'ship_1x4:50,51,52,53': [[163, 180], [1.0, 0.906524], [0, 0]],
+              'ship_1x4:51,52,53,54': [[15, 106, 156, 170], [1.0, 0.595464, 0.51466, 0.756668],
+                                       [0, 0, 0, 0]],
+              'ship_1x4:53,54,55,56': [[85, 134, 151, 160], [0.934717, 0.910689, 0.954394, 1.0],
+                                       [3, 3, 3, 3]],
+              'ship_1x4:60,61,62,63': [[55, 98, 125, 136, 176],
+                                       [1.0, 0.871339, 0.921077, 0.847432, 0.751761],
+                                       [0, 0, 0, 1, 1]],
+              'ship_1x4:61,62,63,64': [[25, 95, 166], [1.0, 0.728231, 0.705826], [0, 0, 0]],
+              'ship_1x4:62,63,64,65': [[116, 142], [0.678487, 1.0], [1, 1]],
+              'ship_1x4:63,64,65,66': [[29, 37, 53, 90, 189],
+                                       [1.0, 0.988431, 0.561559, 0.856275, 0.349589],
+                                       [0, 0, 1, 1, 1]],
+              'ship_1x4:64,65,66,67': [[104, 144, 197], [0.599162, 1.0, 0.658051], [1, 1, 1]],
+              'ship_1x4:70,71,72,73': [[61], [1.0], [0]],
+              'ship_1x4:71,72,73,74': [[39], [1.0], [0]],
+              'ship_1x4:72,73,74,75': [[71], [1.0], [0]],
+              'ship_1x4:74,75,76,77': [[194], [1.0], [0]]}}
+# <<< END GENERATED: fleet table
+
 if __name__ == '__main__':
     run_bot(MyBattleshipBot)
\ No newline at end of file
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Code Clash Battleship Bot Challenge - CREATE UofT - Winter 2026
+
+Compact binary wire format - optional alternative to state.json for high-volume harnesses
+
+State layout (all single bytes unless noted):
+    magic      b"BSW" + WIRE_VERSION (4 bytes)
+    flags      which of the optional sections below are present
+    grids      player_grid, opponent_grid: 16 bytes each, 2 bits per cell (N/H/M/B)
+    abilities  player abilities in the low nibble, opponent in the high nibble
+    ships      count, then 3 bytes per ship: type/direction, start cell, hit mask
+    current    index of current_ship in SHIP_TYPES
+
+Move layout:
+    abilitySelect  MOVE_ABILITY_SELECT, first << 2 | second
+    placement      MOVE_PLACEMENT, type << 1 | vertical, cell (type NO_SHIP_NAME if "name" is missing)
+    combat         MOVE_COMBAT, cell, ability (0 = None), shape << 4 | count, cells...
+
+A cell byte is row * BOARD_SIZE + col. Ability "info" is not carried: decoded
+abilities always come back with {"None": {}}. Ship coordinates and hits come
+back sorted row-major, the order state.json uses.
+
+Run this file directly to benchmark it against the JSON path.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from battleship_api import ABILITY_CODES, BOARD_SIZE, SHIP_SIZES, SHIP_TYPES
+
+# run_bot in battleship_api.py switches to this format on the same three bytes;
+# the version byte is checked by decode_state
+MAGIC_PREFIX = b"BSW"
+WIRE_VERSION = 1
+MAGIC = MAGIC_PREFIX + bytes([WIRE_VERSION])
+
+FLAG_PLAYER_SHIPS = 0x01
+FLAG_PLAYER_GRID = 0x02
+FLAG_OPPONENT_GRID = 0x04
+FLAG_ABILITIES = 0x08
+FLAG_CURRENT_SHIP = 0x10
+
+MOVE_ABILITY_SELECT = 1
+MOVE_PLACEMENT = 2
+MOVE_COMBAT = 3
+
+# Placement type for a move that leaves out "name"
+NO_SHIP_NAME = len(SHIP_TYPES)
+
+# Shape of a combat ability payload, so it decodes back to the same JSON form
+PAYLOAD_EMPTY = 0       # {} / {"None": {}}
+PAYLOAD_CELL = 1        # [r, c]
+PAYLOAD_CELLS = 2       # [[r, c], ...]
+PAYLOAD_EMPTY_LIST = 3  # []
+
+CELL_STATES = "NHMB"
+_CELL_CODES = {state: code for code, state in enumerate(CELL_STATES)}
+_GRID_BYTES = BOARD_SIZE * BOARD_SIZE // 4
+_ROW_BYTES = BOARD_SIZE // 4
+
+# !---------------- CELLS & GRIDS ----------------
+
+def _encode_cell(cell) -> int:
+    try:
+        row, col = cell
+    except (TypeError, ValueError):
+        raise ValueError(f"Cell must be [row, col]: {cell}") from None
+    if not (isinstance(row, int) and isinstance(col, int)):
+        raise ValueError(f"Cell must be [row, col]: {cell}")
+    if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+        raise ValueError(f"Cell out of bounds: {cell}")
+    return row * BOARD_SIZE + col
+
+def _decode_cell(code: int) -> List[int]:
+    return [code // BOARD_SIZE, code % BOARD_SIZE]
+
+def _encode_grid(grid: List[List[str]], out: bytearray) -> None:
+    packed = 0
+    shift = 0
+    for row in grid:
+        for status in row:
+            packed |= _CELL_CODES[status] << shift
+            shift += 2
+            if shift == 8:
+                out.append(packed)
+                packed = 0
+                shift = 0
+
+def _decode_grid(data: bytes, offset: int) -> List[List[str]]:
+    grid = []
+    for row_offset in range(offset, offset + _GRID_BYTES, _ROW_BYTES):
+        grid.append([CELL_STATES[(byte >> shift) & 3]
+                     for byte in data[row_offset:row_offset + _ROW_BYTES] for shift in (0, 2, 4, 6)])
+    return grid
+
+# !---------------- ABILITIES & SHIPS ----------------
+
+def _encode_abilities(abilities: List[Dict[str, Any]]) -> int:
+    bits = 0
+    for ability_obj in abilities:
+        code = ability_obj.get("ability") if isinstance(ability_obj, dict) else None
+        if code in ABILITY_CODES:
+            bits |= 1 << ABILITY_CODES.index(code)
+    return bits
+
+def _decode_abilities(bits: int) -> List[Dict[str, Any]]:
+    return [{"ability": code, "info": {"None": {}}} for i, code in enumerate(ABILITY_CODES) if bits & (1 << i)]
+
+def _ship_placement(ship: Dict[str, Any]) -> Tuple[int, int, str]:
+    """Recover (start_row, start_col, direction) from a ship's coordinates."""
+    name = ship["name"]
+    coordinates = ship["coordinates"]
+    rows = [r for r, _ in coordinates]
+    cols = [c for _, c in coordinates]
+    start_row, start_col = min(rows), min(cols)
+    # 'H' lays the ship out SHIP_SIZES rows tall, 'V' swaps the two spans
+    direction = 'H' if max(rows) - start_row + 1 == SHIP_SIZES[name][0] else 'V'
+    return start_row, start_col, direction
+
+def _ship_cells(name: str, start_row: int, start_col: int, direction: str) -> List[Tuple[int, int]]:
+    """A ship's cells in row-major order, laid out the same way as the API's _get_ship_cells."""
+    rows, cols = SHIP_SIZES[name]
+    if direction == 'V':
+        rows, cols = cols, rows
+    return [(start_row + r, start_col + c) for r in range(rows) for c in range(cols)]
+
+def _encode_ship(ship: Dict[str, Any], out: bytearray) -> None:
+    name = ship.get("name")
+    if name not in SHIP_TYPES:
+        raise ValueError(f"Unknown ship: {name}")
+    start_row, start_col, direction = _ship_placement(ship)
+    cells = _ship_cells(name, start_row, start_col, direction)
+    if cells != sorted(tuple(cell) for cell in ship["coordinates"]):
+        raise ValueError(f"Ship {name} does not occupy a rectangle: {ship['coordinates']}")
+
+    hit_mask = 0
+    for hit in ship.get("hits", []):
+        hit_mask |= 1 << cells.index(tuple(hit))
+    out.append(SHIP_TYPES.index(name) << 1 | (direction == 'V'))
+    out.append(_encode_cell([start_row, start_col]))
+    out.append(hit_mask)
+
+def _decode_ship(data: bytes, offset: int) -> Dict[str, Any]:
+    name = SHIP_TYPES[data[offset] >> 1]
+    start_row, start_col = _decode_cell(data[offset + 1])
+    cells = _ship_cells(name, start_row, start_col, 'V' if data[offset] & 1 else 'H')
+    hit_mask = data[offset + 2]
+    return {
+        "name": name,
+        "coordinates": [list(cell) for cell in cells],
+        "hits": [list(cell) for i, cell in enumerate(cells) if hit_mask & (1 << i)],
+    }
+
+# !---------------- GAME STATE ----------------
+
+def encode_state(game_state: Dict[str, Any]) -> bytes:
+    """Pack a state.json document into the binary wire format."""
+    flags = 0
+    if "player_ships" in game_state:
+        flags |= FLAG_PLAYER_SHIPS
+    if "player_grid" in game_state:
+        flags |= FLAG_PLAYER_GRID
+    if "opponent_grid" in game_state:
+        flags |= FLAG_OPPONENT_GRID
+    if "player_abilities" in game_state or "opponent_abilities" in game_state:
+        flags |= FLAG_ABILITIES
+    if game_state.get("current_ship") in SHIP_TYPES:
+        flags |= FLAG_CURRENT_SHIP
+
+    out = bytearray(MAGIC)
+    out.append(flags)
+    if flags & FLAG_PLAYER_GRID:
+        _encode_grid(game_state["player_grid"], out)
+    if flags & FLAG_OPPONENT_GRID:
+        _encode_grid(game_state["opponent_grid"], out)
+    if flags & FLAG_ABILITIES:
+        out.append(_encode_abilities(game_state.get("player_abilities", []))
+                   | _encode_abilities(game_state.get("opponent_abilities", [])) << 4)
+    if flags & FLAG_PLAYER_SHIPS:
+        ships = [ship for ship in game_state["player_ships"] if isinstance(ship, dict)]
+        out.append(len(ships))
+        for ship in ships:
+            _encode_ship(ship, out)
+    if flags & FLAG_CURRENT_SHIP:
+        out.append(SHIP_TYPES.index(game_state["current_ship"]))
+    return bytes(out)
+
+def decode_state(data: bytes) -> Dict[str, Any]:
+    """Unpack the binary wire format into the dict json.load would give (ship cells in API order)."""
+    if data[:len(MAGIC_PREFIX)] != MAGIC_PREFIX:
+        raise ValueError("Not a binary game state")
+    if data[len(MAGIC_PREFIX)] != WIRE_VERSION:
+        raise ValueError(f"Unsupported wire format version {data[len(MAGIC_PREFIX)]} (expected {WIRE_VERSION})")
+    flags = data[len(MAGIC)]
+    offset = len(MAGIC) + 1
+    game_state: Dict[str, Any] = {}
+
+    if flags & FLAG_PLAYER_GRID:
+        game_state["player_grid"] = _decode_grid(data, offset)
+        offset += _GRID_BYTES
+    if flags & FLAG_OPPONENT_GRID:
+        game_state["opponent_grid"] = _decode_grid(data, offset)
+        offset += _GRID_BYTES
+    if flags & FLAG_ABILITIES:
+        game_state["player_abilities"] = _decode_abilities(data[offset] & 0x0F)
+        game_state["opponent_abilities"] = _decode_abilities(data[offset] >> 4)
+        offset += 1
+    if flags & FLAG_PLAYER_SHIPS:
+        count = data[offset]
+        offset += 1
+        game_state["player_ships"] = [_decode_ship(data, offset + 3 * i) for i in range(count)]
+        offset += 3 * count
+    if flags & FLAG_CURRENT_SHIP:
+        game_state["current_ship"] = SHIP_TYPES[data[offset]]
+    return game_state
+
+# !---------------- MOVES ----------------
+
+def encode_move(move: Dict[str, Any]) -> bytes:
+    """Pack a bot move (the dict run_bot would json.dumps) into bytes."""
+    if "abilitySelect" in move:
+        first, second = (ABILITY_CODES.index(code) for code in move["abilitySelect"])
+        return bytes([MOVE_ABILITY_SELECT, first << 2 | second])
+
+    if "placement" in move:
+        placement = move["placement"]
+        if "name" not in placement:
+            ship_type = NO_SHIP_NAME
+        elif placement["name"] in SHIP_TYPES:
+            ship_type = SHIP_TYPES.index(placement["name"])
+        else:
+            raise ValueError(f"Unknown ship: {placement['name']}")
+        return bytes([
+            MOVE_PLACEMENT,
+            ship_type << 1 | (placement["direction"] == 'V'),
+            _encode_cell(placement["cell"]),
+        ])
+
+    if "combat" in move:
+        combat = move["combat"]
+        ability_code, payload = next(iter(combat.get("ability", {"None": {}}).items()))
+        if ability_code in ABILITY_CODES:
+            ability = ABILITY_CODES.index(ability_code) + 1
+        elif ability_code == "None":
+            ability = 0
+        else:
+            raise ValueError(f"Unknown ability: {ability_code}")
+
+        if isinstance(payload, list):
+            if not payload:
+                shape, cells = PAYLOAD_EMPTY_LIST, []
+            elif isinstance(payload[0], list):
+                shape, cells = PAYLOAD_CELLS, payload
+            else:
+                shape, cells = PAYLOAD_CELL, [payload]
+        elif payload == {}:
+            shape, cells = PAYLOAD_EMPTY, []
+        else:
+            raise ValueError(f"Unsupported {ability_code} payload: {payload}")
+        out = bytearray([MOVE_COMBAT, _encode_cell(combat["cell"]), ability, shape << 4 | len(cells)])
+        out.extend(_encode_cell(cell) for cell in cells)
+        return bytes(out)
+
+    raise ValueError(f"Unknown move: {move}")
+
+def decode_move(data: bytes) -> Dict[str, Any]:
+    kind = data[0]
+    if kind == MOVE_ABILITY_SELECT:
+        return {"abilitySelect": [ABILITY_CODES[data[1] >> 2], ABILITY_CODES[data[1] & 3]]}
+
+    if kind == MOVE_PLACEMENT:
+        placement: Dict[str, Any] = {}
+        if data[1] >> 1 != NO_SHIP_NAME:
+            placement["name"] = SHIP_TYPES[data[1] >> 1]
+        placement["cell"] = _decode_cell(data[2])
+        placement["direction"] = 'V' if data[1] & 1 else 'H'
+        return {"placement": placement}
+
+    if kind == MOVE_COMBAT:
+        shape, count = data[3] >> 4, data[3] & 0x0F
+        cells = [_decode_cell(code) for code in data[4:4 + count]]
+        if data[2] == 0:
+            ability: Dict[str, Any] = {"None": {}}
+        elif shape == PAYLOAD_CELL:
+            ability = {ABILITY_CODES[data[2] - 1]: cells[0]}
+        elif shape == PAYLOAD_CELLS:
+            ability = {ABILITY_CODES[data[2] - 1]: cells}
+        elif shape == PAYLOAD_EMPTY_LIST:
+            ability = {ABILITY_CODES[data[2] - 1]: []}
+        else:
+            ability = {ABILITY_CODES[data[2] - 1]: {}}
+        return {
+            "combat": {
+                "cell": _decode_cell(data[1]),
+                "ability": ability
+            }
+        }
+
+    raise ValueError(f"Unknown move kind: {kind}")
+
+# !---------------- BENCHMARK ----------------
+
+if __name__ == '__main__':
+    import json
+    import os
+    import statistics
+    import subprocess
+    import sys
+    import tempfile
+    import timeit
+
+    from battleship_bot import MyBattleshipBot
+    from bot_validator import create_test_state
+
+    # Round trips must be exact, for every phase and every move form the bot produces
+    for phase in ("ability_selection", "placement", "combat"):
+        test_state = create_test_state(phase)
+        if phase == "placement":
+            test_state["current_ship"] = "ship_1x3"
+        assert decode_state(encode_state(test_state)) == test_state, phase
+    test_moves = [
+        {"abilitySelect": ["SP", "RF"]},
+        {"placement": {"name": "ship_2x3", "cell": [2, 3], "direction": "V"}},
+        {"placement": {"cell": [0, 0], "direction": "H"}},  # the bot's fallback placement
+        {"combat": {"cell": [1, 2], "ability": {"None": {}}}},
+        {"combat": {"cell": [0, 0], "ability": {"SP": [3, 3]}}},
+        {"combat": {"cell": [3, 4], "ability": {"RF": [[3, 4], [3, 5]]}}},
+    ]
+    # The bot's own combat moves with RF available, with and without a hit to chase
+    bot = MyBattleshipBot()
+    for with_hit in (True, False):
+        combat_state = create_test_state("combat")
+        combat_state["player_abilities"] = [{"ability": "RF", "info": {"None": {}}}]
+        if not with_hit:
+            combat_state["opponent_grid"] = [['M' if status == 'H' else status for status in row]
+                                             for row in combat_state["opponent_grid"]]
+        test_moves.append(bot.combat_strategy(combat_state))
+    for test_move in test_moves:
+        assert decode_move(encode_move(test_move)) == test_move, test_move
+
+    state = create_test_state("combat")
+    move = {"combat": {"cell": [3, 4], "ability": {"RF": [[3, 4], [3, 5]]}}}
+
+    json_state = json.dumps(state, indent=4).encode('utf-8')  # what the engine writes today
+    binary_state = encode_state(state)
+    json_move = json.dumps(move)
+    binary_move = encode_move(move)
+
+    cases = [
+        ("state encode", lambda: json.dumps(state, indent=4), lambda: encode_state(state)),
+        ("state decode", lambda: json.loads(json_state), lambda: decode_state(binary_state)),
+        ("move encode", lambda: json.dumps(move), lambda: encode_move(move)),
+        ("move decode", lambda: json.loads(json_move), lambda: decode_move(binary_move)),
+    ]
+    number = 20000
+    print(f"{'':14} {'json us':>10} {'binary us':>10} {'speedup':>8}")
+    for name, json_fn, binary_fn in cases:
+        json_time = min(timeit.repeat(json_fn, number=number, repeat=3)) / number * 1e6
+        binary_time = min(timeit.repeat(binary_fn, number=number, repeat=3)) / number * 1e6
+        print(f"{name:14} {json_time:10.2f} {binary_time:10.2f} {json_time / binary_time:7.1f}x")
+
+    # Each move runs in a fresh process, so per-process costs (imports included) are what count
+    here = os.path.dirname(os.path.abspath(__file__))
+    bot_path = os.path.join(here, "battleship_bot.py")
+    per_process = [
+        ("import+decode",
+         "import battleship_api, json, sys; json.loads(open(sys.argv[1], 'rb').read())",
+         "import battleship_api, battleship_wire, sys; battleship_wire.decode_state(open(sys.argv[1], 'rb').read())"),
+        ("bot move", None, None),
+    ]
+    runs = 25
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "state.json")
+        binary_path = os.path.join(tmp, "state.bsw")
+        with open(json_path, 'wb') as f:
+            f.write(json_state)
+        with open(binary_path, 'wb') as f:
+            f.write(binary_state)
+
+        def run_ms(code, path):
+            command = [sys.executable, bot_path, path] if code is None else [sys.executable, "-c", code, path]
+            start = timeit.default_timer()
+            subprocess.run(command, cwd=here, check=True, stdout=subprocess.DEVNULL)
+            return (timeit.default_timer() - start) * 1e3
+
+        print(f"{'per process':14} {'json ms':>10} {'binary ms':>10} {'speedup':>8}")
+        for name, json_code, binary_code in per_process:
+            json_times, binary_times = [], []
+            for _ in range(runs):  # interleaved, so background load hits both sides alike
+                json_times.append(run_ms(json_code, json_path))
+                binary_times.append(run_ms(binary_code, binary_path))
+            json_time, binary_time = statistics.median(json_times), statistics.median(binary_times)
+            print(f"{name:14} {json_time:10.1f} {binary_time:10.1f} {json_time / binary_time:7.2f}x")
+
+    print(f"state size: json {len(json_state)} bytes, binary {len(binary_state)} bytes")
+    print(f"move size:  json {len(json_move)} bytes, binary {len(binary_move)} bytes")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Code Clash Battleship Bot Challenge - CREATE UofT - Winter 2026
+
+Fleet Layout Evaluator - Measure defensive layouts offline for battleship_bot.py
+
+Generates candidate fleet layouts (from the bot's own placement rules and from
+uniform random placement), scores each by the expected number of shots a set of
+reference hunters needs to sink it, and exports the best-surviving layouts as a
+weighted table that place_ship_strategy samples from in constant time.
+
+Every candidate is screened with a few games, then the shortlist is re-scored
+with many more games on fresh seeds to pick the layouts kept. Picking the best
+of those scores still favours lucky draws, so the kept layouts are scored once
+more on held-out seeds, and those held-out scores are what gets exported and
+weighted. Every layout is played with
+the same seeds (common random numbers), so differences between layouts are not
+drowned out by game-to-game noise. The table is written into the generated
+FLEET_TABLE block of battleship_bot.py, since the bot is submitted as a single file.
+
+Usage: python3 fleet_layout_evaluator.py [--candidates N] [--trials N] [--top N]
+"""
+
+import argparse
+import math
+import pprint
+import random
+import sys
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from battleship_api import BOARD_SIZE, SHIP_TYPES
+from battleship_bot import MyBattleshipBot, FleetTable
+from opening_book_builder import BOT_PATH, rewrite_generated_block
+
+NEIGHBOUR_OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+# How much more a placement counts in the density hunter for each hit it explains
+DENSITY_HIT_WEIGHT = 20
+# Added to the trial number so the final and held-out re-scores never reuse an earlier seed
+FINAL_SEED_BASE = 1_000_000
+HOLDOUT_SEED_BASE = 2_000_000
+
+# One bot per worker process, created by _init_worker
+_worker_bot: Optional[MyBattleshipBot] = None
+# Every ship placement on an empty board as (row, col) cells, for the density hunter
+_all_placements: List[List[Tuple[int, int]]] = []
+
+def _init_worker() -> None:
+    global _worker_bot, _all_placements
+    _worker_bot = MyBattleshipBot()
+    # Hunters must not depend on which layouts are being scored
+    _worker_bot._fleet_table = FleetTable()
+    _all_placements = []
+    for ship_name in SHIP_TYPES:
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                for orientation in ('H', 'V'):
+                    cells = _worker_bot._get_ship_cells(ship_name, r, c, orientation)
+                    if cells and cells not in _all_placements:
+                        _all_placements.append(cells)
+
+# !---------------- CANDIDATE LAYOUTS ----------------
+
+def _layout_from_bot(bot: MyBattleshipBot) -> Optional[List[list]]:
+    """Place a full fleet exactly as place_ship_strategy would without a table."""
+    game_state: Dict[str, list] = {"player_ships": []}
+    layout = []
+    for ship_name in SHIP_TYPES:
+        placement = bot.place_ship_strategy(ship_name, game_state)["placement"]
+        if placement.get("name") != ship_name:
+            return None  # hit the fallback placement
+        start_row, start_col = placement["cell"]
+        cells = bot._get_ship_cells(ship_name, start_row, start_col, placement["direction"])
+        if not cells or not bot._is_valid_placement(cells, bot._get_placed_coordinates(game_state)):
+            return None
+        game_state["player_ships"].append({"name": ship_name, "coordinates": [list(cell) for cell in cells], "hits": []})
+        layout.append([ship_name, start_row, start_col, placement["direction"]])
+    return layout
+
+def _layout_uniform(bot: MyBattleshipBot) -> Optional[List[list]]:
+    """Uniform random placement that still obeys the bot's border rule."""
+    placed_ships: List[dict] = []
+    placed_coords: Set[Tuple[int, int]] = set()
+    layout = []
+    for ship_name in SHIP_TYPES:
+        for _ in range(200):
+            start_row, start_col = random.randrange(BOARD_SIZE), random.randrange(BOARD_SIZE)
+            orientation = random.choice(['H', 'V'])
+            cells = bot._get_ship_cells(ship_name, start_row, start_col, orientation)
+            if cells and bot._is_valid_placement(cells, placed_coords) and bot._respects_border_rule(set(cells), placed_ships):
+                placed_ships.append({"name": ship_name, "coordinates": [list(cell) for cell in cells]})
+                placed_coords.update(cells)
+                layout.append([ship_name, start_row, start_col, orientation])
+                break
+        else:
+            return None
+    return layout
+
+def generate_candidates(count: int) -> List[List[list]]:
+    """Half from the current hand-tuned placement, half uniform, without duplicates."""
+    bot = MyBattleshipBot()
+    bot._fleet_table = FleetTable()
+    seen = set()
+    candidates = []
+    generators = [_layout_from_bot, _layout_uniform]
+    attempts = 0
+    while len(candidates) < count and attempts < count * 20:
+        layout = generators[attempts % 2](bot)
+        attempts += 1
+        if layout is None:
+            continue
+        key = tuple(tuple(ship) for ship in layout)
+        if key not in seen:
+            seen.add(key)
+            candidates.append(layout)
+    return candidates
+
+# !---------------- REFERENCE HUNTERS ----------------
+# Each hunter picks the next cell given the grid so far; all of them stop once the fleet is sunk.
+# A uniform random shooter is deliberately absent: its shot count does not depend on the layout.
+
+def _hunt_parity(bot: MyBattleshipBot, opponent_grid: List[List[str]]) -> List[int]:
+    """Chase any hit's open neighbours, otherwise shoot a checkerboard cell."""
+    targets = []
+    for r in range(BOARD_SIZE):
+        for c in range(BOARD_SIZE):
+            if opponent_grid[r][c] == 'H':
+                for dr, dc in NEIGHBOUR_OFFSETS:
+                    nr, nc = r + dr, c + dc
+                    if bot._is_valid_cell(nr, nc) and opponent_grid[nr][nc] == 'N':
+                        targets.append([nr, nc])
+    if targets:
+        return random.choice(targets)
+    available = bot._get_available_cells(opponent_grid)
+    parity = [cell for cell in available if (cell[0] + cell[1]) % 2 == 0]
+    return random.choice(parity or available)
+
+def _hunt_density(bot: MyBattleshipBot, opponent_grid: List[List[str]]) -> List[int]:
+    """Shoot the open cell covered by the most ship placements that avoid every miss."""
+    density = [[0] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    for cells in _all_placements:
+        hits = 0
+        open_cells = []
+        for r, c in cells:
+            status = opponent_grid[r][c]
+            if status == 'M':
+                break
+            if status == 'H':
+                hits += 1
+            elif status == 'N':
+                open_cells.append((r, c))
+        else:
+            weight = 1 + DENSITY_HIT_WEIGHT * hits
+            for r, c in open_cells:
+                density[r][c] += weight
+
+    best_cells, best_density = [], -1
+    for r, c in bot._get_available_cells(opponent_grid):
+        if density[r][c] > best_density:
+            best_cells, best_density = [[r, c]], density[r][c]
+        elif density[r][c] == best_density:
+            best_cells.append([r, c])
+    return random.choice(best_cells)
+
+def _hunt_bot(bot: MyBattleshipBot, opponent_grid: List[List[str]]) -> List[int]:
+    """The bot's own combat strategy, single shots only."""
+    return bot.combat_strategy({"opponent_grid": opponent_grid, "player_abilities": []})["combat"]["cell"]
+
+HUNTERS: Dict[str, Callable[[MyBattleshipBot, List[List[str]]], List[int]]] = {
+    "parity": _hunt_parity,
+    "density": _hunt_density,
+    "bot": _hunt_bot,
+}
+
+def shots_to_sink(bot: MyBattleshipBot, fleet: Set[Tuple[int, int]], hunter) -> int:
+    opponent_grid = [['N'] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    remaining = set(fleet)
+    shots = 0
+    while remaining and shots < BOARD_SIZE * BOARD_SIZE:
+        r, c = hunter(bot, opponent_grid)
+        if opponent_grid[r][c] != 'N':
+            # a hunter stuck on a used cell just burns a shot on a random open one
+            r, c = random.choice(bot._get_available_cells(opponent_grid))
+        opponent_grid[r][c] = 'H' if (r, c) in fleet else 'M'
+        remaining.discard((r, c))
+        shots += 1
+    return shots
+
+def score_layout(job: Tuple[List[list], int, int]) -> float:
+    """Expected shots to sink the layout, averaged over every hunter and trial."""
+    layout, trials, seed_base = job
+    fleet = set()
+    for ship_name, start_row, start_col, orientation in layout:
+        fleet.update(_worker_bot._get_ship_cells(ship_name, start_row, start_col, orientation))
+    total = 0
+    for hunter in HUNTERS.values():
+        for trial in range(trials):
+            # Same seed per trial for every layout, so layouts face the same hunter draws
+            random.seed(seed_base + trial)
+            total += shots_to_sink(_worker_bot, fleet, hunter)
+    return total / (trials * len(HUNTERS))
+
+def evaluate(pool: Pool, layouts: List[List[list]], trials: int, seed_base: int) -> List[float]:
+    return pool.map(score_layout, [(layout, trials, seed_base) for layout in layouts], chunksize=16)
+
+# !---------------- EXPORT ----------------
+
+def build_table(layouts: List[List[list]], scores: List[float], temperature: float) -> FleetTable:
+    """
+    Weight layouts by softmax of their score and precompute one alias table per
+    placement prefix, so each placement call samples among the layouts that
+    match the ships already on the board.
+    """
+    bot = MyBattleshipBot()
+    best = max(scores)
+    weights = [math.exp((score - best) / temperature) for score in scores]
+
+    groups: Dict[str, List[int]] = {}
+    for index, layout in enumerate(layouts):
+        placed_ships = []
+        for ship_name, start_row, start_col, orientation in layout:
+            groups.setdefault(FleetTable.prefix_key(placed_ships), []).append(index)
+            cells = bot._get_ship_cells(ship_name, start_row, start_col, orientation)
+            placed_ships.append({"name": ship_name, "coordinates": [list(cell) for cell in cells]})
+
+    prefixes = {}
+    for prefix, indices in groups.items():
+        alias_prob, alias_index = FleetTable.build_alias([weights[i] for i in indices])
+        prefixes[prefix] = [indices, [round(p, 6) for p in alias_prob], alias_index]
+    return FleetTable(layouts, prefixes)
+
+def table_source(table: FleetTable, scores: List[float]) -> str:
+    data: Dict[str, Any] = {
+        "layouts": table.layouts,
+        "expected_shots": [round(score, 2) for score in scores],
+        "prefixes": table.prefixes,
+    }
+    return "FLEET_TABLE: Dict[str, Any] = " + pprint.pformat(data, width=100, compact=True) + "\n"
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Score fleet layouts and export the placement table embedded in battleship_bot.py")
+    parser.add_argument("--candidates", type=int, default=4000, help="candidate layouts to screen")
+    parser.add_argument("--trials", type=int, default=8, help="screening games per hunter per layout")
+    parser.add_argument("--shortlist", type=int, default=600, help="best screened layouts to re-score")
+    parser.add_argument("--final-trials", type=int, default=64, help="re-scoring games per hunter per layout")
+    parser.add_argument("--top", type=int, default=200, help="layouts kept in the table")
+    parser.add_argument("--holdout-trials", type=int, default=64, help="held-out games per hunter for the exported scores")
+    parser.add_argument("--temperature", type=float, default=1.0, help="softmax temperature in shots; lower favours the best layouts")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--output", default=BOT_PATH, help="bot source file whose generated block is rewritten")
+    args = parser.parse_args()
+
+    candidates = generate_candidates(args.candidates)
+    with Pool(args.processes, initializer=_init_worker) as pool:
+        print(f"Screening {len(candidates)} layouts against {', '.join(HUNTERS)} hunters...", file=sys.stderr)
+        screen_scores = evaluate(pool, candidates, args.trials, 0)
+        ranked = sorted(range(len(candidates)), key=lambda i: screen_scores[i], reverse=True)
+        shortlist = [candidates[i] for i in ranked[:args.shortlist]]
+
+        print(f"Re-scoring the best {len(shortlist)} with {args.final_trials} games per hunter...", file=sys.stderr)
+        final_scores = evaluate(pool, shortlist, args.final_trials, FINAL_SEED_BASE)
+        ranked = sorted(range(len(shortlist)), key=lambda i: final_scores[i], reverse=True)[:args.top]
+        layouts = [shortlist[i] for i in ranked]
+
+        print(f"Scoring the kept {len(layouts)} on held-out seeds with {args.holdout_trials} games per hunter...", file=sys.stderr)
+        scores = evaluate(pool, layouts, args.holdout_trials, HOLDOUT_SEED_BASE)
+
+    table = build_table(layouts, scores, args.temperature)
+    rewrite_generated_block("fleet table", table_source(table, scores), args.output)
+
+    selected = [final_scores[i] for i in ranked]
+    print(f"Mean screening score over all candidates: {sum(screen_scores) / len(screen_scores):.2f}")
+    print(f"Mean score of kept layouts: {sum(selected) / len(selected):.2f} when selected, "
+          f"{sum(scores) / len(scores):.2f} held out")
+    print(f"Kept {len(table)} layouts, held-out expected shots {min(scores):.2f}-{max(scores):.2f}; wrote {args.output}")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Code Clash Battleship Bot Challenge - CREATE UofT - Winter 2026
+
+Opening Book Builder - Precompute hunt-mode shots offline for battleship_bot.py
+
+Plays the bot against random fleets and, whenever it reaches a position with no
+hit cluster to chase that the book does not know yet, runs a long Monte Carlo
+search for the best shot and stores it. The bot then answers those positions
+(and all their rotations/reflections) with a single lookup.
+
+The search samples fleets consistent with the position by placing ships over the
+hits first, so positions with many hits are sampled as well as open ones. A move
+is only stored if its search found at least --min-fleets fleets.
+
+Work is done in rounds: every game is replayed with the current book up to its
+first unknown position, then all of those positions are searched over a process
+pool. The result is written into the generated OPENING_BOOK_ENTRIES block of
+battleship_bot.py, since the bot is submitted as a single file.
+
+Usage: python3 opening_book_builder.py [--games N] [--samples N] [--depth N] [--min-fleets N]
+"""
+
+import argparse
+import os
+import pprint
+import random
+import sys
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from battleship_api import BOARD_SIZE, SHIP_TYPES
+import battleship_bot
+from battleship_bot import MyBattleshipBot, OpeningBook, OPENING_BOOK_MAX_SIZE
+
+BOT_PATH = os.path.abspath(battleship_bot.__file__)
+
+# One bot per worker process, created by _init_worker
+_worker_bot: Optional[MyBattleshipBot] = None
+
+def _init_worker() -> None:
+    global _worker_bot
+    _worker_bot = MyBattleshipBot()
+
+def rewrite_generated_block(name: str, assignment: str, path: str = BOT_PATH) -> None:
+    """Replace the body of a "# >>> BEGIN GENERATED: <name>" block in the bot source."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().split("\n")
+    begin = next(i for i, line in enumerate(lines) if line.startswith(f"# >>> BEGIN GENERATED: {name} "))
+    end = next(i for i, line in enumerate(lines) if line == f"# <<< END GENERATED: {name}")
+    lines[begin + 1:end] = assignment.rstrip("\n").split("\n")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines))
+
+def ship_placements(bot: MyBattleshipBot, blocked: Set[Tuple[int, int]] = frozenset()) -> Dict[str, List[List[Tuple[int, int]]]]:
+    """Every distinct placement of each ship that avoids the blocked cells."""
+    placements: Dict[str, List[List[Tuple[int, int]]]] = {}
+    for ship_name in SHIP_TYPES:
+        options: List[List[Tuple[int, int]]] = []
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                for orientation in ('H', 'V'):
+                    cells = bot._get_ship_cells(ship_name, r, c, orientation)
+                    if cells and blocked.isdisjoint(cells) and cells not in options:
+                        options.append(cells)
+        placements[ship_name] = options
+    return placements
+
+def random_fleet(placements: Dict[str, List[List[Tuple[int, int]]]]) -> Optional[Set[Tuple[int, int]]]:
+    """
+    Place every ship at random from its allowed placements (no overlaps), like an unknown
+    opponent might. Returns None if the placements leave no room after many restarts.
+    """
+    for _ in range(100):
+        occupied: Set[Tuple[int, int]] = set()
+        for ship_name in SHIP_TYPES:
+            options = placements[ship_name]
+            if not options:
+                return None
+            for _ in range(50):
+                cells = random.choice(options)
+                if occupied.isdisjoint(cells):
+                    occupied.update(cells)
+                    break
+            else:
+                break  # dead end, start the fleet over
+        else:
+            return occupied
+    return None
+
+def consistent_fleet(placements: Dict[str, List[List[Tuple[int, int]]]], hits: Set[Tuple[int, int]]) -> Optional[Set[Tuple[int, int]]]:
+    """
+    Build a random fleet that covers every hit, using placements that already avoid the misses.
+
+    Ships are placed over a still-unexplained hit first (any unplaced ship, any placement
+    through that cell), then the rest go anywhere. Constructing the fleet this way keeps
+    late positions with many hits sampleable, where rejecting random fleets almost never
+    succeeds. Returns None after many dead-end restarts.
+    """
+    through_cell: Dict[Tuple[int, int], List[Tuple[str, List[Tuple[int, int]]]]] = {hit: [] for hit in hits}
+    for ship_name, options in placements.items():
+        for cells in options:
+            for cell in cells:
+                if cell in through_cell:
+                    through_cell[cell].append((ship_name, cells))
+
+    for _ in range(100):
+        occupied: Set[Tuple[int, int]] = set()
+        unplaced = set(SHIP_TYPES)
+        while unplaced:
+            uncovered = hits - occupied
+            if uncovered:
+                hit = random.choice(sorted(uncovered))
+                choices = [(ship_name, cells) for ship_name, cells in through_cell[hit]
+                           if ship_name in unplaced and occupied.isdisjoint(cells)]
+                if not choices:
+                    break  # dead end, start the fleet over
+                ship_name, cells = random.choice(choices)
+            else:
+                ship_name = min(unplaced, key=SHIP_TYPES.index)
+                choices = [cells for cells in placements[ship_name] if occupied.isdisjoint(cells)]
+                if not choices:
+                    break
+                cells = random.choice(choices)
+            occupied.update(cells)
+            unplaced.discard(ship_name)
+        else:
+            if hits <= occupied:
+                return occupied
+    return None
+
+def search_best_shot(bot: MyBattleshipBot, opponent_grid: List[List[str]], samples: int) -> Tuple[Optional[List[int]], int]:
+    """
+    Return (the unshot cell most often occupied across fleets consistent with the
+    position, how many fleets that estimate rests on).
+    """
+    counts = [[0] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    misses = {(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE) if opponent_grid[r][c] == 'M'}
+    hits = {(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE) if opponent_grid[r][c] == 'H'}
+    placements = ship_placements(bot, misses)
+    found = 0
+    for _ in range(samples * 2):
+        fleet = consistent_fleet(placements, hits)
+        if fleet is None:
+            continue
+        for r, c in fleet:
+            counts[r][c] += 1
+        found += 1
+        if found >= samples:
+            break
+
+    best_cell, best_count = None, -1
+    for r, c in bot._get_available_cells(opponent_grid):
+        if counts[r][c] > best_count:
+            best_cell, best_count = [r, c], counts[r][c]
+    return best_cell, found
+
+def _search_job(job: Tuple[List[List[str]], int]) -> Tuple[Optional[List[int]], int]:
+    opponent_grid, samples = job
+    return search_best_shot(_worker_bot, opponent_grid, samples)
+
+def _first_unknown_position(bot: MyBattleshipBot, fleet: Set[Tuple[int, int]], depth: int) -> Optional[List[List[str]]]:
+    """Replay a game with the current book; return its first hunt position not in the book, if any."""
+    opponent_grid = [['N'] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    # Abilities are left out so the simulated bot only ever takes single shots
+    game_state = {"opponent_grid": opponent_grid, "player_abilities": []}
+    remaining = set(fleet)
+    hunt_moves = 0
+
+    while remaining:
+        if not bot._get_target_cell(opponent_grid):
+            if opponent_grid not in bot._opening_book:
+                return opponent_grid
+            hunt_moves += 1
+            if hunt_moves >= depth:
+                return None
+        r, c = bot.combat_strategy(game_state)["combat"]["cell"]
+        opponent_grid[r][c] = 'H' if (r, c) in fleet else 'M'
+        remaining.discard((r, c))
+    return None
+
+def build_book(book: OpeningBook, games: int, samples: int, depth: int, min_fleets: int,
+               processes: Optional[int] = None) -> int:
+    """
+    Fill the book from simulated games; returns how many positions were stored.
+    Positions whose search found fewer than min_fleets consistent fleets are not
+    stored, and the games that reach them stop there.
+    """
+    bot = MyBattleshipBot()
+    bot._opening_book = book
+    open_board = ship_placements(bot)
+    fleets = [random_fleet(open_board) for _ in range(games)]
+    stored = 0
+
+    with Pool(processes, initializer=_init_worker) as pool:
+        for round_number in range(depth):
+            pending: Dict[str, List[List[str]]] = {}
+            fleet_keys: List[Optional[str]] = []
+            for fleet in fleets:
+                opponent_grid = _first_unknown_position(bot, fleet, depth)
+                key = book.canonicalize(opponent_grid)[0] if opponent_grid is not None else None
+                if key is not None:
+                    pending.setdefault(key, opponent_grid)
+                fleet_keys.append(key)
+            if not pending:
+                break
+
+            positions = list(pending.values())
+            results = pool.map(_search_job, [(grid, samples) for grid in positions])
+            stored_fleets, skipped = [], set()
+            for opponent_grid, (best_cell, found) in zip(positions, results):
+                if best_cell is None or found < min_fleets:
+                    skipped.add(book.canonicalize(opponent_grid)[0])
+                    continue
+                book.store(opponent_grid, best_cell)
+                stored_fleets.append(found)
+                stored += 1
+            # Games stuck on a skipped position have nothing further to add
+            fleets = [fleet for fleet, key in zip(fleets, fleet_keys) if key not in skipped]
+
+            stored_fleets.sort()
+            fleet_summary = (f"fleets per stored move min {stored_fleets[0]}, median {stored_fleets[len(stored_fleets) // 2]}"
+                             if stored_fleets else "nothing stored")
+            print(f"round {round_number + 1}: searched {len(positions)} positions, skipped {len(skipped)} "
+                  f"below {min_fleets} fleets, {fleet_summary}; {len(book)} in book", file=sys.stderr)
+    return stored
+
+def book_source(book: OpeningBook) -> str:
+    return "OPENING_BOOK_ENTRIES: List[List[Any]] = " + pprint.pformat(book.entries(), width=100) + "\n"
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the opening book embedded in battleship_bot.py")
+    parser.add_argument("--games", type=int, default=200, help="simulated games to walk positions from")
+    parser.add_argument("--samples", type=int, default=5000, help="consistent fleets sampled per position")
+    parser.add_argument("--depth", type=int, default=8, help="hunt-mode moves per game to cover")
+    parser.add_argument("--min-fleets", type=int, default=500, help="consistent fleets a search needs before its move is stored")
+    parser.add_argument("--max-size", type=int, default=OPENING_BOOK_MAX_SIZE, help="book capacity before eviction")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--fresh", action="store_true", help="start from an empty book instead of the embedded one")
+    parser.add_argument("--output", default=BOT_PATH, help="bot source file whose generated block is rewritten")
+    args = parser.parse_args()
+
+    entries: List[Any] = [] if args.fresh else battleship_bot.OPENING_BOOK_ENTRIES
+    book = OpeningBook.from_entries(entries, args.max_size)
+    stored = build_book(book, args.games, args.samples, args.depth, args.min_fleets, args.processes)
+    rewrite_generated_block("opening book", book_source(book), args.output)
+    print(f"Stored {stored} new positions; wrote {len(book)} entries to {args.output}")